@@ -0,0 +1,322 @@
+import pytest
+
+from src.ui.browser.artifacts import close_artifact_writer
+from src.ui.browser.config import (
+    BROWSER_TYPES,
+    DEFAULT_CONFIG_PATH,
+    ENV_OVERRIDES,
+    get_overrides,
+    load_browser_config,
+)
+from src.ui.browser.har import (
+    HAR_MODES,
+    clear_recordings,
+    merge_shared_archive,
+)
+from src.ui.browser.tracing import clear_traces
+from src.ui.helper.durations import (
+    DEFAULT_DURATIONS_FILE,
+    DurationHistory,
+    DurationRecorder,
+    lpt_assign,
+    parse_shard,
+)
+from src.ui.helper.page_metrics import PageMetricsPlugin
+from src.ui.helper.stats import (
+    WORKER_OUTPUT_KEY,
+    format_stats,
+    launcher_stats_key,
+    workers_stats_key,
+)
+from src.ui.helper.stash_keys import browser_config_key, phase_report_key
+from src.ui.helper.step_timings import StepTimingsPlugin
+from src.ui.helper.steps import (
+    STEP_MODE_ENV,
+    STEP_MODES,
+    get_step_mode,
+    set_step_mode,
+)
+
+duration_history_key = pytest.StashKey[DurationHistory]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        '--headless',
+        action='store_const',
+        const=True,
+        default=None,
+        help='Запуск браузера без окна (BROWSER_HEADLESS)',
+    )
+    parser.addoption(
+        '--headed',
+        dest='headless',
+        action='store_const',
+        const=False,
+        help='Запуск браузера с окном',
+    )
+    parser.addoption(
+        '--browser-type',
+        choices=BROWSER_TYPES,
+        default=None,
+        help='Тип браузера (BROWSER_TYPE)',
+    )
+    parser.addoption(
+        '--slow-mo',
+        type=float,
+        default=None,
+        help='Замедление действий браузера, мс (BROWSER_SLOW_MO)',
+    )
+    parser.addoption(
+        '--viewport',
+        default=None,
+        help='Размер окна страницы, напр. 1280x720 (BROWSER_VIEWPORT)',
+    )
+    parser.addoption(
+        '--engines',
+        default=None,
+        help='Движки для матричного запуска через запятую, например '
+        'chromium,firefox,webkit (BROWSER_ENGINES)',
+    )
+    parser.addoption(
+        '--launch-profile',
+        default=None,
+        help='Профиль запуска браузера из launchProfiles '
+        '(BROWSER_LAUNCH_PROFILE)',
+    )
+    parser.addoption(
+        '--tracing',
+        action='store_const',
+        const='true',
+        default=None,
+        help='Трассировка playwright с сохранением только для упавших '
+        'и перезапущенных тестов (BROWSER_TRACING)',
+    )
+    parser.addoption(
+        '--har-mode',
+        choices=HAR_MODES,
+        default=None,
+        help='Режим HAR: record, replay или off (по умолчанию из конфига)',
+    )
+    parser.addoption(
+        '--local-stand',
+        action='store_true',
+        default=False,
+        help='Запуск тестов на локальном стенде вместо BASE_URL',
+    )
+    parser.addoption(
+        '--stand-latency-ms',
+        type=int,
+        default=0,
+        help='Искусственная задержка ответов API локального стенда, мс',
+    )
+    parser.addoption(
+        '--durations-file',
+        default=DEFAULT_DURATIONS_FILE,
+        help='Файл истории длительностей тестов',
+    )
+    parser.addoption(
+        '--allure-steps',
+        choices=STEP_MODES,
+        default=None,
+        help='Подробность шагов allure: full - все шаги, actions-only - '
+        'без шагов чтения, off - без шагов (ALLURE_STEPS)',
+    )
+    parser.addoption(
+        '--step-timings',
+        nargs='?',
+        const='step_timings.json',
+        default=None,
+        metavar='PATH',
+        help='Замер времени шагов allure.step: статистика по типам шагов '
+        'и самые долгие шаги в конце сессии, JSON-отчет в PATH '
+        '(по умолчанию step_timings.json)',
+    )
+    parser.addoption(
+        '--page-metrics',
+        nargs='?',
+        const='page_metrics.json',
+        default=None,
+        metavar='PATH',
+        help='Сбор метрик загрузки страниц (Navigation Timing, FCP, LCP, '
+        'CLS, объем данных) после переходов и смены разделов, отчет '
+        'в PATH и CSV рядом (по умолчанию page_metrics.json)',
+    )
+    parser.addoption(
+        '--perf',
+        action='store_true',
+        default=False,
+        help='Запуск тестов с маркером perf: проверки порогов скорости '
+        'загрузки страниц',
+    )
+    parser.addoption(
+        '--lpt',
+        action='store_true',
+        default=False,
+        help='Распределение тестов по воркерам xdist по истории '
+        'длительностей (сначала самые долгие)',
+    )
+    parser.addoption(
+        '--shard',
+        type=parse_shard,
+        default=None,
+        help='Запуск только части тестов i/N, сбалансированной '
+        'по истории длительностей (напр. 2/4)',
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers',
+        'blocking_profile(name): профиль блокировки ресурсов для теста',
+    )
+    config.addinivalue_line(
+        'markers',
+        'skip_engine(*engines, reason=None): пропуск теста на указанных '
+        'движках браузера',
+    )
+    config.addinivalue_line(
+        'markers',
+        'perf: проверка скорости загрузки, запускается только с --perf',
+    )
+
+    # Ошибки конфигурации браузера видны сразу, а не в первом тесте
+    overrides = get_overrides(
+        {name: config.getoption(name) for name in ENV_OVERRIDES}
+    )
+    try:
+        config.stash[browser_config_key] = load_browser_config(
+            DEFAULT_CONFIG_PATH, **overrides
+        )
+    except ValueError as e:
+        raise pytest.UsageError(
+            f'Ошибка конфигурации браузера: {e}'
+        ) from None
+
+    config.stash[duration_history_key] = DurationHistory(
+        config.rootpath / config.getoption('durations_file')
+    )
+    # Историю пишет только основной процесс, воркеры xdist лишь
+    # передают ему отчеты о тестах
+    if not hasattr(config, 'workerinput') and not config.option.collectonly:
+        config.pluginmanager.register(
+            DurationRecorder(config.stash[duration_history_key]),
+            'duration_recorder',
+        )
+        # Лимит размера трасс считается по папке, поэтому трассы
+        # прошлого запуска удаляются до старта воркеров
+        tracing_config = config.stash[browser_config_key].tracing
+        if tracing_config.enabled:
+            clear_traces(tracing_config.dir)
+        har_dir = _recording_har_dir(config)
+        if har_dir:
+            clear_recordings(har_dir)
+
+    try:
+        set_step_mode(config.getoption('allure_steps') or get_step_mode())
+    except ValueError as e:
+        raise pytest.UsageError(f'{e} ({STEP_MODE_ENV})') from None
+    step_timings_path = config.getoption('step_timings')
+    if step_timings_path and not config.option.collectonly:
+        config.pluginmanager.register(
+            StepTimingsPlugin(config.rootpath / step_timings_path),
+            'step_timings',
+        )
+    page_metrics_path = config.getoption('page_metrics')
+    if page_metrics_path and not config.option.collectonly:
+        config.pluginmanager.register(
+            PageMetricsPlugin(config.rootpath / page_metrics_path),
+            'page_metrics',
+        )
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    # Отчеты фаз доступны фикстурам при teardown, в том числе
+    # с outcome 'rerun' от pytest-rerunfailures
+    report = yield
+    item.stash.setdefault(phase_report_key, {})[report.when] = report
+    return report
+
+
+def pytest_collection_modifyitems(config, items):
+    # Пороги скорости зависят от сети и машины, поэтому в
+    # функциональном прогоне они не проверяются
+    if not config.getoption('perf'):
+        skip_perf = pytest.mark.skip(
+            reason='Проверка скорости загрузки запускается с --perf'
+        )
+        for item in items:
+            if item.get_closest_marker('perf'):
+                item.add_marker(skip_perf)
+
+    shard = config.getoption('shard')
+    if shard is None:
+        return
+
+    index, total = shard
+    history = config.stash[duration_history_key]
+    groups = lpt_assign(
+        [item.nodeid for item in items], history.estimate, total
+    )
+    selected_nodeids = set(groups[index - 1])
+
+    selected, deselected = [], []
+    for item in items:
+        if item.nodeid in selected_nodeids:
+            selected.append(item)
+        else:
+            deselected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+@pytest.hookimpl(tryfirst=True, optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    if not config.getoption('lpt'):
+        return None
+
+    from src.ui.helper.lpt_scheduling import LptScheduling
+
+    return LptScheduling(config, log, config.stash[duration_history_key])
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session):
+    """Ожидание записи всех скриншотов и трасс после закрытия
+    браузеров, до формирования отчета. Основной процесс объединяет
+    части общего HAR-архива, записанные воркерами и движками"""
+    close_artifact_writer()
+    har_dir = _recording_har_dir(session.config)
+    if har_dir and not hasattr(session.config, 'workerinput'):
+        merge_shared_archive(har_dir)
+
+
+def _recording_har_dir(config) -> str | None:
+    """Папка HAR-архивов, если включена запись HAR"""
+    har_config = config.stash[browser_config_key].har
+    mode = config.getoption('har_mode') or har_config.mode
+    return har_config.dir if mode == 'record' else None
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Сбор статистики launcher'а с завершившегося воркера xdist"""
+    worker_stats = getattr(node, 'workeroutput', {}).get(WORKER_OUTPUT_KEY)
+    if worker_stats:
+        workers_stats = node.config.stash.setdefault(workers_stats_key, {})
+        workers_stats[node.workerinput['workerid']] = worker_stats
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    workers_stats = config.stash.get(workers_stats_key, {})
+    if not workers_stats:
+        workers_stats = {'': config.stash.get(launcher_stats_key, {})}
+
+    for worker_id, launcher_stats in sorted(workers_stats.items()):
+        for title, stats in launcher_stats.items():
+            if worker_id:
+                title = f'{title} [{worker_id}]'
+            terminalreporter.write_sep('-', title)
+            terminalreporter.write_line(format_stats(stats))
@@ -0,0 +1,274 @@
+from contextlib import AsyncExitStack, asynccontextmanager
+
+from playwright.async_api import (
+    Page,
+    Cookie,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+from src.ui.browser.artifacts import get_artifact_writer
+from src.ui.browser.browser import url_contains
+from src.ui.helper.page_metrics import (
+    PAGE_METRICS_SCRIPT,
+    VITALS_WAIT_MSEC,
+    get_page_metrics,
+)
+from src.ui.helper.steps import step
+from src.ui.helper.timeouts import DEFAULT_SYNC_TIMEOUT_MSEC
+
+
+class Browser:
+    """Методы браузера для async API, взаимодействие с вкладками и ifram'ами"""
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def go_to_url(self, url: str):
+        """Переход по указанному URL
+
+        :param url: адрес страницы
+        """
+
+        with step('Переход на страницу: {}', url):
+            response = await self.page.goto(url)
+            if get_page_metrics() is not None:
+                await self._record_page_metrics(url)
+            return response
+
+    @asynccontextmanager
+    async def measure_page_load(self, name: str):
+        """Сбор метрик загрузки для перехода внутри SPA без перезагрузки
+        страницы (например, смены раздела каталога) в блоке with.
+        Метрики собираются, только если включена опция --page-metrics
+
+        :param name: название перехода в отчете
+        """
+
+        if get_page_metrics() is None:
+            yield
+            return
+
+        with step('Замер загрузки: {}', name):
+            since = await self.page.evaluate('performance.now()')
+            yield
+            await self._record_page_metrics(name, since)
+
+    async def get_page_load_metrics(self, since: float = 0) -> dict:
+        """Получение метрик загрузки страницы: Navigation Timing, FCP,
+        LCP, CLS, количество ресурсов и переданный объем данных
+
+        :param since: момент начала перехода внутри SPA
+                      (performance.now()), 0 - загрузка страницы целиком
+        """
+
+        with step('Получение метрик загрузки страницы', read=True):
+            return await self.page.evaluate(
+                PAGE_METRICS_SCRIPT, [since, VITALS_WAIT_MSEC]
+            )
+
+    async def _record_page_metrics(self, name: str, since: float = 0):
+        """Сохранение метрик загрузки в отчет сессии и Allure"""
+        metrics = await self.get_page_load_metrics(since)
+        get_page_metrics().record(name, self.page.url, metrics)
+
+    @asynccontextmanager
+    async def wait_for_responses(
+        self, *url_parts: str, timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC
+    ):
+        """Ожидание ответов сервера на действия внутри блока async with
+
+        Возвращает список AsyncEventInfo, из которых можно получить ответы
+        после выхода из блока
+
+        :param url_parts: части URL ожидаемых ответов (напр. '/viewcart')
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with step('Ожидание ответов сервера: {}', ', '.join(url_parts)):
+            action_failed = True
+            try:
+                async with AsyncExitStack() as stack:
+                    response_infos = [
+                        await stack.enter_async_context(
+                            self.page.expect_response(
+                                url_contains(url_part), timeout=timeout_msec
+                            )
+                        )
+                        for url_part in url_parts
+                    ]
+                    yield response_infos
+                    action_failed = False
+            except PlaywrightTimeoutError:
+                if action_failed:
+                    raise
+                raise AssertionError(
+                    f'Не получены ответы сервера {", ".join(url_parts)} '
+                    f'за {timeout_msec} мс'
+                ) from None
+
+    async def reload_page(self):
+        """Перезагрузка страницы"""
+
+        with step('Обновление страницы'):
+            return await self.page.reload()
+
+    async def get_current_url(self) -> str:
+        """Получение URL текущей страницы."""
+
+        with step('Получение URL страницы', read=True):
+            return self.page.url
+
+    async def get_cookies(self) -> list[Cookie]:
+        """Получение cookies страницы"""
+
+        with step('Получение cookies страницы', read=True):
+            return await self.page.context.cookies()
+
+    async def add_cookies(self, cookies: Cookie):
+        """Добавление cookies в хранилище браузера
+
+        :param cookies: список кук
+        """
+
+        with step('Добавление cookies'):
+            return await self.page.context.add_cookies(list(cookies))
+
+    async def close_tab(self, tab_number: int):
+        """Закрытие вкладки с указанным порядковым номером
+
+        :param tab_number: номер вкладки, которую нужно закрыть (начиная с 0)
+        """
+
+        with step('Закрытие вкладки под номером {}', tab_number):
+            all_tabs = self.page.context.pages
+            await all_tabs[tab_number].close()
+
+    async def switch_to_tab(self, tab_number: int) -> Page | None:
+        """Переключение на вкладку с указанным номером
+        и закрытие других вкладок
+
+        :param tab_number: номер вкладки, на которую нужно переключиться
+        (начиная с 0)
+        """
+
+        with step(
+            'Переключение на вкладку {} и закрытие других вкладок', tab_number
+        ):
+            all_tabs = self.page.context.pages
+            tab_to_switch = all_tabs[tab_number]
+            await tab_to_switch.bring_to_front()
+            await tab_to_switch.wait_for_load_state()
+            return tab_to_switch
+
+    async def close_all_tabs_except_first(self):
+        """Закрытие всех страниц, кроме первой"""
+
+        with step('Закрытие всех страниц, кроме первой'):
+            all_tabs = self.page.context.pages
+            for page in range(1, len(all_tabs)):
+                await all_tabs[page].close()
+
+    async def switch_to_iframe_and_click_element_inside_it(
+        self, iframe_locator: str, element_to_click_locator: str
+    ):
+        """Переход на iframe и клик по элементу внутри него
+
+        :param iframe_locator: локатор iframe
+        :param element_to_click_locator: локатор элемента внутри iframe,
+                                         на который нужно кликнут
+        """
+
+        with step('Переход на iframe и клик по элементу внутри него'):
+            iframe = self.page.frame_locator(iframe_locator)
+            await iframe.locator(element_to_click_locator).click()
+
+    async def switch_to_iframe_and_fill_the_field(
+        self, iframe_locator: str, field_locator: str, text: str
+    ):
+        """Переход на iframe и ввод текста в поле внутри iframe
+
+        :param iframe_locator: локатор iframe
+        :param field_locator: локатор поля внутри iframe,
+                              куда нужно ввести текст
+        :param text: текст для ввода
+        """
+
+        with step('Переход на iframe и ввод текста "{}"', text):
+            iframe = self.page.frame_locator(iframe_locator)
+            await iframe.locator(field_locator).fill(text)
+
+    async def get_iframe_by_index(self, iframe_index: int):
+        """Получение дочернего iframe по его индексу.
+
+        :param iframe_index: индекс iframe
+        """
+
+        with step('Получение iframe с индексом {}', iframe_index, read=True):
+            return self.page.main_frame.child_frames[iframe_index]
+
+    async def switch_to_main_iframe(self):
+        """Переключение на основной iframe"""
+
+        with step('Переключение на основной iframe', read=True):
+            return self.page.main_frame
+
+    async def alert_accept(self):
+        """Принятие диалогового окна (нажатие OK)"""
+
+        with step('Принятие диалогового окна (нажатие OK)'):
+            self.page.on('dialog', lambda dialog: dialog.accept())
+
+    async def scroll_down(self):
+        """Скролл вниз страницы"""
+
+        with step('Прокрутка вниз страницы'):
+            await self.page.evaluate(
+                'window.scrollTo(0, document.body.scrollHeight)'
+            )
+
+    async def take_screenshot(self, path_to_save: str):
+        """Создание screenshot'а страницы
+
+        :param path_to_save: путь для сохранения файла
+                            (например: screenshots/image1.png)
+        """
+
+        with step('Сохранение скриншота страницы'):
+            artifacts = get_artifact_writer()
+            if artifacts is None:
+                return await self.page.screenshot(path=path_to_save)
+
+            # Файл записывается сразу и доступен после возврата,
+            # в фоновом потоке только сжатие и вложение в отчет
+            screenshot = await self.page.screenshot(path=path_to_save)
+            artifacts.save_image(screenshot, 'Скриншот страницы')
+            return screenshot
+
+    async def execute_javascript(self, script: str):
+        """Выполнение javascript на странице
+
+        :param script: код js-скрипта
+        """
+
+        with step('Выполнение действий с помощью кода на javascript'):
+            return await self.page.evaluate(script)
+
+    async def assert_file_is_downloaded(self):
+        """Проверка загрузки файла"""
+
+        async with self.page.expect_download() as download_info:
+            downloaded_file = await download_info.value
+
+            with step('Проверка загрузки файла'):
+                assert (
+                    await downloaded_file.path() != ''
+                ), 'Downloaded file not found.'
+
+    async def press_keys(self, keys: str):
+        """Эмуляция нажатия клавиш(и) на клавиатуре
+
+        :param keys: строка с клавишей или сочетанием клавиш
+        """
+
+        with step('Нажатие клавиш(и) {}', keys):
+            await self.page.keyboard.press(keys)
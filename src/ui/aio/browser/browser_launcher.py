@@ -0,0 +1,207 @@
+from playwright.async_api import async_playwright
+
+from src.ui.aio.browser.context_pool import ContextPool
+from src.ui.browser.config import BrowserConfig
+from src.ui.browser.launcher_base import LauncherBase, is_connected
+
+
+class BrowserLauncher(LauncherBase):
+    """Инициализация браузера и создание context'ов для async API
+
+    Использует ту же конфигурацию, что и sync BrowserLauncher. Один
+    экземпляр позволяет создавать много context'ов и работать с ними
+    конкурентно из одного event loop. Если задан contextPool, страницы
+    для тестов заранее создаются в фоне (см. ContextPool).
+
+    Создается через `await BrowserLauncher.start(config_path)`
+    """
+
+    def __init__(
+        self,
+        local_browser_config_path: str = None,
+        har_mode: str = None,
+        config: BrowserConfig = None,
+    ):
+        super().__init__(local_browser_config_path, har_mode, config)
+        self.playwright = None
+        self.context_pool = None
+
+    @classmethod
+    async def start(
+        cls,
+        local_browser_config_path: str = None,
+        har_mode: str = None,
+        config: BrowserConfig = None,
+    ) -> 'BrowserLauncher':
+        """Запуск playwright и браузера
+
+        :param local_browser_config_path: путь до конфигурационного файла
+        :param har_mode: режим HAR, переопределяющий значение из конфигурации
+        :param config: уже загруженная конфигурация
+        """
+        launcher = cls(local_browser_config_path, har_mode, config)
+        launcher.playwright = await async_playwright().start()
+        await launcher._launch()
+        launcher._init_context_pool()
+        return launcher
+
+    async def _launch(self):
+        """Подготовка браузера с заданной в .yaml-файле конфигурацией.
+        Если указаны удаленные браузеры, подключение к ним выполняется
+        при создании context'ов. Если включен демон, выполняется
+        подключение к его браузеру"""
+        browser_type, launch_options = self._get_browser_type(self.playwright)
+        self.remote = self._create_remote_pool(browser_type, launch_options)
+        if self.remote:
+            return
+
+        if self.daemon:
+            endpoint = self.daemon.ensure_running(launch_options)
+            self.browser = await browser_type.connect_over_cdp(endpoint)
+        else:
+            self.browser = await browser_type.launch(**launch_options)
+        self.browser_launches += 1
+
+    def _init_context_pool(self):
+        """Создание пула готовых context'ов, если он включен
+        в конфигурации, и запуск его фонового пополнения"""
+        pool_size = self.config.context_pool_size
+        if pool_size and self.reuse_browser:
+            self.context_pool = ContextPool(
+                self._new_page_with_slot, pool_size, self._release_slot
+            )
+            self.context_pool.start()
+
+    async def _ensure_browser(self):
+        """Перезапуск браузера, если он был закрыт или упал"""
+        if self._needs_launch():
+            await self._launch()
+
+    async def _create_context(self, **kwargs):
+        """Создание объекта context
+
+        :param kwargs: дополнительные параметры для конфигурации браузера
+        """
+        all_context_params, har_params = self._get_context_params(**kwargs)
+        if self.remote:
+            context = await self.remote.new_context_async(**all_context_params)
+        else:
+            context = await self.browser.new_context(**all_context_params)
+        self.har.register_context(context, har_params)
+        if self.asset_cache:
+            await self.asset_cache.install_async(context)
+        if self.tracing:
+            await self.tracing.start_async(context)
+        return context
+
+    async def create_page(
+        self, test_name: str = None, blocking_profile: str = None, **kwargs
+    ):
+        """Создание объекта page в новом context'е
+
+        :param test_name: имя теста, для которого создается страница
+        :param blocking_profile: профиль блокировки ресурсов,
+                                 по умолчанию - из конфигурации
+        :param kwargs: дополнительные параметры для конфигурации context'а.
+                       Если они указаны, страница создается в обход пула
+                       context'ов
+        """
+        if self.context_pool and not kwargs:
+            page = await self.context_pool.acquire()
+        else:
+            page = await self._new_page_with_slot(**kwargs)
+        try:
+            await self.har.attach_async(page.context, test_name)
+            await self.blocker.install_async(page.context, blocking_profile)
+            if self.tracing:
+                await self.tracing.start_chunk_async(page.context, test_name)
+        except Exception:
+            self._release_slot(page)
+            raise
+
+        self.tests_run += 1
+        return page
+
+    async def _new_page_with_slot(self, wait: bool = True, **kwargs):
+        """Создание нового context'а и страницы в нем. Страница занимает
+        слот maxLivePages, пока не будет закрыта
+
+        :param wait: ждать свободный слот. Если False и свободных слотов
+                     нет, возвращает None
+        :param kwargs: дополнительные параметры для конфигурации context'а
+        """
+        slot = None
+        if self.page_slots:
+            if wait:
+                slot = await self.page_slots.acquire_async()
+            else:
+                slot = self.page_slots.try_acquire()
+                if slot is None:
+                    return None
+        try:
+            await self._ensure_browser()
+            context = await self._create_context(**kwargs)
+            page = await context.new_page()
+        except BaseException:
+            if slot is not None:
+                self.page_slots.release(slot)
+            raise
+
+        self._hold_slot(page, slot)
+        return page
+
+    async def close_page(
+        self, page, test_name: str = None, keep_trace: bool = False
+    ):
+        """Закрытие context'а страницы. Если браузер не переиспользуется
+        между тестами (reuseBrowser: false), он тоже закрывается
+
+        :param page: объект page, созданный через create_page
+        :param test_name: имя теста, для которого создавалась страница
+        :param keep_trace: сохранить трассу теста (тест упал
+                           или будет перезапущен)
+        """
+        context = page.context
+        self._sample_rss()
+        try:
+            if is_connected(context):
+                if self.tracing:
+                    await self.tracing.stop_chunk_async(
+                        context, test_name, keep_trace
+                    )
+                await context.close()
+        finally:
+            self._release_slot(page)
+            if not self.reuse_browser and not self.remote:
+                await self._close_browser()
+            self.har.collect(context, test_name)
+            if self.context_pool:
+                # Освободился слот maxLivePages - пул можно пополнить
+                self.context_pool.wake()
+
+    async def _close_browser(self):
+        """Закрытие браузера, если он еще запущен, и отключение
+        от удаленных браузеров. Браузер демона не закрывается,
+        а только отключается"""
+        for browser in self._detach_browsers():
+            await browser.close()
+        if self.daemon:
+            self.daemon.touch()
+
+    def stats(self) -> dict:
+        """Статистика воркера, пула context'ов, кэша статики
+        и блокировки ресурсов"""
+        stats = {}
+        if self.context_pool:
+            stats["Пул context'ов"] = self.context_pool.stats
+        return {**stats, **super().stats()}
+
+    async def close(self):
+        """Закрытие браузера и остановка playwright"""
+        try:
+            if self.context_pool:
+                await self.context_pool.close()
+            await self._close_browser()
+            self.har.close()
+        finally:
+            await self.playwright.stop()
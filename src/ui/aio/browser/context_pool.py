@@ -0,0 +1,172 @@
+import asyncio
+from collections import deque
+from time import perf_counter
+
+
+class ContextPool:
+    """Пул заранее созданных context'ов и страниц для async API
+
+    Хранит до size готовых страниц, каждая в своем context'е. Страница
+    выдается тесту один раз и после теста закрывается вместе с context'ом,
+    поэтому изоляция тестов сохраняется. Пул пополняет фоновая задача
+    asyncio: пока тесты работают со страницами, в том же event loop
+    создаются context'ы для следующих тестов. Если готовых страниц нет,
+    тест ждет страницу от той же задачи.
+
+    Страницы пула занимают слоты maxLivePages с момента создания. Если
+    свободного слота нет, пополнение откладывается до закрытия страницы
+    или следующей выдачи.
+    """
+
+    def __init__(self, create_page, size: int, discard_page=None):
+        """
+        :param create_page: корутина, создающая новую страницу в новом
+                            context'е. Для пополнения пула вызывается
+                            с wait=False и может вернуть None, если
+                            страницу сейчас создать нельзя (нет
+                            свободного слота maxLivePages)
+        :param size: количество страниц, которые держатся наготове
+        :param discard_page: функция, вызываемая для страниц, которые
+                             пул закрыл или выбросил сам
+        """
+        self._create_page = create_page
+        self._discard_page = discard_page
+        self.size = size
+        self._ready = deque()
+        self._waiters = deque()
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self.hits = 0
+        self.misses = 0
+        self.created = 0
+        self.create_sec = 0.0
+        self.miss_wait_sec = 0.0
+
+    def start(self):
+        """Запуск фонового пополнения пула в текущем event loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._refill())
+        self.wake()
+
+    def wake(self):
+        """Запрос на пополнение пула, например после освобождения слота"""
+        self._wakeup.set()
+
+    async def acquire(self):
+        """Выдача готовой страницы из пула или ожидание новой"""
+        self._drop_dead_pages()
+        if self._ready:
+            self.hits += 1
+            self.wake()
+            return self._ready.popleft()
+
+        self.misses += 1
+        started = perf_counter()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.wake()
+        try:
+            return await waiter
+        finally:
+            self.miss_wait_sec += perf_counter() - started
+
+    async def close(self):
+        """Остановка пополнения и закрытие всех страниц, ожидающих
+        в пуле"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(RuntimeError('Пул context\'ов закрыт'))
+        while self._ready:
+            page = self._ready.popleft()
+            try:
+                if _is_alive(page):
+                    await page.context.close()
+            finally:
+                self._discard(page)
+
+    async def _refill(self):
+        """Фоновая задача: создание страниц для ожидающих тестов
+        и пополнение пула до size"""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            self._drop_dead_pages()
+            while self._has_waiters() or len(self._ready) < self.size:
+                # Для ожидающего теста слот ждем, для запаса - нет
+                for_waiter = self._has_waiters()
+                started = perf_counter()
+                try:
+                    page = await self._create_page(wait=for_waiter)
+                except Exception as error:
+                    if not for_waiter:
+                        break
+                    self._fail_waiter(error)
+                    continue
+                if page is None:
+                    break
+                self.created += 1
+                self.create_sec += perf_counter() - started
+                self._put(page)
+
+    def _has_waiters(self) -> bool:
+        while self._waiters and self._waiters[0].done():
+            self._waiters.popleft()
+        return bool(self._waiters)
+
+    def _put(self, page):
+        """Передача страницы ожидающему тесту или в пул"""
+        if self._has_waiters():
+            self._waiters.popleft().set_result(page)
+        else:
+            self._ready.append(page)
+
+    def _fail_waiter(self, error: Exception):
+        if self._has_waiters():
+            self._waiters.popleft().set_exception(error)
+
+    def _drop_dead_pages(self):
+        """Удаление страниц, чей браузер был закрыт или упал"""
+        alive = deque()
+        for page in self._ready:
+            if _is_alive(page):
+                alive.append(page)
+            else:
+                self._discard(page)
+        self._ready = alive
+
+    def _discard(self, page):
+        if self._discard_page is not None:
+            self._discard_page(page)
+
+    @property
+    def stats(self) -> dict:
+        """Статистика попаданий и промахов пула, время создания страниц
+        в фоне (create_sec) и среднее ожидание страницы тестом
+        при промахе (avg_miss_wait_sec)"""
+        total = self.hits + self.misses
+        return {
+            'size': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'created': self.created,
+            'create_sec': self.create_sec,
+            'avg_miss_wait_sec': (
+                self.miss_wait_sec / self.misses if self.misses else 0.0
+            ),
+        }
+
+
+def _is_alive(page) -> bool:
+    """Проверка того, что страница и ее браузер еще доступны"""
+    browser = page.context.browser
+    return not page.is_closed() and (browser is None or browser.is_connected())
@@ -0,0 +1,426 @@
+from abc import ABC
+from typing import Literal
+
+from playwright.async_api import (
+    expect,
+    Locator,
+    ElementHandle,
+    Response,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+from src.ui.aio.browser.browser import Browser
+from src.ui.helper.timeouts import DEFAULT_SYNC_TIMEOUT_MSEC
+from src.ui.page_elements.base import (
+    CHILDREN_RERENDERED_JS,
+    GET_ALL_ATTRIBUTES_JS,
+    GET_ALL_FIELDS_JS,
+    MARK_CHILDREN_STALE_JS,
+    LazyElement,
+    normalize_fields,
+    rerender_timeout_error,
+    wait_state_status,
+)
+
+
+class Base(LazyElement, ABC):
+    """Базовый класс для взаимодействия с элементами через async API"""
+
+    def get_element(self) -> Locator:
+        """Получение локатора элемента"""
+        return self._element
+
+    async def get_attribute(self, attribute_name: str) -> str:
+        """Получение значение атрибута
+
+        :param attribute_name: локатор с атрибутом (напр. 'p#name')
+        """
+
+        with self._step(
+            'Получение значение атрибута "{}" у элемента "{}"',
+            attribute_name,
+            self.allure_name,
+            read=True,
+        ):
+            return await self._element.get_attribute(attribute_name)
+
+    async def get_text(self) -> str:
+        """Получение текста элемента"""
+
+        with self._step('Получение текста "{}"', self.allure_name, read=True):
+            return await self._element.text_content()
+
+    async def get_all_texts(self) -> list[str]:
+        """Получение текстов всех найденных элементов за одно обращение"""
+
+        with self._step(
+            'Получение текстов всех "{}"', self.allure_name, read=True
+        ):
+            return await self._element.all_text_contents()
+
+    async def get_all_attributes(
+        self, attribute_name: str
+    ) -> list[str | None]:
+        """Получение значения атрибута у всех найденных элементов
+        за одно обращение
+
+        :param attribute_name: название атрибута (напр. 'href')
+        """
+
+        with self._step(
+            'Получение значений атрибута "{}" у всех "{}"',
+            attribute_name,
+            self.allure_name,
+            read=True,
+        ):
+            return await self._element.evaluate_all(
+                GET_ALL_ATTRIBUTES_JS, attribute_name
+            )
+
+    async def get_all_fields(
+        self, fields: dict[str, str | tuple[str, str]]
+    ) -> list[dict[str, str | None]]:
+        """Получение значений вложенных полей всех найденных элементов
+        за одно обращение
+
+        :param fields: поля для каждого элемента в виде {название: селектор}
+                       для текста (без пробелов по краям) или
+                       {название: (селектор, атрибут)} для атрибута.
+                       Пустой селектор означает сам элемент.
+                       Если поле не найдено, его значение - None
+        """
+
+        with self._step(
+            'Получение полей {} у всех "{}"',
+            ', '.join(fields),
+            self.allure_name,
+            read=True,
+        ):
+            return await self._element.evaluate_all(
+                GET_ALL_FIELDS_JS, normalize_fields(fields)
+            )
+
+    async def click(self) -> None:
+        """Клик по элементу"""
+
+        with self._step('Клик по элементу "{}"', self.allure_name):
+            await self._element.click()
+
+    async def click_and_wait_for_response(
+        self,
+        url_part: str,
+        rerender_selector: str = None,
+        timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC,
+    ) -> Response:
+        """Клик по элементу с ожиданием ответа сервера и, если указано,
+        перерисовки контейнера в DOM. Ответ ожидается через
+        Browser.wait_for_responses
+
+        :param url_part: часть URL ожидаемого ответа (напр. '/bycat')
+        :param rerender_selector: селектор контейнера, содержимое которого
+                                  должно обновиться (напр. '#tbodyid')
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with self._step(
+            'Клик по элементу "{}" и ожидание ответа "{}"',
+            self.allure_name,
+            url_part,
+        ):
+            if rerender_selector:
+                await self.page.locator(rerender_selector).evaluate(
+                    MARK_CHILDREN_STALE_JS
+                )
+
+            async with Browser(self.page).wait_for_responses(
+                url_part, timeout_msec=timeout_msec
+            ) as (response_info,):
+                await self._element.click(timeout=timeout_msec)
+
+            if rerender_selector:
+                try:
+                    await self.page.wait_for_function(
+                        CHILDREN_RERENDERED_JS,
+                        arg=rerender_selector,
+                        timeout=timeout_msec,
+                    )
+                except PlaywrightTimeoutError:
+                    raise rerender_timeout_error(
+                        rerender_selector, url_part, timeout_msec
+                    ) from None
+
+            return await response_info.value
+
+    async def wait_for_children(
+        self, timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC
+    ):
+        """Ожидание того, что в контейнере появятся дочерние элементы
+
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with self._step('Ожидание заполнения "{}"', self.allure_name):
+            await self.page.wait_for_function(
+                CHILDREN_RERENDERED_JS,
+                arg=self.selector,
+                timeout=timeout_msec,
+            )
+
+    async def wait_for_count(
+        self,
+        expected_count: int,
+        timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC,
+    ):
+        """Ожидание того, что количество найденных элементов станет равным
+        ожидаемому
+
+        :param expected_count: ожидаемое количество элементов
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with self._step(
+            'Ожидание количества элементов "{}": {}',
+            self.allure_name,
+            expected_count,
+        ):
+            await expect(self._element).to_have_count(
+                expected_count, timeout=timeout_msec
+            )
+
+    async def double_click(self) -> None:
+        """Двойной клик по элементу"""
+
+        with self._step('Клик по элементу "{}"', self.allure_name):
+            await self.page.dblclick(self.selector)
+
+    async def choose_dropdown_option(self, option: str) -> None:
+        """Выбор значения из выпадающего списка
+
+        :param option: значение, которое нужно выбрать
+        """
+
+        with self._step(
+            'Выбор значения "{}" у элемента "{}"', self.value, self.allure_name
+        ):
+            await self.page.select_option(self.selector, option)
+
+    async def is_enabled(self) -> bool:
+        """Проверка того, что элемент активирован"""
+
+        with self._step(
+            'Проверка того, что элемент "{}" активирован', self.allure_name
+        ):
+            return await self._element.is_enabled()
+
+    async def is_disabled(self) -> bool:
+        """Проверка того, что элемент неактивен"""
+
+        with self._step(
+            'Проверка того, что элемент "{}" неактивен', self.allure_name
+        ):
+            return await self._element.is_disabled()
+
+    async def assert_element_state_of_activity(self, enabled=True):
+        """Проверка состояния активности элемента
+
+        :param enabled: состояние элемента (включен / выключен)
+        """
+
+        element_status = 'активирован' if enabled else 'неактивный'
+
+        with self._step(
+            'Проверка того, что {} {}', self.allure_name, element_status
+        ):
+            if enabled:
+                await expect(self._element).to_be_enabled()
+            else:
+                await expect(self._element).to_be_disabled()
+
+    async def is_visible(self, timeout_msec: int = None) -> bool:
+        """Проверка видимости элемента
+
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with self._step(
+            'Проверка того, что элемент "{}" видимый', self.allure_name
+        ):
+            return await self._element.is_visible(timeout=timeout_msec)
+
+    async def assert_element_visibility(self, visible=True):
+        """Проверка состояния видимости элемента
+        :param visible: видимость элемента
+        """
+
+        element_status = 'видимый' if visible else 'невидимый'
+
+        with self._step(
+            'Проверка того, что {} {}', self.allure_name, element_status
+        ):
+            if visible:
+                await expect(self._element).to_be_visible()
+            else:
+                await expect(self._element).not_to_be_visible()
+
+    async def drag_and_drop(
+        self,
+        target: Locator,
+        start_position: dict = None,
+        target_position: dict = None,
+    ):
+        """Перетаскивание элемента к другому элементу
+
+        :param target: локатор элемента, куда нужно перетащить
+        :param start_position: координаты для клика внутри исходного элемента
+                            (self._element) напр. {'x':0, 'y':70}
+        :param target_position: координаты для клика внутри целевого элемента
+                                            напр. {'x':10, 'y':70}
+        """
+
+        with self._step('Перетаскивание элемента "{}"', self.allure_name):
+            await self._element.drag_to(
+                target,
+                source_position=start_position,
+                target_position=target_position,
+            )
+
+    async def have_text(self, text: str):
+        """Проверка того, что элемент содержит указанный текст
+                                         (полное соответствие)
+
+        :param text: текст для проверки
+        """
+
+        with self._step(
+            'Проверка того, что элемент "{}" содержит текст: "{}"',
+            self.allure_name,
+            text,
+        ):
+            await expect(self._element).to_have_text(text)
+
+    async def not_have_text(self, text: str):
+        """Проверка того, что элемент не содержит указанный текст.
+
+        :param text: текст для проверки
+        """
+
+        with self._step(
+            'Проверка того, что у элемента "{}" отсутствует текст: "{}"',
+            self.allure_name,
+            text,
+        ):
+            await expect(self._element).not_to_have_text(text)
+
+    async def contains_text(self, text: str):
+        """Проверка того, что текст элемента содержит указанный текст
+
+        :param text: текст для проверки.
+        """
+
+        with self._step(
+            'Проверка того, что элемент "{}" содержит текст: "{}"',
+            self.allure_name,
+            text,
+        ):
+            await expect(self._element).to_contain_text(text)
+
+    async def is_editable(self):
+        """Проверка того, что элемент является редактируемым"""
+
+        with self._step(
+            'Проверка, что элемент "{}" можно редактировать', self.allure_name
+        ):
+            await expect(self._element).to_be_editable()
+
+    async def is_empty(self):
+        """Проверка того, что элемент ничего не содержит"""
+
+        with self._step(
+            'Проверка того, что элемент "{}" пустой', self.allure_name
+        ):
+            await expect(self._element).to_be_empty()
+
+    async def hover(self):
+        """Установка фиксации (hover) на элементе"""
+
+        with self._step('Поставим hover на элементе "{}"', self.allure_name):
+            await self._element.hover()
+
+    async def focus(self):
+        """Установка фокуса на элементе"""
+
+        with self._step('Установка фокуса на элементе "{}"', self.allure_name):
+            await self._element.focus()
+
+    async def locator_has_values(self, value: str | list[str]):
+        """Проверка того, что элемент содержит указанные value(s)
+
+        :param value: проверяемые значения
+        """
+
+        with self._step(
+            'Проверка того, что элемент "{}" содержит значени(е/я): {}',
+            self.allure_name,
+            value,
+        ):
+            element_locator = await self._element.select_option(value)
+            await expect(element_locator).to_have_values(value)
+
+    async def wait_for(
+        self,
+        state: (
+            Literal['visible', 'hidden', 'attached', 'detached'] | None
+        ) = 'visible',
+        timeout_msec: int | None = None,
+    ):
+        """Ожидание того, что элемент удовлетворяет определенному состоянию
+
+        param: state: ожидаемое состояние
+        -`visible` элемент отображается на экране;
+        -`hidden` элемент не отображается на экране;
+        -`attached` элемент появился в DOM;
+        -`detached` элемент исчез из DOM;
+        """
+
+        element_status = wait_state_status(state)
+        with self._step(
+            'Ожидание того, что {} станет {}', self.allure_name, element_status
+        ):
+            await self._element.wait_for(
+                state=state, timeout=timeout_msec
+            )
+
+    async def get_by_selector(self) -> ElementHandle:
+        """Поиск элемента по селектору"""
+
+        return await self.page.query_selector(selector=self.selector)
+
+    async def get_all_by_selector(self) -> list:
+        """Поиск всех элементов по селектору"""
+
+        return await self.page.query_selector_all(selector=self.selector)
+
+    async def wait_for_selector(
+        self,
+        state: (
+            Literal['visible', 'hidden', 'attached', 'detached'] | None
+        ) = 'visible',
+        timeout_msec: int | None = None,
+    ):
+        """Ожидание того, что элемент по селектору будет удовлетворять
+        определенному состоянию
+
+        param: state: ожидаемое состояние
+        -`visible` элемент отображается на экране;
+        -`hidden` элемент не отображается на экране;
+        -`attached` элемент появился в DOM;
+        -`detached` элемент исчез из DOM;
+        """
+
+        element_status = wait_state_status(state)
+        with self._step(
+            'Ожидание того, что {} станет {}', self.allure_name, element_status
+        ):
+            await self.page.wait_for_selector(
+                selector=self.selector, state=state, timeout=timeout_msec
+            )
@@ -0,0 +1,25 @@
+from playwright.async_api import expect
+
+from src.ui.aio.page_elements.base import Base
+
+
+class CheckBox(Base):
+    """Методы чекбоксов"""
+
+    async def set_checkbox(self, index: int) -> None:
+        """Выбор чекбокса
+
+        :param index: индекс чекбокса.
+        """
+
+        with self._step('Установка чекбокса "{}"', self.allure_name):
+            elements = self._element
+            await elements.nth(index).check()
+
+    async def is_checked(self):
+        """Проверка, что чек-бокс выбран"""
+
+        with self._step(
+            'Проверка, что чекбокс "{}" проставлен', self.allure_name
+        ):
+            await expect(self._element).to_be_checked()
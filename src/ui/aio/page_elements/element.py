@@ -0,0 +1,7 @@
+from src.ui.aio.page_elements.base import Base
+
+
+class Element(Base):
+    """Методы для работы с элементами"""
+
+    pass
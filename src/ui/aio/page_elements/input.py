@@ -0,0 +1,72 @@
+from src.ui.aio.page_elements.base import Base
+
+
+class Input(Base):
+    """Методы для работы с полями ввода"""
+
+    async def fill(
+        self, text: str, secure: bool = False, delay: int | float = None
+    ):
+        """Заполнение поля ввода
+
+        :param text: текст для ввода
+        :param secure: если True, то в allure будет отображаться ***
+        :param delay: если указан, ввод будет посимвольный с задержкой
+        """
+
+        display_text = text if not secure else "***"
+
+        with self._step(
+            'Ввод текста "{}" в поле "{}"', display_text, self.allure_name
+        ):
+            if delay:
+                await self._element.type(text, delay=delay)
+            else:
+                await self._element.fill(text)
+
+    async def clear(self):
+        """Очистка поля ввода"""
+
+        with self._step('Очистка поля "{}"', self.allure_name):
+            await self._element.clear()
+
+    async def press_enter(self):
+        """Нажатие Enter в поле"""
+
+        with self._step('Нажатие Enter в поле "{}"', self.allure_name):
+            await self._element.press("Enter")
+
+    async def get_input_value(self, timeout_msec: float = None) -> str:
+        """Получение текстового значения поля ввода
+
+        :param timeout_msec: время ожидания в миллисекундах
+        """
+
+        with self._step(
+            'Получение значения поля ввода "{}"', self.allure_name, read=True
+        ):
+            return await self._element.input_value(timeout=timeout_msec)
+
+    async def input_text_into_shadow_root(
+        self, shadow_locator: str, shadow_input_locator: str, text: str
+    ):
+        """Ввод текста в теневом элементе (Shadow DOM) с помощью JS-кода
+
+        :param shadow_locator: локатор теневого элемента
+        :param shadow_input_locator: поле для ввода в теневом элементе
+        :param text: текст для ввода.
+        """
+
+        with self._step(
+            'Ввод текста: {} в поле {} теневого элемента {}',
+            text,
+            shadow_input_locator,
+            shadow_locator,
+        ):
+            shadow_root = await self._element.evaluate_handle(
+                f'document.querySelector("{shadow_locator}").shadowRoot'
+            )
+            input_element = await shadow_root.evaluate_handle(
+                f'document.querySelector("{shadow_input_locator}")'
+            )
+            await input_element.as_element().fill(text)
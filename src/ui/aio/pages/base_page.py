@@ -0,0 +1,134 @@
+from src.ui.aio.browser.browser import Browser
+from src.ui.aio.page_elements.button import Button
+from src.ui.aio.page_elements.checkbox import CheckBox
+from src.ui.aio.page_elements.element import Element
+from src.ui.aio.page_elements.input import Input
+from src.ui.aio.page_elements.text import Text
+from src.ui.helper.urls import (
+    BYCAT_ENDPOINT,
+    CART_ENDPOINT,
+    ENTRIES_ENDPOINT,
+    PRODUCT_CARD_ENDPOINT,
+    VIEWCART_ENDPOINT,
+)
+from src.ui.page_elements import button as sync_button
+from src.ui.page_elements import checkbox as sync_checkbox
+from src.ui.page_elements import element as sync_element
+from src.ui.page_elements import input as sync_input
+from src.ui.page_elements import text as sync_text
+from src.ui.pages.base_page import PRODUCTS_SELECTOR, BasePageMixin
+
+
+class BasePage(BasePageMixin):
+    """Логика для тестов на главной странице"""
+
+    browser_class = Browser
+    element_types = {
+        sync_button.Button: Button,
+        sync_checkbox.CheckBox: CheckBox,
+        sync_element.Element: Element,
+        sync_input.Input: Input,
+        sync_text.Text: Text,
+    }
+
+    async def open(self):
+        """Открытие страницы с ожиданием загрузки и отрисовки карточек
+        товаров"""
+
+        async with self.browser.wait_for_responses(ENTRIES_ENDPOINT):
+            await self.browser.go_to_url(url=self.url)
+        await self.products.wait_for_children()
+
+    async def assert_categories_presence(self):
+        """Проверка наличия заголовка CATEGORIES"""
+
+        await self.categories_header.wait_for()
+        await self.categories_header.have_text('CATEGORIES')
+
+    async def assert_phones_button_is_displayed_and_enabled(self):
+        """Проверка кликабельности кнопки Phones"""
+
+        await self.phones_button.assert_element_visibility()
+        await self.phones_button.assert_element_state_of_activity()
+
+    async def navigate_to_phones_section(self):
+        """Переход в раздел Телефоны"""
+
+        async with self.browser.measure_page_load('Раздел Phones'):
+            await self.phones_button.click_and_wait_for_response(
+                BYCAT_ENDPOINT, rerender_selector=PRODUCTS_SELECTOR
+            )
+
+    async def assert_laptops_button_is_displayed_and_enabled(self):
+        """Проверка кликабельности кнопки Laptops"""
+
+        await self.laptops_button.assert_element_visibility()
+        await self.laptops_button.assert_element_state_of_activity()
+
+    async def navigate_to_laptops_section(self):
+        """Переход в раздел Ноутбуки"""
+
+        async with self.browser.measure_page_load('Раздел Laptops'):
+            await self.laptops_button.click_and_wait_for_response(
+                BYCAT_ENDPOINT, rerender_selector=PRODUCTS_SELECTOR
+            )
+
+    async def assert_monitors_button_is_displayed_and_enabled(self):
+        """Проверка кликабельности кнопки Monitors"""
+
+        await self.monitors_button.assert_element_visibility()
+        await self.monitors_button.assert_element_state_of_activity()
+
+    async def navigate_to_monitors_section(self):
+        """Переход в раздел Мониторы"""
+
+        async with self.browser.measure_page_load('Раздел Monitors'):
+            await self.monitors_button.click_and_wait_for_response(
+                BYCAT_ENDPOINT, rerender_selector=PRODUCTS_SELECTOR
+            )
+
+    async def assert_page_load_metrics(self, **limits: float):
+        """Проверка метрик загрузки открытой страницы по порогам,
+        например lcp_ms=2500
+
+        :param limits: максимальные значения метрик из PAGE_METRICS
+        """
+
+        self._assert_page_load_metrics(
+            await self.browser.get_page_load_metrics(), limits
+        )
+
+    async def assert_number_of_cards(self, number_of_cards: int):
+        """Проверка количества карточек на странице"""
+
+        await self.cards.wait_for_count(number_of_cards)
+
+    async def assert_display_of_cards_with_similar_title(self, title: str):
+        """Проверка отображения карточек с указанным названием"""
+
+        await self.products.wait_for()
+
+        self._assert_cards_with_similar_title(
+            await self.cards.get_all_texts(), title
+        )
+
+    async def navigate_to_certain_product_card_page(self, card_number: int):
+        """Переход на страницу карточки товара по её номеру"""
+
+        all_card_titles = self.cards_titles.get_element()
+
+        actual_num = card_number - 1
+        product_title = all_card_titles.nth(actual_num)
+        await product_title.wait_for()
+
+        async with self.page.expect_navigation():
+            await product_title.click()
+
+        self._assert_url_ends_with(f'{PRODUCT_CARD_ENDPOINT}{card_number}')
+
+    async def navigate_to_cart(self):
+        """Переход в корзину"""
+
+        async with self.browser.wait_for_responses(VIEWCART_ENDPOINT):
+            await self.cart_button.click()
+        self._assert_url_ends_with(CART_ENDPOINT)
@@ -0,0 +1,101 @@
+from src.ui.aio.pages.base_page import BasePage
+from src.ui.helper.steps import step
+from src.ui.helper.timeouts import DEFAULT_SYNC_TIMEOUT_MSEC
+from src.ui.helper.urls import DELETE_ITEM_ENDPOINT, VIEWCART_ENDPOINT
+from src.ui.pages.cart_page import CART_SNAPSHOT_ARGS, CartPageMixin
+from src.ui.pages.cart_snapshot import CART_SNAPSHOT_JS, CartSnapshot
+
+
+class CartPage(CartPageMixin, BasePage):
+    """Логика для тестов корзины"""
+
+    async def open(self):
+        """Открытие корзины с ожиданием ответа сервера со списком товаров"""
+
+        async with self.browser.wait_for_responses(VIEWCART_ENDPOINT):
+            await self.browser.go_to_url(url=self.url)
+
+    async def wait_for_cart_ready(
+        self,
+        expected_count: int,
+        timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC,
+    ):
+        """Ожидание отрисовки корзины с ожидаемым количеством товаров
+
+        :param expected_count: ожидаемое количество товаров
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        await self.product_rows.wait_for_count(expected_count, timeout_msec)
+
+    async def assert_place_order_button_is_displayed_and_enabled(self):
+        """Проверка кликабельности кнопки Place Order"""
+
+        await self.products_table.wait_for()
+        await self.place_order_button.assert_element_visibility()
+        await self.place_order_button.assert_element_state_of_activity()
+
+    async def get_cart_snapshot(self) -> CartSnapshot:
+        """Получение всех строк корзины и итоговой суммы за одно обращение"""
+
+        with step('Получение содержимого корзины', read=True):
+            return CartSnapshot.from_dict(
+                await self.page.evaluate(CART_SNAPSHOT_JS, CART_SNAPSHOT_ARGS)
+            )
+
+    async def is_product_in_cart(
+        self, expected_name: str, expected_price: str
+    ) -> bool:
+        """Проверка наличия товара с указанными названием и ценой"""
+
+        cart = await self.get_cart_snapshot()
+        return cart.has_product(expected_name, expected_price)
+
+    async def get_product_count(self) -> int:
+        """Получение количества товаров в корзине"""
+
+        return await self.product_rows.get_element().count()
+
+    async def verify_product_added(
+        self, expected_name: str, expected_price: str, expected_count: int
+    ):
+        """Проверка добавления товара в корзину"""
+
+        await self.wait_for_cart_ready(expected_count)
+        cart = await self.get_cart_snapshot()
+        cart.assert_product_added(
+            expected_name, expected_price, expected_count
+        )
+
+    async def delete_product(self):
+        """Удаление товара из корзины"""
+
+        await self.delete_button.wait_for()
+        await self.delete_button.assert_element_visibility()
+        await self.delete_button.assert_element_state_of_activity()
+
+        products_count = await self.get_product_count()
+        async with self.browser.wait_for_responses(DELETE_ITEM_ENDPOINT):
+            await self.delete_button.click()
+        await self.wait_for_cart_ready(products_count - 1)
+
+    async def verify_cart_is_empty(self):
+        """Проверка, что корзина пуста"""
+        cart = await self.get_cart_snapshot()
+        cart.assert_empty()
+
+    async def verify_product_removed(
+        self, product_name: str, product_price: str
+    ):
+        """Проверка того, что товар удален из корзины
+        :param product_name: название товара
+        :param product_price: цена товара
+        """
+
+        cart = await self.get_cart_snapshot()
+        cart.assert_product_removed(product_name, product_price)
+
+    async def click_place_order_button(self):
+        """Нажатие на кнопку Place Order"""
+
+        await self.place_order_button.click()
@@ -0,0 +1,31 @@
+from src.ui.aio.pages.base_page import BasePage
+from src.ui.pages.order_page import OrderPageMixin
+
+
+class OrderPage(OrderPageMixin, BasePage):
+    """Логика для тестов формы оформления заказов"""
+
+    async def fill_out_order_form(self):
+        """Заполнение данными формы заказа товаров"""
+
+        await self.order_modal_window.wait_for()
+
+        form = self._generate_order_form()
+        for field, value in form.items():
+            await field.fill(value)
+
+        await self.purchase_button.click()
+        return form[self.name_input]
+
+    async def verify_informational_window(self, expected_name):
+        """Проверка появления информационного окна и информации в нем
+
+        :param expected_name: ожидаемое имя в информационно окне
+        """
+
+        await self.order_modal_window.assert_element_visibility()
+        await self.congrats.have_text('Thank you for your purchase!')
+
+        self._assert_customer_name(
+            await self.customers_info.get_text(), expected_name
+        )
@@ -0,0 +1,38 @@
+from src.ui.aio.pages.base_page import BasePage
+from src.ui.helper.urls import ADD_TO_CART_ENDPOINT
+from src.ui.pages.product_page import ProductPageMixin
+
+
+class ProductPage(ProductPageMixin, BasePage):
+    """Логика для тестов карточки товара"""
+
+    async def wait_for_page_load(self):
+        """Ожидание загрузки страницы товара"""
+
+        await self.product_title.wait_for()
+        await self.product_price.wait_for()
+        await self.add_to_cart_button.wait_for()
+
+    async def get_product_info(self):
+        """Получение информации о товаре"""
+
+        await self.wait_for_page_load()
+
+        product_name = await self.product_title.get_text()
+        product_price = self._parse_price(await self.product_price.get_text())
+
+        return product_name, product_price
+
+    async def add_product_to_cart(self):
+        """Добавление товара в корзину"""
+
+        product_name, product_price = await self.get_product_info()
+
+        async with self.browser.wait_for_responses(ADD_TO_CART_ENDPOINT):
+            async with self.page.expect_event('dialog') as dialog_info:
+                await self.add_to_cart_button.click()
+
+        dialog = await dialog_info.value
+        await dialog.accept()
+
+        return product_name, product_price
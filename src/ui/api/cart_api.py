@@ -0,0 +1,118 @@
+import uuid
+
+from playwright.sync_api import APIResponse, Page
+
+from src.ui.helper.steps import step
+from src.ui.helper.urls import (
+    ADD_TO_CART_ENDPOINT,
+    DELETE_ITEM_ENDPOINT,
+    VIEW_ENDPOINT,
+    VIEWCART_ENDPOINT,
+    get_api_url,
+    get_base_url,
+)
+
+# Cookie, по которым demoblaze определяет корзину гостя и пользователя
+GUEST_COOKIE = 'user'
+TOKEN_COOKIE = 'tokenp_'
+
+
+class CartApi:
+    """Подготовка корзины через API demoblaze в обход UI
+
+    Запросы отправляются через APIRequestContext страницы, поэтому
+    используют cookies context'а теста: товары попадают в ту же корзину,
+    которую затем откроет CartPage.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+        self.request = page.request
+
+    def _get_cart_owner(self) -> tuple[str, bool]:
+        """Получение идентификатора корзины и признака авторизации
+
+        Если у context'а еще нет cookie гостя, она создается так же,
+        как это делает сам сайт при первом открытии
+        """
+        base_url = get_base_url()
+        cookies = {
+            cookie['name']: cookie['value']
+            for cookie in self.page.context.cookies(base_url)
+        }
+        if cookies.get(TOKEN_COOKIE):
+            return cookies[TOKEN_COOKIE], True
+
+        if not cookies.get(GUEST_COOKIE):
+            cookies[GUEST_COOKIE] = str(uuid.uuid4())
+            self.page.context.add_cookies(
+                [
+                    {
+                        'name': GUEST_COOKIE,
+                        'value': cookies[GUEST_COOKIE],
+                        'url': base_url,
+                    }
+                ]
+            )
+        return cookies[GUEST_COOKIE], False
+
+    def _post(self, endpoint: str, payload: dict) -> APIResponse:
+        """Отправка POST-запроса к API с проверкой статуса ответа
+
+        :param endpoint: адрес метода API (напр. '/addtocart')
+        :param payload: тело запроса
+        """
+        response = self.request.post(get_api_url() + endpoint, data=payload)
+        if not response.ok:
+            raise RuntimeError(
+                f'Ошибка запроса {endpoint}: {response.status} '
+                f'{response.text()}'
+            )
+        return response
+
+    def get_product_info(self, product_id: int) -> tuple[str, str]:
+        """Получение названия и цены товара в том виде,
+        в котором они отображаются в корзине
+
+        :param product_id: идентификатор товара
+        """
+        product = self._post(VIEW_ENDPOINT, {'id': str(product_id)}).json()
+        return product['title'], f'{product["price"]:g}'
+
+    def add_products(self, *product_ids: int):
+        """Добавление товаров в корзину. Названия и цены товаров
+        не запрашиваются, при необходимости их возвращает
+        get_product_info
+
+        :param product_ids: идентификаторы товаров (напр. 3 для
+                            prod.html?idp_=3), повторы добавляют товар
+                            несколько раз
+        """
+        with step('Добавление товаров {} через API', product_ids):
+            cookie, flag = self._get_cart_owner()
+            for product_id in product_ids:
+                self._post(
+                    ADD_TO_CART_ENDPOINT,
+                    {
+                        'id': str(uuid.uuid4()),
+                        'cookie': cookie,
+                        'prod_id': product_id,
+                        'flag': flag,
+                    },
+                )
+
+    def get_items(self) -> list[dict]:
+        """Получение позиций корзины (id позиции и prod_id товара)"""
+
+        cookie, flag = self._get_cart_owner()
+        response = self._post(
+            VIEWCART_ENDPOINT, {'cookie': cookie, 'flag': flag}
+        )
+        return response.json().get('Items', [])
+
+    def clear(self):
+        """Удаление всех товаров из корзины"""
+
+        with step('Очистка корзины через API'):
+            for item in self.get_items():
+                self._post(DELETE_ITEM_ENDPOINT, {'id': item['id']})
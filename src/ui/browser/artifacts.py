@@ -0,0 +1,281 @@
+import hashlib
+import io
+import os
+import queue
+import threading
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+
+import allure
+import allure_commons
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+IMAGE_FORMATS = ('png', 'webp', 'jpeg')
+IMAGE_MIME_TYPES = {
+    'png': 'image/png',
+    'webp': 'image/webp',
+    'jpeg': 'image/jpeg',
+}
+ENCODED_CACHE_SIZE = 128
+
+_shared_writer = None
+
+
+class _PendingAttachment(bytes):
+    """Пустое тело вложения: файл резервируется в отчете сразу,
+    а содержимое записывается фоновым потоком"""
+
+    file_name = None
+
+
+class _AttachmentReservations:
+    """Плагин allure: запоминает имя файла зарезервированного вложения"""
+
+    @allure_commons.hookimpl
+    def report_attached_data(self, body, file_name):
+        if isinstance(body, _PendingAttachment):
+            body.file_name = file_name
+
+
+class ArtifactWriter:
+    """Фоновая обработка артефактов тестов: скриншотов и файлов
+
+    Тест только снимает байты и резервирует вложение в текущем шаге
+    Allure, а сжатие изображений, запись файлов и содержимого вложений
+    выполняются в отдельном потоке. Одинаковые изображения сжимаются
+    один раз, а повторный скриншот в том же тесте не прикладывается.
+    Очередь ограничена по объему: если она заполнена, тест ждет
+    освобождения места. flush() дожидается обработки всей очереди.
+    """
+
+    def __init__(
+        self,
+        image_format: str = 'png',
+        quality: int = 80,
+        max_queue_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        :param image_format: формат вложений-изображений: png, webp, jpeg
+        :param quality: качество сжатия webp и jpeg (1-100)
+        :param max_queue_bytes: максимальный объем данных в очереди
+        """
+        if image_format != 'png' and Image is None:
+            warnings.warn(
+                f'Pillow не установлен, скриншоты сохраняются в png '
+                f'вместо {image_format}'
+            )
+            image_format = 'png'
+
+        self.image_format = image_format
+        self.quality = quality
+        self.max_queue_bytes = max_queue_bytes
+        self._queue = queue.Queue()
+        self._queued_bytes = 0
+        self._space = threading.Condition()
+        self._encoded = OrderedDict()
+        # Хэши скриншотов, уже приложенных в текущем тесте
+        self._attached_test = None
+        self._attached = set()
+        self.images = 0
+        self.files = 0
+        self.duplicates = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.errors = 0
+
+        self._reservations = _AttachmentReservations()
+        allure_commons.plugin_manager.register(self._reservations)
+        self._thread = threading.Thread(
+            target=self._run, name='artifact-writer', daemon=True
+        )
+        self._thread.start()
+
+    def save_image(self, data: bytes, name: str, path: str = None):
+        """Сохранение скриншота: вложение в отчет и, если указан путь,
+        исходный png на диск
+
+        :param data: png-байты скриншота
+        :param name: название вложения
+        :param path: путь для сохранения исходного файла
+        """
+        digest = hashlib.sha1(data).hexdigest()
+        test = os.getenv('PYTEST_CURRENT_TEST', '').split(' ')[0]
+        if test != self._attached_test:
+            self._attached_test = test
+            self._attached.clear()
+
+        pending = None
+        if digest in self._attached:
+            self.duplicates += 1
+        else:
+            self._attached.add(digest)
+            pending = self._reserve(
+                name, IMAGE_MIME_TYPES[self.image_format], self.image_format
+            )
+        if pending is None and path is None:
+            return
+        self._put(('image', data, digest, pending, path), len(data))
+
+    def save_file(self, path: str, name: str, attachment_type):
+        """Прикрепление файла (трассы, видео) к отчету без копирования
+        в потоке теста
+
+        :param path: путь до файла
+        :param name: название вложения
+        :param attachment_type: тип вложения allure.attachment_type
+        """
+        pending = self._reserve(
+            name, attachment_type.mime_type, attachment_type.extension
+        )
+        if pending is not None:
+            self._put(('file', path, pending), 0)
+
+    def flush(self):
+        """Ожидание обработки всех артефактов в очереди"""
+        self._queue.join()
+
+    def close(self):
+        """Обработка оставшихся артефактов, остановка потока
+        и отключение плагина allure"""
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+        self._attached.clear()
+        self._encoded.clear()
+        if allure_commons.plugin_manager.is_registered(self._reservations):
+            allure_commons.plugin_manager.unregister(self._reservations)
+
+    @property
+    def stats(self) -> dict:
+        """Статистика обработанных артефактов"""
+        return {
+            'images': self.images,
+            'files': self.files,
+            'duplicates': self.duplicates,
+            'mb_in': self.bytes_in / 1024 / 1024,
+            'mb_out': self.bytes_out / 1024 / 1024,
+            'errors': self.errors,
+        }
+
+    @staticmethod
+    def _reserve(name: str, mime_type: str, extension: str):
+        """Резервирование вложения в текущем шаге Allure. Возвращает
+        None, если отчет Allure не пишется"""
+        pending = _PendingAttachment()
+        allure.attach(
+            pending, name=name, attachment_type=mime_type, extension=extension
+        )
+        return pending if pending.file_name else None
+
+    def _put(self, task: tuple, size: int):
+        """Постановка в очередь с ожиданием свободного места"""
+        with self._space:
+            # Данные крупнее всей очереди принимаются, когда она пуста
+            self._space.wait_for(
+                lambda: self._queued_bytes == 0
+                or self._queued_bytes + size <= self.max_queue_bytes
+            )
+            self._queued_bytes += size
+        self._queue.put((task, size))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+
+            task, size = item
+            try:
+                self._process(task)
+            except Exception as e:
+                self.errors += 1
+                warnings.warn(f'Ошибка обработки артефакта: {e}')
+            finally:
+                with self._space:
+                    self._queued_bytes -= size
+                    self._space.notify_all()
+                self._queue.task_done()
+
+    def _process(self, task: tuple):
+        kind, *args = task
+        if kind == 'image':
+            data, digest, pending, path = args
+            self.images += 1
+            self.bytes_in += len(data)
+            if path is not None:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                Path(path).write_bytes(data)
+            if pending is not None:
+                body = self._encode(data, digest)
+                self.bytes_out += len(body)
+                self._write_attachment(pending, body)
+        else:
+            path, pending = args
+            self.files += 1
+            body = Path(path).read_bytes()
+            self.bytes_in += len(body)
+            self.bytes_out += len(body)
+            self._write_attachment(pending, body)
+
+    def _encode(self, data: bytes, digest: str) -> bytes:
+        """Сжатие png в выбранный формат с кэшем по хэшу изображения"""
+        if self.image_format == 'png':
+            return data
+        if digest in self._encoded:
+            self._encoded.move_to_end(digest)
+            return self._encoded[digest]
+
+        with Image.open(io.BytesIO(data)) as image:
+            if self.image_format == 'jpeg':
+                image = image.convert('RGB')
+            output = io.BytesIO()
+            image.save(output, self.image_format, quality=self.quality)
+        body = output.getvalue()
+        self._encoded[digest] = body
+        if len(self._encoded) > ENCODED_CACHE_SIZE:
+            self._encoded.popitem(last=False)
+        return body
+
+    @staticmethod
+    def _write_attachment(pending: _PendingAttachment, body: bytes):
+        """Запись содержимого зарезервированного вложения"""
+        allure_commons.plugin_manager.hook.report_attached_data(
+            body=body, file_name=pending.file_name
+        )
+
+
+def configure_artifact_writer(
+    image_format: str = 'png',
+    quality: int = 80,
+    max_queue_bytes: int = 64 * 1024 * 1024,
+) -> ArtifactWriter:
+    """Создание общего для процесса обработчика артефактов
+    (создается один раз)
+
+    :param image_format: формат вложений-изображений: png, webp, jpeg
+    :param quality: качество сжатия webp и jpeg
+    :param max_queue_bytes: максимальный объем данных в очереди
+    """
+    global _shared_writer
+    if _shared_writer is None:
+        _shared_writer = ArtifactWriter(image_format, quality, max_queue_bytes)
+    return _shared_writer
+
+
+def get_artifact_writer() -> ArtifactWriter | None:
+    """Общий обработчик артефактов, если он создан"""
+    return _shared_writer
+
+
+def close_artifact_writer():
+    """Обработка оставшихся артефактов в конце сессии"""
+    global _shared_writer
+    if _shared_writer is not None:
+        _shared_writer.close()
+        _shared_writer = None
@@ -0,0 +1,161 @@
+from collections import OrderedDict
+
+from src.ui.browser.har import SKIPPED_RESPONSE_HEADERS
+
+# Типы ресурсов, ответы на которые имеет смысл кэшировать
+STATIC_RESOURCE_TYPES = ('script', 'stylesheet', 'image', 'font')
+
+DEFAULT_CONTENT_TYPES = (
+    'text/css',
+    'text/javascript',
+    'application/javascript',
+    'image/',
+    'font/',
+)
+
+_shared_cache = None
+
+
+class AssetCache:
+    """LRU-кэш статических ресурсов, общий для всех context'ов процесса
+
+    Подключается к context'у через route. Кэшируются только успешные
+    GET-ответы, чей Content-Type начинается с одного из разрешенных типов.
+    """
+
+    def __init__(
+        self, max_bytes: int, content_types: tuple = DEFAULT_CONTENT_TYPES
+    ):
+        """
+        :param max_bytes: максимальный суммарный размер тел ответов в кэше
+        :param content_types: разрешенные префиксы Content-Type
+        """
+        self.max_bytes = max_bytes
+        self.content_types = tuple(content_types)
+        self._entries = OrderedDict()
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def install(self, context):
+        """Подключение кэша к context'у
+
+        :param context: context браузера
+        """
+        context.route('**/*', self.handle_route)
+
+    async def install_async(self, context):
+        """Подключение кэша к context'у async API
+
+        :param context: context браузера
+        """
+        await context.route('**/*', self.handle_route_async)
+
+    def handle_route(self, route, request):
+        """Обработчик route'а: ответ из кэша или загрузка и сохранение"""
+        if not self._is_static(request):
+            route.fallback()
+            return
+
+        cached = self._lookup(request.url)
+        if cached is not None:
+            route.fulfill(**cached)
+            return
+
+        response = route.fetch()
+        body = response.body()
+        self._remember(request.url, response, body)
+        route.fulfill(response=response, body=body)
+
+    async def handle_route_async(self, route, request):
+        """Обработчик route'а для async API"""
+        if not self._is_static(request):
+            await route.fallback()
+            return
+
+        cached = self._lookup(request.url)
+        if cached is not None:
+            await route.fulfill(**cached)
+            return
+
+        response = await route.fetch()
+        body = await response.body()
+        self._remember(request.url, response, body)
+        await route.fulfill(response=response, body=body)
+
+    @staticmethod
+    def _is_static(request) -> bool:
+        """Проверка того, что запрос может обслуживаться кэшем"""
+        return (
+            request.method == 'GET'
+            and request.resource_type in STATIC_RESOURCE_TYPES
+        )
+
+    def _lookup(self, url: str) -> dict | None:
+        """Поиск ответа в кэше. Возвращает параметры route.fulfill"""
+        cached = self._entries.get(url)
+        if cached is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(url)
+        status, headers, body = cached
+        self.hits += 1
+        self.bytes_saved += len(body)
+        return {'status': status, 'headers': headers, 'body': body}
+
+    def _remember(self, url: str, response, body: bytes):
+        """Сохранение загруженного ответа, если его можно кэшировать"""
+        if self._is_cacheable(response, body):
+            self._store(url, response, body)
+
+    def _is_cacheable(self, response, body: bytes) -> bool:
+        """Проверка того, что ответ можно сохранить в кэш"""
+        content_type = response.headers.get('content-type', '')
+        return (
+            response.status == 200
+            and len(body) <= self.max_bytes
+            and content_type.startswith(self.content_types)
+        )
+
+    def _store(self, url: str, response, body: bytes):
+        """Сохранение ответа с вытеснением давно не использованных"""
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in SKIPPED_RESPONSE_HEADERS
+        }
+        self._entries[url] = (response.status, headers, body)
+        self.size_bytes += len(body)
+
+        while self.size_bytes > self.max_bytes:
+            _, (_, _, evicted_body) = self._entries.popitem(last=False)
+            self.size_bytes -= len(evicted_body)
+
+    @property
+    def stats(self) -> dict:
+        """Статистика использования кэша"""
+        total = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'size_bytes': self.size_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'bytes_saved': self.bytes_saved,
+        }
+
+
+def get_shared_asset_cache(
+    max_bytes: int, content_types: tuple = DEFAULT_CONTENT_TYPES
+) -> AssetCache:
+    """Получение общего для процесса кэша статики (создается один раз)
+
+    :param max_bytes: максимальный размер кэша в байтах
+    :param content_types: разрешенные префиксы Content-Type
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = AssetCache(max_bytes, content_types)
+    return _shared_cache
@@ -0,0 +1,123 @@
+"""Замер времени старта браузера для профилей запуска (launchProfiles)
+
+Каждый прогон заново запускает playwright и браузер и измеряет фазы:
+старт драйвера, запуск браузера, создание context'а со страницей
+и первый переход по URL. Пример:
+`python -m src.ui.browser.benchmark --profiles debug ci-fast --runs 5`
+"""
+
+import argparse
+import statistics
+import time
+
+from playwright.sync_api import sync_playwright
+
+from src.ui.browser.config import DEFAULT_CONFIG_PATH, load_browser_config
+from src.ui.helper.urls import get_base_url
+from src.ui.stand.server import DemoblazeStand
+
+PHASES = ('driver', 'launch', 'context', 'navigation')
+
+
+def measure_startup(config, url: str) -> dict:
+    """Один прогон: время каждой фазы старта в миллисекундах
+
+    :param config: конфигурация браузера с выбранным профилем запуска
+    :param url: адрес для первого перехода
+    """
+    timings = {}
+    started = time.perf_counter()
+
+    def lap(phase: str):
+        nonlocal started
+        now = time.perf_counter()
+        timings[phase] = (now - started) * 1000
+        started = now
+
+    playwright = sync_playwright().start()
+    lap('driver')
+    try:
+        browser_type = getattr(playwright, config.browser_type)
+        browser = browser_type.launch(**config.launch_options())
+        lap('launch')
+        try:
+            context = browser.new_context(
+                ignore_https_errors=True, **config.context_options()
+            )
+            page = context.new_page()
+            lap('context')
+            page.goto(url)
+            lap('navigation')
+        finally:
+            browser.close()
+    finally:
+        playwright.stop()
+    return timings
+
+
+def benchmark_profiles(
+    profiles: list[str], runs: int, url: str, config_path=DEFAULT_CONFIG_PATH
+) -> dict:
+    """Замер старта для каждого профиля. Возвращает медианы фаз
+
+    :param profiles: имена профилей из launchProfiles
+    :param runs: количество прогонов на профиль
+    :param url: адрес для первого перехода
+    :param config_path: путь до конфигурационного файла
+    """
+    results = {}
+    for profile in profiles:
+        config = load_browser_config(config_path, launch_profile=profile)
+        samples = [measure_startup(config, url) for _ in range(runs)]
+        results[profile] = {
+            phase: statistics.median(sample[phase] for sample in samples)
+            for phase in PHASES
+        }
+    return results
+
+
+def format_results(results: dict) -> str:
+    """Таблица медиан фаз по профилям"""
+    header = f'{"profile":<12}' + ''.join(
+        f'{phase:>12}' for phase in (*PHASES, 'total')
+    )
+    lines = [header]
+    for profile, timings in results.items():
+        values = [timings[phase] for phase in PHASES]
+        lines.append(
+            f'{profile:<12}'
+            + ''.join(f'{value:>12.0f}' for value in (*values, sum(values)))
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--profiles', nargs='+', default=['debug', 'ci-fast', 'perf']
+    )
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--config', default=DEFAULT_CONFIG_PATH)
+    parser.add_argument(
+        '--local-stand',
+        action='store_true',
+        help='Переходить на локальный стенд вместо BASE_URL',
+    )
+    args = parser.parse_args()
+
+    stand = DemoblazeStand() if args.local_stand else None
+    url = stand.start() if stand else get_base_url()
+    try:
+        results = benchmark_profiles(
+            args.profiles, args.runs, url, args.config
+        )
+    finally:
+        if stand:
+            stand.stop()
+
+    print(f'Медиана {args.runs} прогонов, мс')
+    print(format_results(results))
+
+
+if __name__ == '__main__':
+    main()
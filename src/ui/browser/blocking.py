@@ -0,0 +1,127 @@
+import re
+
+NO_BLOCKING_PROFILE = 'none'
+BLOCKED_ERROR_CODE = 'blockedbyclient'
+
+
+class BlockingProfile:
+    """Набор правил блокировки запросов
+
+    Запрос блокируется, если его тип ресурса входит в resource_types
+    или URL совпадает с одним из регулярных выражений url_patterns.
+    """
+
+    def __init__(
+        self, name: str, resource_types: list = None, url_patterns: list = None
+    ):
+        self.name = name
+        self.resource_types = frozenset(resource_types or ())
+        self._url_regex = (
+            re.compile('|'.join(f'(?:{pattern})' for pattern in url_patterns))
+            if url_patterns
+            else None
+        )
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.resource_types and self._url_regex is None
+
+    def matches(self, request) -> bool:
+        """Проверка того, что запрос нужно заблокировать"""
+        if request.resource_type in self.resource_types:
+            return True
+        return bool(self._url_regex and self._url_regex.search(request.url))
+
+
+class ResourceBlocker:
+    """Блокировка запросов по именованным профилям
+
+    Считает количество заблокированных запросов для каждого профиля,
+    всего и по типам ресурсов. Размер заблокированных ответов не
+    считается: на заблокированный запрос браузер ответа не получает.
+    """
+
+    def __init__(self, profiles: dict, default_profile: str):
+        """
+        :param profiles: профили из конфигурации {имя: {resourceTypes,
+                         urlPatterns}}
+        :param default_profile: профиль, используемый по умолчанию
+        """
+        self.profiles = {
+            NO_BLOCKING_PROFILE: BlockingProfile(NO_BLOCKING_PROFILE)
+        }
+        for name, rules in profiles.items():
+            rules = rules or {}
+            self.profiles[name] = BlockingProfile(
+                name,
+                resource_types=rules.get('resourceTypes'),
+                url_patterns=rules.get('urlPatterns'),
+            )
+
+        self.default_profile = self._get_profile(default_profile).name
+        self._blocked = {}
+
+    def install(self, context, profile_name: str = None):
+        """Подключение блокировки к context'у
+
+        :param context: context браузера
+        :param profile_name: имя профиля, по умолчанию - из конфигурации
+        """
+        profile = self._get_profile(profile_name or self.default_profile)
+        if profile.is_empty:
+            return
+
+        def handle_route(route, request):
+            if self._should_block(profile, request):
+                route.abort(BLOCKED_ERROR_CODE)
+            else:
+                route.fallback()
+
+        context.route('**/*', handle_route)
+
+    async def install_async(self, context, profile_name: str = None):
+        """Подключение блокировки к context'у async API
+
+        :param context: context браузера
+        :param profile_name: имя профиля, по умолчанию - из конфигурации
+        """
+        profile = self._get_profile(profile_name or self.default_profile)
+        if profile.is_empty:
+            return
+
+        async def handle_route(route, request):
+            if self._should_block(profile, request):
+                await route.abort(BLOCKED_ERROR_CODE)
+            else:
+                await route.fallback()
+
+        await context.route('**/*', handle_route)
+
+    def _should_block(self, profile: BlockingProfile, request) -> bool:
+        """Проверка запроса и учет заблокированных"""
+        if not profile.matches(request):
+            return False
+
+        self._count_blocked(profile.name, request.resource_type)
+        return True
+
+    def _get_profile(self, name: str) -> BlockingProfile:
+        """Получение профиля по имени"""
+        if name not in self.profiles:
+            raise ValueError(
+                f'Неизвестный профиль блокировки {name}. '
+                f'Доступные значения: {", ".join(self.profiles)}'
+            )
+        return self.profiles[name]
+
+    def _count_blocked(self, profile_name: str, resource_type: str):
+        """Учет заблокированного запроса"""
+        stats = self._blocked.setdefault(profile_name, {'requests': 0})
+        stats['requests'] += 1
+        stats[resource_type] = stats.get(resource_type, 0) + 1
+
+    @property
+    def stats(self) -> dict:
+        """Количество заблокированных запросов по профилям: всего
+        и по типам ресурсов"""
+        return {name: dict(stats) for name, stats in self._blocked.items()}
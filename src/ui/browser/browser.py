@@ -1,5 +1,19 @@
-import allure
-from playwright.sync_api import Page, Cookie
+from contextlib import ExitStack, contextmanager
+
+from playwright.sync_api import (
+    Page,
+    Cookie,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+from src.ui.browser.artifacts import get_artifact_writer
+from src.ui.helper.page_metrics import (
+    PAGE_METRICS_SCRIPT,
+    VITALS_WAIT_MSEC,
+    get_page_metrics,
+)
+from src.ui.helper.steps import step
+from src.ui.helper.timeouts import DEFAULT_SYNC_TIMEOUT_MSEC
 
 
 class Browser:
@@ -14,25 +28,99 @@ class Browser:
         :param url: адрес страницы
         """
 
-        with allure.step(f'Переход на страницу: {url}'):
-            return self.page.goto(url)
+        with step('Переход на страницу: {}', url):
+            response = self.page.goto(url)
+            if get_page_metrics() is not None:
+                self._record_page_metrics(url)
+            return response
+
+    @contextmanager
+    def measure_page_load(self, name: str):
+        """Сбор метрик загрузки для перехода внутри SPA без перезагрузки
+        страницы (например, смены раздела каталога) в блоке with.
+        Метрики собираются, только если включена опция --page-metrics
+
+        :param name: название перехода в отчете
+        """
+
+        if get_page_metrics() is None:
+            yield
+            return
+
+        with step('Замер загрузки: {}', name):
+            since = self.page.evaluate('performance.now()')
+            yield
+            self._record_page_metrics(name, since)
+
+    def get_page_load_metrics(self, since: float = 0) -> dict:
+        """Получение метрик загрузки страницы: Navigation Timing, FCP,
+        LCP, CLS, количество ресурсов и переданный объем данных
+
+        :param since: момент начала перехода внутри SPA
+                      (performance.now()), 0 - загрузка страницы целиком
+        """
+
+        with step('Получение метрик загрузки страницы', read=True):
+            return self.page.evaluate(
+                PAGE_METRICS_SCRIPT, [since, VITALS_WAIT_MSEC]
+            )
+
+    def _record_page_metrics(self, name: str, since: float = 0):
+        """Сохранение метрик загрузки в отчет сессии и Allure"""
+        metrics = self.get_page_load_metrics(since)
+        get_page_metrics().record(name, self.page.url, metrics)
+
+    @contextmanager
+    def wait_for_responses(
+        self, *url_parts: str, timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC
+    ):
+        """Ожидание ответов сервера на действия внутри блока with
+
+        Возвращает список EventInfo, из которых можно получить ответы
+        после выхода из блока
+
+        :param url_parts: части URL ожидаемых ответов (напр. '/viewcart')
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with step('Ожидание ответов сервера: {}', ', '.join(url_parts)):
+            action_failed = True
+            try:
+                with ExitStack() as stack:
+                    response_infos = [
+                        stack.enter_context(
+                            self.page.expect_response(
+                                url_contains(url_part), timeout=timeout_msec
+                            )
+                        )
+                        for url_part in url_parts
+                    ]
+                    yield response_infos
+                    action_failed = False
+            except PlaywrightTimeoutError:
+                if action_failed:
+                    raise
+                raise AssertionError(
+                    f'Не получены ответы сервера {", ".join(url_parts)} '
+                    f'за {timeout_msec} мс'
+                ) from None
 
     def reload_page(self):
         """Перезагрузка страницы"""
 
-        with allure.step('Обновление страницы'):
+        with step('Обновление страницы'):
             return self.page.reload()
 
     def get_current_url(self) -> str:
         """Получение URL текущей страницы."""
 
-        with allure.step('Получение URL страницы'):
+        with step('Получение URL страницы', read=True):
             return self.page.url
 
     def get_cookies(self) -> list[Cookie]:
         """Получение cookies страницы"""
 
-        with allure.step('Получение cookies страницы'):
+        with step('Получение cookies страницы', read=True):
             return self.page.context.cookies()
 
     def add_cookies(self, cookies: Cookie):
@@ -41,7 +129,7 @@ class Browser:
         :param cookies: список кук
         """
 
-        with allure.step('Добавление cookies'):
+        with step('Добавление cookies'):
             return self.page.context.add_cookies(list(cookies))
 
     def close_tab(self, tab_number: int):
@@ -50,7 +138,7 @@ class Browser:
         :param tab_number: номер вкладки, которую нужно закрыть (начиная с 0)
         """
 
-        with allure.step(f'Закрытие вкладки под номером {tab_number}'):
+        with step('Закрытие вкладки под номером {}', tab_number):
             all_tabs = self.page.context.pages
             all_tabs[tab_number].close()
 
@@ -62,8 +150,8 @@ class Browser:
         (начиная с 0)
         """
 
-        with allure.step(
-            f'Переключение на вкладку {tab_number} и закрытие других вкладок'
+        with step(
+            'Переключение на вкладку {} и закрытие других вкладок', tab_number
         ):
             all_tabs = self.page.context.pages
             tab_to_switch = all_tabs[tab_number]
@@ -74,7 +162,7 @@ class Browser:
     def close_all_tabs_except_first(self):
         """Закрытие всех страниц, кроме первой"""
 
-        with allure.step('Закрытие всех страниц, кроме первой'):
+        with step('Закрытие всех страниц, кроме первой'):
             all_tabs = self.page.context.pages
             for page in range(1, len(all_tabs)):
                 all_tabs[page].close()
@@ -89,7 +177,7 @@ class Browser:
                                          на который нужно кликнут
         """
 
-        with allure.step('Переход на iframe и клик по элементу внутри него'):
+        with step('Переход на iframe и клик по элементу внутри него'):
             iframe = self.page.frame_locator(iframe_locator)
             iframe.locator(element_to_click_locator).click()
 
@@ -104,7 +192,7 @@ class Browser:
         :param text: текст для ввода
         """
 
-        with allure.step(f'Переход на iframe и ввод текста "{text}"'):
+        with step('Переход на iframe и ввод текста "{}"', text):
             iframe = self.page.frame_locator(iframe_locator)
             iframe.locator(field_locator).fill(text)
 
@@ -114,25 +202,25 @@ class Browser:
         :param iframe_index: индекс iframe
         """
 
-        with allure.step(f'Получение iframe с индексом {iframe_index}'):
+        with step('Получение iframe с индексом {}', iframe_index, read=True):
             return self.page.main_frame.child_frames[iframe_index]
 
     def switch_to_main_iframe(self):
         """Переключение на основной iframe"""
 
-        with allure.step('Переключение на основной iframe'):
+        with step('Переключение на основной iframe', read=True):
             return self.page.main_frame
 
     def alert_accept(self):
         """Принятие диалогового окна (нажатие OK)"""
 
-        with allure.step('Принятие диалогового окна (нажатие OK)'):
+        with step('Принятие диалогового окна (нажатие OK)'):
             self.page.on('dialog', lambda dialog: dialog.accept())
 
     def scroll_down(self):
         """Скролл вниз страницы"""
 
-        with allure.step('Прокрутка вниз страницы'):
+        with step('Прокрутка вниз страницы'):
             self.page.evaluate(
                 'window.scrollTo(0, document.body.scrollHeight)'
             )
@@ -144,8 +232,16 @@ class Browser:
                             (например: screenshots/image1.png)
         """
 
-        with allure.step('Сохранение скриншота страницы'):
-            return self.page.screenshot(path=path_to_save)
+        with step('Сохранение скриншота страницы'):
+            artifacts = get_artifact_writer()
+            if artifacts is None:
+                return self.page.screenshot(path=path_to_save)
+
+            # Файл записывается сразу и доступен после возврата,
+            # в фоновом потоке только сжатие и вложение в отчет
+            screenshot = self.page.screenshot(path=path_to_save)
+            artifacts.save_image(screenshot, 'Скриншот страницы')
+            return screenshot
 
     def execute_javascript(self, script: str):
         """Выполнение javascript на странице
@@ -153,7 +249,7 @@ class Browser:
         :param script: код js-скрипта
         """
 
-        with allure.step('Выполнение действий с помощью кода на javascript'):
+        with step('Выполнение действий с помощью кода на javascript'):
             return self.page.evaluate(script)
 
     def assert_file_is_downloaded(self):
@@ -162,7 +258,7 @@ class Browser:
         with self.page.expect_download() as download_info:
             downloaded_file = download_info.value
 
-            with allure.step('Проверка загрузки файла'):
+            with step('Проверка загрузки файла'):
                 assert (
                     downloaded_file.path() != ''
                 ), 'Downloaded file not found.'
@@ -173,5 +269,10 @@ class Browser:
         :param keys: строка с клавишей или сочетанием клавиш
         """
 
-        with allure.step(f'Нажатие клавиш(и) {keys}'):
+        with step('Нажатие клавиш(и) {}', keys):
             self.page.keyboard.press(keys)
+
+
+def url_contains(url_part: str):
+    """Предикат для expect_response: URL ответа содержит указанную часть"""
+    return lambda response: url_part in response.url
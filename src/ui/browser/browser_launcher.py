@@ -1,76 +1,145 @@
-import json
-import os
-
-import yaml
 from playwright.sync_api import sync_playwright
 
+from src.ui.browser.config import BrowserConfig
+from src.ui.browser.launcher_base import LauncherBase, is_connected
 
-class BrowserLauncher:
-    """Инициализация браузера, запуск playwright, создание context'а"""
-
-    def __init__(self, local_browser_config_path: str = None):
-        self.config = None
-        self._load_config(local_browser_config_path)
-        self.browser = None
-        self.playwright = sync_playwright().start()
-        self._launch()
 
-    def _load_config(self, config_path: str):
-        """Загрузка конфигурации из .yaml-файла
+class BrowserLauncher(LauncherBase):
+    """Инициализация браузера, запуск playwright, создание context'а"""
 
-        param: config_path: путь до конфигурационного файла
+    def __init__(
+        self,
+        local_browser_config_path: str = None,
+        har_mode: str = None,
+        config: BrowserConfig = None,
+        playwright=None,
+    ):
         """
-        try:
-            with open(config_path) as config_file:
-                self.config = yaml.safe_load(config_file)
-        except Exception as e:
-            raise RuntimeError(f'Ошибка загрузки конфигурационного файла {e}')
+        :param local_browser_config_path: путь до конфигурационного файла
+        :param har_mode: режим HAR, переопределяющий значение из конфигурации
+        :param config: уже загруженная конфигурация
+        :param playwright: уже запущенный playwright, общий для нескольких
+                           launcher'ов. Такой playwright не останавливается
+                           в close()
+        """
+        super().__init__(local_browser_config_path, har_mode, config)
+        self._owns_playwright = playwright is None
+        self.playwright = playwright or sync_playwright().start()
+        self._launch()
 
     def _launch(self):
-        """Подготовка браузера с заданной в .yaml-файле конфигурацией"""
-        browser_type_name = self.config.get('browserType')
-        launch_options = self.config.get('launch', {}).copy()
-        use_system_browser = self.config.get('useSystemBrowser', False)
-
-        if not use_system_browser:
-            launch_options.pop('channel', None)
-
-        if browser_type_name == 'chromium':
-            browser_type = self.playwright.chromium
-        elif browser_type_name == 'firefox':
-            browser_type = self.playwright.firefox
+        """Подготовка браузера с заданной в .yaml-файле конфигурацией.
+        Если указаны удаленные браузеры, подключение к ним выполняется
+        при создании context'ов. Если включен демон, выполняется
+        подключение к его браузеру"""
+        browser_type, launch_options = self._get_browser_type(self.playwright)
+        self.remote = self._create_remote_pool(browser_type, launch_options)
+        if self.remote:
+            return
+
+        if self.daemon:
+            endpoint = self.daemon.ensure_running(launch_options)
+            self.browser = browser_type.connect_over_cdp(endpoint)
         else:
-            raise ValueError(f'Неизвестный тип браузера {browser_type_name}')
+            self.browser = browser_type.launch(**launch_options)
+        self.browser_launches += 1
 
-        self.browser = browser_type.launch(**launch_options)
+    def _ensure_browser(self):
+        """Перезапуск браузера, если он был закрыт или упал"""
+        if self._needs_launch():
+            self._launch()
 
     def _create_context(self, **kwargs):
         """Создание объекта context
 
         :param kwargs: дополнительные параметры для конфигурации браузера
         """
-        context_params = {'ignore_https_errors': True}
-        if self.config.get('context'):
-            context_params.update(self.config['context'])
-
-        if os.path.exists('state.json'):
-            with open('state.json') as state_file:
-                context_params['storage_state'] = json.load(state_file)
-
-        all_context_params = {**context_params, **kwargs}
-        context = self.browser.new_context(**all_context_params)
+        all_context_params, har_params = self._get_context_params(**kwargs)
+        if self.remote:
+            context = self.remote.new_context(**all_context_params)
+        else:
+            context = self.browser.new_context(**all_context_params)
+        self.har.register_context(context, har_params)
+        if self.asset_cache:
+            self.asset_cache.install(context)
+        if self.tracing:
+            self.tracing.start(context)
         return context
 
-    def create_page(self, **kwargs):
+    def create_page(
+        self, test_name: str = None, blocking_profile: str = None, **kwargs
+    ):
         """Создание объекта page
 
-        :param kwargs: дополнительные параметры
+        :param test_name: имя теста, для которого создается страница
+        :param blocking_profile: профиль блокировки ресурсов,
+                                 по умолчанию - из конфигурации
+        :param kwargs: дополнительные параметры для конфигурации context'а
+        """
+        slot = None
+        if self.page_slots:
+            slot = self.page_slots.acquire()
+        try:
+            self._ensure_browser()
+            context = self._create_context(**kwargs)
+            self.har.attach(context, test_name)
+            self.blocker.install(context, blocking_profile)
+            page = context.new_page()
+            if self.tracing:
+                self.tracing.start_chunk(context, test_name)
+        except Exception:
+            if slot is not None:
+                self.page_slots.release(slot)
+            raise
+
+        self._hold_slot(page, slot)
+        self.tests_run += 1
+        return page
+
+    def close_page(
+        self, page, test_name: str = None, keep_trace: bool = False
+    ):
+        """Закрытие context'а страницы. Если браузер не переиспользуется
+        между тестами (reuseBrowser: false), он тоже закрывается
+
+        :param page: объект page, созданный через create_page
+        :param test_name: имя теста, для которого создавалась страница
+        :param keep_trace: сохранить трассу теста (тест упал
+                           или будет перезапущен)
         """
-        context = self._create_context(**kwargs)
-        return context.new_page()
+        context = page.context
+        self._sample_rss()
+        try:
+            if self.tracing and is_connected(context):
+                self.tracing.stop_chunk(context, test_name, keep_trace)
+            self._close_context(context)
+        finally:
+            self._release_slot(page)
+            self.har.collect(context, test_name)
+
+    def _close_context(self, context):
+        """Закрытие context'а и, если нужно, браузера"""
+        try:
+            if is_connected(context):
+                context.close()
+        finally:
+            if not self.reuse_browser and not self.remote:
+                self._close_browser()
+
+    def _close_browser(self):
+        """Закрытие браузера, если он еще запущен, и отключение
+        от удаленных браузеров. Браузер демона не закрывается,
+        а только отключается"""
+        for browser in self._detach_browsers():
+            browser.close()
+        if self.daemon:
+            self.daemon.touch()
 
     def close(self):
         """Закрытие браузера и остановка playwright"""
-        if self.browser:
-            self.browser.close()
-        self.playwright.stop()
+        try:
+            self._close_browser()
+            self.har.close()
+        finally:
+            if self._owns_playwright:
+                self.playwright.stop()
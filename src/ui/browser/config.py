@@ -0,0 +1,609 @@
+import json
+import os
+import re
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
+
+import yaml
+
+from src.ui.browser.artifacts import IMAGE_FORMATS
+from src.ui.browser.asset_cache import DEFAULT_CONTENT_TYPES
+from src.ui.browser.blocking import NO_BLOCKING_PROFILE
+from src.ui.browser.daemon import DEFAULT_IDLE_TIMEOUT_SEC
+from src.ui.browser.har import HAR_MODES, HAR_SCOPES
+from src.ui.browser.remote import DEFAULT_RETRY_AFTER_SEC
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / 'config_browser.yaml'
+STORAGE_STATE_PATH = 'state.json'
+BROWSER_TYPES = ('chromium', 'firefox', 'webkit')
+
+# Переменные окружения, переопределяющие значения из .yaml-файла
+ENV_OVERRIDES = {
+    'headless': 'BROWSER_HEADLESS',
+    'browser_type': 'BROWSER_TYPE',
+    'slow_mo': 'BROWSER_SLOW_MO',
+    'viewport': 'BROWSER_VIEWPORT',
+    'launch_profile': 'BROWSER_LAUNCH_PROFILE',
+    'engines': 'BROWSER_ENGINES',
+    'tracing': 'BROWSER_TRACING',
+}
+
+TOP_LEVEL_KEYS = (
+    'browserType',
+    'engines',
+    'useSystemBrowser',
+    'reuseBrowser',
+    'maxLivePages',
+    'launch',
+    'launchProfile',
+    'launchProfiles',
+    'context',
+    'daemon',
+    'remote',
+    'contextPool',
+    'har',
+    'tracing',
+    'artifacts',
+    'assetCache',
+    'blocking',
+)
+
+
+@dataclass(frozen=True)
+class HarConfig:
+    mode: str = 'off'
+    scope: str = 'shared'
+    dir: str = 'har'
+
+
+@dataclass(frozen=True)
+class TracingConfig:
+    enabled: bool = False
+    screenshots: bool = True
+    snapshots: bool = True
+    sources: bool = False
+    dir: str = 'traces'
+    max_total_mb: float = 500
+
+
+@dataclass(frozen=True)
+class ArtifactsConfig:
+    enabled: bool = True
+    image_format: str = 'png'
+    quality: int = 80
+    max_queue_mb: float = 64
+
+
+@dataclass(frozen=True)
+class AssetCacheConfig:
+    enabled: bool = False
+    max_size_mb: float = 100
+    content_types: tuple = DEFAULT_CONTENT_TYPES
+
+
+@dataclass(frozen=True)
+class BlockingConfig:
+    profile: str = NO_BLOCKING_PROFILE
+    profiles: Mapping = field(default_factory=lambda: MappingProxyType({}))
+
+
+@dataclass(frozen=True)
+class DaemonConfig:
+    enabled: bool = False
+    idle_timeout_sec: int = DEFAULT_IDLE_TIMEOUT_SEC
+
+
+@dataclass(frozen=True)
+class RemoteConfig:
+    endpoints: tuple = ()
+    retry_after_sec: float = DEFAULT_RETRY_AFTER_SEC
+
+
+@dataclass(frozen=True)
+class BrowserConfig:
+    """Проверенная конфигурация браузера из config_browser.yaml
+
+    Неизменяемая: вложенные словари и списки хранятся как
+    MappingProxyType и tuple. Для передачи в playwright используются
+    launch_options() и context_options(), возвращающие копии.
+    """
+
+    browser_type: str = 'chromium'
+    engines: tuple = ()
+    use_system_browser: bool = False
+    reuse_browser: bool = True
+    max_live_pages: int | str = 0
+    launch: Mapping = field(default_factory=lambda: MappingProxyType({}))
+    launch_profile: str | None = None
+    launch_profiles: Mapping = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    context: Mapping = field(default_factory=lambda: MappingProxyType({}))
+    context_pool_size: int = 0
+    har: HarConfig = HarConfig()
+    tracing: TracingConfig = TracingConfig()
+    artifacts: ArtifactsConfig = ArtifactsConfig()
+    asset_cache: AssetCacheConfig = AssetCacheConfig()
+    blocking: BlockingConfig = BlockingConfig()
+    daemon: DaemonConfig = DaemonConfig()
+    remote: RemoteConfig = RemoteConfig()
+    storage_state: Mapping | None = None
+
+    @property
+    def matrix_engines(self) -> tuple:
+        """Движки, на которых запускается каждый тест. Без матрицы
+        (engines не заданы) - только browserType"""
+        return self.engines or (self.browser_type,)
+
+    def for_engine(self, engine: str) -> 'BrowserConfig':
+        """Конфигурация для одного движка матрицы. Демон браузера
+        поддерживает только chromium, для остальных движков он
+        не используется"""
+        daemon = self.daemon if engine == 'chromium' else DaemonConfig()
+        return replace(self, browser_type=engine, engines=(), daemon=daemon)
+
+    def launch_options(self) -> dict:
+        """Параметры запуска браузера для playwright. channel и args
+        относятся к chromium и для других движков не передаются"""
+        launch_options = _thaw(self.launch)
+        if not self.use_system_browser or self.browser_type != 'chromium':
+            launch_options.pop('channel', None)
+        if self.browser_type != 'chromium':
+            launch_options.pop('args', None)
+        return launch_options
+
+    def context_options(self) -> dict:
+        """Параметры context'а для playwright, включая storage state"""
+        context_options = _thaw(self.context)
+        if self.storage_state is not None:
+            context_options['storage_state'] = _thaw(self.storage_state)
+        return context_options
+
+
+def load_browser_config(
+    config_path: str | Path = DEFAULT_CONFIG_PATH, **overrides
+) -> BrowserConfig:
+    """Загрузка и проверка конфигурации. Файл читается один раз
+    на процесс для каждого набора переопределений
+
+    :param config_path: путь до конфигурационного файла
+    :param overrides: переопределения headless, browser_type, slow_mo,
+                      viewport ('1280x720'), launch_profile,
+                      engines ('chromium,webkit'), tracing;
+                      None - значение из файла
+    """
+    overrides = {
+        name: value for name, value in overrides.items() if value is not None
+    }
+    return _load_browser_config(
+        str(Path(config_path).resolve()), tuple(sorted(overrides.items()))
+    )
+
+
+def get_env_overrides(environ: Mapping = os.environ) -> dict:
+    """Получение переопределений из переменных окружения
+    BROWSER_HEADLESS, BROWSER_TYPE, BROWSER_SLOW_MO, BROWSER_VIEWPORT,
+    BROWSER_LAUNCH_PROFILE, BROWSER_ENGINES, BROWSER_TRACING"""
+    return {
+        name: environ[variable]
+        for name, variable in ENV_OVERRIDES.items()
+        if environ.get(variable)
+    }
+
+
+def get_overrides(options: Mapping, environ: Mapping = os.environ) -> dict:
+    """Получение переопределений из окружения и командной строки.
+    Опции командной строки важнее переменных окружения, а те - значений
+    из .yaml-файла
+
+    :param options: значения опций командной строки по именам
+                    из ENV_OVERRIDES, None - опция не указана
+    :param environ: переменные окружения
+    """
+    overrides = get_env_overrides(environ)
+    for name in ENV_OVERRIDES:
+        if options.get(name) is not None:
+            overrides[name] = options[name]
+    return overrides
+
+
+@lru_cache
+def _load_browser_config(config_path: str, overrides: tuple) -> BrowserConfig:
+    try:
+        with open(config_path) as config_file:
+            raw_config = yaml.safe_load(config_file) or {}
+    except OSError as e:
+        raise ValueError(f'Не удалось прочитать {config_path}: {e}') from e
+    except yaml.YAMLError as e:
+        raise ValueError(f'Ошибка синтаксиса YAML в {config_path}: {e}') from e
+
+    try:
+        config = _parse_config(raw_config)
+        config = _apply_overrides(config, dict(overrides))
+    except ValueError as e:
+        raise ValueError(f'{Path(config_path).name}: {e}') from None
+    return replace(config, storage_state=_load_storage_state())
+
+
+def _parse_config(raw: dict) -> BrowserConfig:
+    _check_mapping(raw, '')
+    _check_keys(raw, TOP_LEVEL_KEYS, '')
+
+    tracing = _section(raw, 'tracing')
+    _check_keys(
+        tracing,
+        (
+            'enabled',
+            'screenshots',
+            'snapshots',
+            'sources',
+            'dir',
+            'maxTotalMb',
+        ),
+        'tracing',
+    )
+    artifacts = _section(raw, 'artifacts')
+    _check_keys(
+        artifacts,
+        ('enabled', 'imageFormat', 'quality', 'maxQueueMb'),
+        'artifacts',
+    )
+    har = _section(raw, 'har')
+    _check_keys(har, ('mode', 'scope', 'dir'), 'har')
+    # YAML превращает значение off без кавычек в False
+    if har.get('mode') is False:
+        har = {**har, 'mode': 'off'}
+    cache = _section(raw, 'assetCache')
+    _check_keys(cache, ('enabled', 'maxSizeMb', 'contentTypes'), 'assetCache')
+    blocking = _section(raw, 'blocking')
+    _check_keys(blocking, ('profile', 'profiles'), 'blocking')
+    daemon = _section(raw, 'daemon')
+    _check_keys(daemon, ('enabled', 'idleTimeoutSec'), 'daemon')
+    remote = _section(raw, 'remote')
+    _check_keys(remote, ('endpoints', 'retryAfterSec'), 'remote')
+    context_pool = _section(raw, 'contextPool')
+    _check_keys(context_pool, ('size',), 'contextPool')
+
+    launch_profiles = _get(raw, 'launchProfiles', dict, {})
+    for name, options in launch_profiles.items():
+        _check_mapping(options or {}, f'launchProfiles.{name}')
+    launch_profile = raw.get('launchProfile')
+    if launch_profile is not None:
+        _get_choice(raw, 'launchProfile', tuple(launch_profiles), None)
+
+    max_live_pages = raw.get('maxLivePages', 0)
+    if max_live_pages != 'auto':
+        max_live_pages = _get(raw, 'maxLivePages', int, 0, minimum=0)
+
+    return BrowserConfig(
+        browser_type=_get_choice(raw, 'browserType', BROWSER_TYPES, None),
+        engines=_parse_engines(raw.get('engines') or [], 'engines'),
+        use_system_browser=_get(raw, 'useSystemBrowser', bool, False),
+        reuse_browser=_get(raw, 'reuseBrowser', bool, True),
+        max_live_pages=max_live_pages,
+        launch=_freeze(_section(raw, 'launch')),
+        launch_profile=launch_profile,
+        launch_profiles=_freeze(
+            {name: options or {} for name, options in launch_profiles.items()}
+        ),
+        context=_freeze(_section(raw, 'context')),
+        context_pool_size=_get(
+            context_pool, 'size', int, 0, 'contextPool', minimum=0
+        ),
+        har=HarConfig(
+            mode=_get_choice(har, 'mode', HAR_MODES, 'off', 'har'),
+            scope=_get_choice(har, 'scope', HAR_SCOPES, 'shared', 'har'),
+            dir=_get(har, 'dir', str, 'har', 'har'),
+        ),
+        tracing=TracingConfig(
+            enabled=_get(tracing, 'enabled', bool, False, 'tracing'),
+            screenshots=_get(tracing, 'screenshots', bool, True, 'tracing'),
+            snapshots=_get(tracing, 'snapshots', bool, True, 'tracing'),
+            sources=_get(tracing, 'sources', bool, False, 'tracing'),
+            dir=_get(tracing, 'dir', str, 'traces', 'tracing'),
+            max_total_mb=_get(
+                tracing, 'maxTotalMb', (int, float), 500, 'tracing', minimum=0
+            ),
+        ),
+        artifacts=ArtifactsConfig(
+            enabled=_get(artifacts, 'enabled', bool, True, 'artifacts'),
+            image_format=_get_choice(
+                artifacts, 'imageFormat', IMAGE_FORMATS, 'png', 'artifacts'
+            ),
+            quality=_get(
+                artifacts, 'quality', int, 80, 'artifacts', minimum=1
+            ),
+            max_queue_mb=_get(
+                artifacts,
+                'maxQueueMb',
+                (int, float),
+                64,
+                'artifacts',
+                minimum=1,
+            ),
+        ),
+        asset_cache=AssetCacheConfig(
+            enabled=_get(cache, 'enabled', bool, False, 'assetCache'),
+            max_size_mb=_get(
+                cache, 'maxSizeMb', (int, float), 100, 'assetCache', minimum=0
+            ),
+            content_types=tuple(
+                _get_list(
+                    cache,
+                    'contentTypes',
+                    DEFAULT_CONTENT_TYPES,
+                    'assetCache',
+                )
+            ),
+        ),
+        blocking=_parse_blocking(blocking),
+        daemon=DaemonConfig(
+            enabled=_get(daemon, 'enabled', bool, False, 'daemon'),
+            idle_timeout_sec=_get(
+                daemon,
+                'idleTimeoutSec',
+                int,
+                DEFAULT_IDLE_TIMEOUT_SEC,
+                'daemon',
+                minimum=1,
+            ),
+        ),
+        remote=RemoteConfig(
+            endpoints=tuple(_get_list(remote, 'endpoints', (), 'remote')),
+            retry_after_sec=_get(
+                remote,
+                'retryAfterSec',
+                (int, float),
+                DEFAULT_RETRY_AFTER_SEC,
+                'remote',
+                minimum=0,
+            ),
+        ),
+    )
+
+
+def _parse_blocking(blocking: dict) -> BlockingConfig:
+    profiles = _get(blocking, 'profiles', dict, {}, 'blocking')
+    for name, rules in profiles.items():
+        path = f'blocking.profiles.{name}'
+        rules = rules or {}
+        _check_mapping(rules, path)
+        _check_keys(rules, ('resourceTypes', 'urlPatterns'), path)
+        _get_list(rules, 'resourceTypes', (), path)
+        for pattern in _get_list(rules, 'urlPatterns', (), path):
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(
+                    f'{path}.urlPatterns: неверное регулярное выражение '
+                    f'{pattern!r}: {e}'
+                ) from None
+
+    profile = _get(blocking, 'profile', str, NO_BLOCKING_PROFILE, 'blocking')
+    available = (NO_BLOCKING_PROFILE, *profiles)
+    if profile not in available:
+        raise ValueError(
+            f'blocking.profile: неизвестный профиль {profile!r}, '
+            f'доступные значения: {", ".join(available)}'
+        )
+    return BlockingConfig(profile=profile, profiles=_freeze(profiles))
+
+
+def _apply_overrides(config: BrowserConfig, overrides: dict) -> BrowserConfig:
+    """Применение переопределений из окружения и командной строки"""
+    launch = _thaw(config.launch)
+    context = _thaw(config.context)
+    browser_type = config.browser_type
+
+    launch_profile = overrides.get('launch_profile', config.launch_profile)
+    if launch_profile is not None:
+        if launch_profile not in config.launch_profiles:
+            raise ValueError(
+                f'launch_profile: неизвестный профиль {launch_profile!r}, '
+                f'доступные значения: {", ".join(config.launch_profiles)}'
+            )
+        launch = _merge_launch_options(
+            launch, _thaw(config.launch_profiles[launch_profile])
+        )
+
+    if 'browser_type' in overrides:
+        browser_type = overrides['browser_type']
+        if browser_type not in BROWSER_TYPES:
+            raise ValueError(
+                f'browser_type: ожидается одно из '
+                f'{", ".join(BROWSER_TYPES)}, получено {browser_type!r}'
+            )
+    engines = config.engines
+    tracing = config.tracing
+    if 'tracing' in overrides:
+        tracing = replace(
+            tracing, enabled=_parse_bool(overrides['tracing'], 'tracing')
+        )
+    if 'engines' in overrides:
+        engines = _parse_engines(overrides['engines'].split(','), 'engines')
+    if 'headless' in overrides:
+        launch['headless'] = _parse_bool(overrides['headless'], 'headless')
+    if 'slow_mo' in overrides:
+        launch['slow_mo'] = _parse_number(overrides['slow_mo'], 'slow_mo')
+    if 'viewport' in overrides:
+        context.pop('no_viewport', None)
+        context['viewport'] = _parse_viewport(overrides['viewport'])
+
+    return replace(
+        config,
+        browser_type=browser_type,
+        engines=engines,
+        tracing=tracing,
+        launch_profile=launch_profile,
+        launch=_freeze(launch),
+        context=_freeze(context),
+    )
+
+
+def _merge_launch_options(launch: dict, profile: dict) -> dict:
+    """Наложение профиля запуска на общие параметры launch.
+    Аргументы командной строки браузера объединяются"""
+    args = [*launch.get('args', []), *profile.get('args', [])]
+    merged = {**launch, **profile}
+    if args:
+        merged['args'] = args
+    return merged
+
+
+def _load_storage_state() -> Mapping | None:
+    """Однократная загрузка сохраненной авторизации из state.json"""
+    if not os.path.exists(STORAGE_STATE_PATH):
+        return None
+    try:
+        with open(STORAGE_STATE_PATH) as state_file:
+            return _freeze(json.load(state_file))
+    except (OSError, ValueError) as e:
+        raise ValueError(f'Ошибка чтения {STORAGE_STATE_PATH}: {e}') from e
+
+
+def _section(raw: dict, key: str) -> dict:
+    section = raw.get(key) or {}
+    _check_mapping(section, key)
+    return section
+
+
+def _get(
+    section: dict,
+    key: str,
+    expected_type,
+    default,
+    path: str = '',
+    minimum=None,
+):
+    """Получение значения с проверкой типа и минимального значения"""
+    full_key = f'{path}.{key}' if path else key
+    value = section.get(key, default)
+    # bool - подкласс int, но в числовых полях не допускается
+    is_bool = isinstance(value, bool) and expected_type is not bool
+    if is_bool or not isinstance(value, expected_type):
+        type_names = (
+            ', '.join(t.__name__ for t in expected_type)
+            if isinstance(expected_type, tuple)
+            else expected_type.__name__
+        )
+        raise ValueError(
+            f'{full_key}: ожидается {type_names}, получено {value!r}'
+        )
+    if minimum is not None and value < minimum:
+        raise ValueError(
+            f'{full_key}: значение должно быть не меньше {minimum}, '
+            f'получено {value!r}'
+        )
+    return value
+
+
+def _get_choice(
+    section: dict, key: str, choices: tuple, default, path: str = ''
+):
+    full_key = f'{path}.{key}' if path else key
+    value = section.get(key, default)
+    if value not in choices:
+        raise ValueError(
+            f'{full_key}: ожидается одно из {", ".join(choices)}, '
+            f'получено {value!r}'
+        )
+    return value
+
+
+def _get_list(section: dict, key: str, default, path: str) -> list:
+    full_key = f'{path}.{key}'
+    value = section.get(key, default)
+    if not isinstance(value, (list, tuple)) or not all(
+        isinstance(item, str) for item in value
+    ):
+        raise ValueError(
+            f'{full_key}: ожидается список строк, получено {value!r}'
+        )
+    return list(value)
+
+
+def _parse_engines(value, key: str) -> tuple:
+    """Проверка списка движков матрицы, повторы отбрасываются"""
+    if not isinstance(value, (list, tuple)):
+        raise ValueError(f'{key}: ожидается список, получено {value!r}')
+    engines = tuple(dict.fromkeys(str(item).strip() for item in value))
+    unknown = [engine for engine in engines if engine not in BROWSER_TYPES]
+    if unknown:
+        raise ValueError(
+            f'{key}: ожидается одно из {", ".join(BROWSER_TYPES)}, '
+            f'получено {", ".join(map(repr, unknown))}'
+        )
+    return engines
+
+
+def _check_mapping(value, path: str):
+    if not isinstance(value, dict):
+        raise ValueError(
+            f'{path or "конфигурация"}: ожидается словарь, '
+            f'получено {value!r}'
+        )
+
+
+def _check_keys(section: dict, allowed: tuple, path: str):
+    unknown = [key for key in section if key not in allowed]
+    if unknown:
+        prefix = f'{path}.' if path else ''
+        raise ValueError(
+            f'{prefix}{unknown[0]}: неизвестный ключ, '
+            f'доступные значения: {", ".join(allowed)}'
+        )
+
+
+def _parse_bool(value, name: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    normalized = str(value).strip().lower()
+    if normalized in ('1', 'true', 'yes', 'on'):
+        return True
+    if normalized in ('0', 'false', 'no', 'off'):
+        return False
+    raise ValueError(f'{name}: ожидается true или false, получено {value!r}')
+
+
+def _parse_number(value, name: str) -> float:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f'{name}: ожидается число, получено {value!r}'
+        ) from None
+    if number < 0:
+        raise ValueError(f'{name}: значение не может быть отрицательным')
+    return number
+
+
+def _parse_viewport(value) -> dict:
+    match = re.fullmatch(r'\s*(\d+)\s*[xX]\s*(\d+)\s*', str(value))
+    if not match:
+        raise ValueError(
+            f'viewport: ожидается значение вида 1280x720, получено {value!r}'
+        )
+    return {'width': int(match.group(1)), 'height': int(match.group(2))}
+
+
+def _freeze(value):
+    """Преобразование вложенных словарей и списков в неизменяемые"""
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {key: _freeze(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value):
+    """Копия неизменяемой структуры в виде обычных dict и list"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
@@ -0,0 +1,283 @@
+"""Фоновый процесс, держащий браузер запущенным между запусками pytest
+
+Запуск вручную не нужен: BrowserLauncher сам стартует демона, если он
+включен в конфигурации (daemon.enabled), и подключается к браузеру по
+CDP. Остановка: `python -m src.ui.browser.daemon stop`
+"""
+
+import argparse
+import getpass
+import hashlib
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from contextlib import contextmanager
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+from src.ui.browser.page_slots import try_lock, unlock
+
+DEFAULT_IDLE_TIMEOUT_SEC = 900
+DAEMON_START_TIMEOUT_SEC = 30
+IDLE_CHECK_INTERVAL_SEC = 5
+LOCK_POLL_INTERVAL_SEC = 0.1
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _get_user() -> str:
+    try:
+        return getpass.getuser()
+    except (OSError, KeyError):
+        return str(os.getuid())
+
+
+# Каталог состояния демонов: свой для каждого пользователя и проекта,
+# чтобы разные checkout'ы не подключались к чужим браузерам
+DEFAULT_STATE_DIR = (
+    Path(tempfile.gettempdir())
+    / f'playwright_daemon-{_get_user()}'
+    / hashlib.sha1(str(PROJECT_ROOT).encode()).hexdigest()[:12]
+)
+
+
+class BrowserDaemon:
+    """Клиент демона: запуск, проверка и продление жизни браузера
+
+    Для каждого набора параметров запуска работает свой демон со своим
+    файлом состояния, поэтому запуски с разными параметрами не
+    останавливают браузеры друг друга: ненужный демон завершается сам
+    после простоя. Проверка и запуск демона выполняются под
+    межпроцессной блокировкой, поэтому параллельные воркеры xdist
+    запускают один демон на всех.
+    """
+
+    def __init__(
+        self,
+        idle_timeout_sec: int = DEFAULT_IDLE_TIMEOUT_SEC,
+        state_dir: Path = DEFAULT_STATE_DIR,
+    ):
+        """
+        :param idle_timeout_sec: время простоя, после которого демон
+                                 закрывает браузер и завершается
+        :param state_dir: каталог файлов с адресом и pid запущенных
+                          демонов
+        """
+        self.idle_timeout_sec = idle_timeout_sec
+        self.state_dir = Path(state_dir)
+        self.state_file = None
+
+    def ensure_running(self, launch_options: dict) -> str:
+        """Получение CDP-адреса браузера демона с такими же параметрами
+        запуска. Если такой демон не запущен, стартует новый
+
+        :param launch_options: параметры запуска chromium
+        """
+        fingerprint = _fingerprint(launch_options)
+        self.state_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.state_file = self.state_dir / f'{fingerprint}.json'
+
+        with self._lock(fingerprint):
+            state = self._read_state(self.state_file)
+            if state and _is_alive(state):
+                self.touch()
+                return state['endpoint']
+
+            self._spawn(launch_options)
+            return self._wait_for_start(fingerprint)['endpoint']
+
+    def touch(self):
+        """Отметка об использовании браузера, откладывающая остановку"""
+        if self.state_file and self.state_file.exists():
+            os.utime(self.state_file)
+
+    def stop(self):
+        """Остановка всех демонов пользователя для этого проекта"""
+        for state_file in self.state_dir.glob('*.json'):
+            state = self._read_state(state_file)
+            if state:
+                try:
+                    os.kill(state['pid'], signal.SIGTERM)
+                except OSError:
+                    pass
+            state_file.unlink(missing_ok=True)
+
+    @contextmanager
+    def _lock(self, fingerprint: str):
+        """Межпроцессная блокировка проверки и запуска демона"""
+        lock_path = self.state_dir / f'{fingerprint}.lock'
+        deadline = time.monotonic() + 2 * DAEMON_START_TIMEOUT_SEC
+        with open(lock_path, 'a+') as lock_file:
+            while not try_lock(lock_file):
+                if time.monotonic() > deadline:
+                    raise RuntimeError(
+                        f'Не удалось дождаться блокировки {lock_path}: '
+                        f'демон браузера запускает другой процесс'
+                    )
+                time.sleep(LOCK_POLL_INTERVAL_SEC)
+            try:
+                yield
+            finally:
+                unlock(lock_file)
+
+    def _spawn(self, launch_options: dict):
+        subprocess.Popen(
+            [
+                sys.executable,
+                '-m',
+                'src.ui.browser.daemon',
+                'serve',
+                '--launch-options',
+                json.dumps(launch_options),
+                '--idle-timeout',
+                str(self.idle_timeout_sec),
+                '--state-file',
+                str(self.state_file),
+            ],
+            cwd=PROJECT_ROOT,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def _wait_for_start(self, fingerprint: str) -> dict:
+        deadline = time.monotonic() + DAEMON_START_TIMEOUT_SEC
+        while time.monotonic() < deadline:
+            state = self._read_state(self.state_file)
+            if state and state['fingerprint'] == fingerprint:
+                if _is_alive(state):
+                    return state
+            time.sleep(0.1)
+        raise RuntimeError(
+            f'Демон браузера не запустился за {DAEMON_START_TIMEOUT_SEC} с'
+        )
+
+    @staticmethod
+    def _read_state(state_file: Path) -> dict | None:
+        try:
+            return json.loads(state_file.read_text())
+        except (OSError, ValueError):
+            return None
+
+
+def serve(launch_options: dict, idle_timeout_sec: int, state_file: Path):
+    """Запуск браузера и ожидание простоя дольше idle_timeout_sec
+
+    :param launch_options: параметры запуска chromium
+    :param idle_timeout_sec: допустимое время простоя
+    :param state_file: файл, в который записывается адрес браузера
+    """
+    fingerprint = _fingerprint(launch_options)
+    port = _get_free_port()
+    launch_options = {
+        **launch_options,
+        'args': [
+            *launch_options.get('args', []),
+            f'--remote-debugging-port={port}',
+        ],
+    }
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+
+    with sync_playwright() as playwright:
+        browser = playwright.chromium.launch(**launch_options)
+        endpoint = f'http://127.0.0.1:{port}'
+        state_file.write_text(
+            json.dumps(
+                {
+                    'pid': os.getpid(),
+                    'endpoint': endpoint,
+                    'fingerprint': fingerprint,
+                }
+            )
+        )
+        try:
+            while browser.is_connected():
+                time.sleep(IDLE_CHECK_INTERVAL_SEC)
+                if _is_idle(endpoint, state_file, idle_timeout_sec):
+                    break
+        finally:
+            _remove_own_state(state_file)
+            browser.close()
+
+
+def _is_idle(endpoint: str, state_file: Path, idle_timeout_sec: int) -> bool:
+    """Простой: нет открытых страниц и давно не было подключений"""
+    try:
+        last_used = state_file.stat().st_mtime
+    except OSError:
+        # Файл удален командой stop или новым демоном
+        return True
+    if time.time() - last_used < idle_timeout_sec:
+        return False
+    return not any(
+        target['type'] == 'page' for target in _get_targets(endpoint)
+    )
+
+
+def _get_targets(endpoint: str) -> list[dict]:
+    with urllib.request.urlopen(f'{endpoint}/json/list', timeout=2) as resp:
+        return json.load(resp)
+
+
+def _is_alive(state: dict) -> bool:
+    try:
+        os.kill(state['pid'], 0)
+        with urllib.request.urlopen(
+            f'{state["endpoint"]}/json/version', timeout=1
+        ):
+            return True
+    except OSError:
+        return False
+
+
+def _remove_own_state(state_file: Path):
+    try:
+        if json.loads(state_file.read_text())['pid'] == os.getpid():
+            state_file.unlink()
+    except (OSError, ValueError, KeyError):
+        pass
+
+
+def _fingerprint(launch_options: dict) -> str:
+    options = json.dumps(launch_options, sort_keys=True)
+    return hashlib.sha1(options.encode()).hexdigest()
+
+
+def _get_free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('command', choices=['serve', 'stop'])
+    parser.add_argument('--launch-options', default='{}')
+    parser.add_argument(
+        '--idle-timeout', type=int, default=DEFAULT_IDLE_TIMEOUT_SEC
+    )
+    parser.add_argument('--state-file', type=Path)
+    parser.add_argument('--state-dir', type=Path, default=DEFAULT_STATE_DIR)
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        if args.state_file is None:
+            parser.error('для serve нужен аргумент --state-file')
+        serve(
+            json.loads(args.launch_options),
+            args.idle_timeout,
+            args.state_file,
+        )
+    else:
+        BrowserDaemon(state_dir=args.state_dir).stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+from playwright.sync_api import sync_playwright
+
+from src.ui.browser.browser_launcher import BrowserLauncher
+from src.ui.browser.config import BrowserConfig
+
+
+class EngineLaunchers:
+    """Launcher'ы движков матрицы (engines) в одном процессе
+
+    Все launcher'ы используют один запущенный playwright. Браузер
+    движка запускается при первом тесте на нем и остается запущенным
+    до конца сессии, поэтому тесты разных движков могут чередоваться
+    без повторного старта браузеров.
+    """
+
+    def __init__(self, config: BrowserConfig, har_mode: str = None):
+        """
+        :param config: конфигурация браузера
+        :param har_mode: режим HAR, переопределяющий значение из конфигурации
+        """
+        self.config = config
+        self.har_mode = har_mode
+        self.playwright = None
+        self._launchers = {}
+
+    def get(self, engine: str = None) -> BrowserLauncher:
+        """Получение launcher'а движка, при первом обращении он создается
+
+        :param engine: chromium, firefox или webkit,
+                       по умолчанию - browserType из конфигурации
+        """
+        engine = engine or self.config.browser_type
+        if engine not in self._launchers:
+            if self.playwright is None:
+                self.playwright = sync_playwright().start()
+            self._launchers[engine] = BrowserLauncher(
+                har_mode=self.har_mode,
+                config=self.config.for_engine(engine),
+                playwright=self.playwright,
+            )
+        return self._launchers[engine]
+
+    def stats(self) -> dict:
+        """Статистика launcher'ов. При нескольких движках
+        к названию раздела добавляется имя движка"""
+        if len(self._launchers) == 1:
+            (launcher,) = self._launchers.values()
+            return launcher.stats()
+
+        return {
+            f'{title} ({engine})': section
+            for engine, launcher in self._launchers.items()
+            for title, section in launcher.stats().items()
+        }
+
+    def close(self):
+        """Закрытие браузеров всех движков и остановка playwright"""
+        try:
+            for launcher in self._launchers.values():
+                launcher.close()
+        finally:
+            self._launchers.clear()
+            if self.playwright is not None:
+                self.playwright.stop()
+                self.playwright = None
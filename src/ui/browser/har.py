@@ -0,0 +1,315 @@
+import base64
+import json
+import re
+import shutil
+import uuid
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+HAR_MODES = ('record', 'replay', 'off')
+HAR_SCOPES = ('shared', 'test')
+SHARED_ARCHIVE_NAME = 'shared'
+TMP_DIR_NAME = '.tmp'
+PARTS_DIR_NAME = '.parts'
+ARCHIVE_CACHE_SIZE = 4
+NOT_FOUND_ERROR_CODE = 'internetdisconnected'
+
+# Заголовки, которые нельзя отдавать как есть: тело в HAR уже распаковано
+SKIPPED_RESPONSE_HEADERS = {
+    'content-encoding',
+    'content-length',
+    'transfer-encoding',
+}
+
+
+class HarArchive:
+    """HAR-архив, проиндексированный по методу и URL запроса
+
+    Записи с одинаковыми методом и URL дополнительно группируются по телу
+    запроса, поэтому поиск ответа не зависит от размера архива.
+    """
+
+    def __init__(self, entries: list[dict]):
+        self._index = defaultdict(lambda: defaultdict(list))
+        for entry in entries:
+            request = entry['request']
+            key = (request['method'], request['url'])
+            post_data = request.get('postData', {}).get('text')
+            self._index[key][post_data].append(entry)
+
+    @classmethod
+    def load(cls, path: Path) -> 'HarArchive':
+        """Загрузка архива из файла
+
+        :param path: путь до .har-файла
+        """
+        return cls(read_entries(path))
+
+    def find(self, method: str, url: str, post_data: str = None):
+        """Поиск записанных ответов для запроса
+
+        Возвращает ключ группы и записи в порядке записи, либо None
+
+        :param method: метод запроса
+        :param url: полный URL запроса
+        :param post_data: тело запроса
+        """
+        bodies = self._index.get((method, url))
+        if not bodies:
+            return None
+
+        body_key = post_data if post_data in bodies else next(iter(bodies))
+        return (method, url, body_key), bodies[body_key]
+
+
+class HarReplayer:
+    """Воспроизведение HAR-архива в одном context'е
+
+    Повторяющиеся запросы получают ответы в порядке записи, после
+    последней записи повторяется последний ответ.
+    """
+
+    def __init__(self, archive: HarArchive):
+        self.archive = archive
+        self._cursors = defaultdict(int)
+
+    def handle_route(self, route, request):
+        """Обработчик route'а: ответ из архива без обращения к сети"""
+        fulfill_params = self._next_response(request)
+        if fulfill_params is None:
+            route.abort(NOT_FOUND_ERROR_CODE)
+        else:
+            route.fulfill(**fulfill_params)
+
+    async def handle_route_async(self, route, request):
+        """Обработчик route'а для async API"""
+        fulfill_params = self._next_response(request)
+        if fulfill_params is None:
+            await route.abort(NOT_FOUND_ERROR_CODE)
+        else:
+            await route.fulfill(**fulfill_params)
+
+    def _next_response(self, request) -> dict | None:
+        """Параметры route.fulfill для следующего записанного ответа"""
+        found = self.archive.find(
+            request.method, request.url, request.post_data
+        )
+        if found is None:
+            return None
+
+        key, entries = found
+        position = self._cursors[key]
+        self._cursors[key] = position + 1
+        response = entries[min(position, len(entries) - 1)]['response']
+
+        return {
+            'status': response['status'],
+            'headers': {
+                header['name']: header['value']
+                for header in response['headers']
+                if header['name'].lower() not in SKIPPED_RESPONSE_HEADERS
+            },
+            'body': _decode_content(response.get('content', {})),
+        }
+
+
+class HarManager:
+    """Запись и воспроизведение сетевого трафика context'ов через HAR
+
+    - `record` - трафик каждого context'а записывается в HAR-файл;
+    - `replay` - запросы обслуживаются из HAR-архивов, сеть не используется;
+    - `off` - HAR не используется.
+
+    В области `test` у каждого теста свой архив, в области `shared`
+    записи всех тестов объединяются в один архив. Каждый менеджер
+    (воркер xdist, движок матрицы) пишет во временную папку и часть
+    общего архива со своим именем, а части объединяются в конце сессии
+    через merge_shared_archive.
+    """
+
+    def __init__(self, mode: str, har_dir: str, scope: str = 'shared'):
+        if mode not in HAR_MODES:
+            raise ValueError(
+                f'Неизвестный режим HAR {mode}. '
+                f'Доступные значения: {", ".join(HAR_MODES)}'
+            )
+        if scope not in HAR_SCOPES:
+            raise ValueError(
+                f'Неизвестная область HAR {scope}. '
+                f'Доступные значения: {", ".join(HAR_SCOPES)}'
+            )
+
+        self.mode = mode
+        self.scope = scope
+        self.har_dir = Path(har_dir)
+        self._id = uuid.uuid4().hex
+        self._tmp_dir = self.har_dir / TMP_DIR_NAME / self._id
+        self._recordings = {}
+        self._shared_entries = []
+
+    def context_params(self) -> dict:
+        """Параметры нового context'а для записи HAR"""
+        if self.mode != 'record':
+            return {}
+
+        self._tmp_dir.mkdir(parents=True, exist_ok=True)
+        return {
+            'record_har_path': str(
+                self._tmp_dir / f'{uuid.uuid4().hex}.har'
+            ),
+            'record_har_content': 'embed',
+        }
+
+    def register_context(self, context, params: dict):
+        """Запоминание временного HAR-файла context'а
+
+        :param context: созданный context
+        :param params: параметры, полученные из context_params
+        """
+        if 'record_har_path' in params:
+            self._recordings[context] = Path(params['record_har_path'])
+
+    def attach(self, context, test_name: str = None):
+        """Подключение воспроизведения HAR к context'у теста
+
+        :param context: context теста
+        :param test_name: имя теста, для области `test`
+        """
+        replayer = self._create_replayer(test_name)
+        if replayer:
+            context.route('**/*', replayer.handle_route)
+
+    async def attach_async(self, context, test_name: str = None):
+        """Подключение воспроизведения HAR к context'у async API
+
+        :param context: context теста
+        :param test_name: имя теста, для области `test`
+        """
+        replayer = self._create_replayer(test_name)
+        if replayer:
+            await context.route('**/*', replayer.handle_route_async)
+
+    def _create_replayer(self, test_name: str = None) -> HarReplayer | None:
+        """Создание воспроизведения архива теста в режиме replay"""
+        if self.mode != 'replay':
+            return None
+
+        archive_path = self._archive_path(test_name)
+        if not archive_path.exists():
+            raise FileNotFoundError(
+                f'HAR-архив {archive_path} не найден. '
+                f'Запустите тесты в режиме record'
+            )
+        archive = _load_archive(archive_path, archive_path.stat().st_mtime)
+        return HarReplayer(archive)
+
+    def collect(self, context, test_name: str = None):
+        """Сохранение HAR-файла закрытого context'а
+
+        :param context: закрытый context
+        :param test_name: имя теста, для области `test`
+        """
+        recording = self._recordings.pop(context, None)
+        if recording is None or not recording.exists():
+            return
+
+        if self.scope == 'shared':
+            self._shared_entries.extend(read_entries(recording))
+            recording.unlink()
+        else:
+            shutil.move(recording, self._archive_path(test_name))
+
+    def close(self):
+        """Запись своей части общего архива и удаление своих временных
+        файлов. Папки других менеджеров не затрагиваются"""
+        if self.mode != 'record':
+            return
+
+        if self.scope == 'shared' and self._shared_entries:
+            write_archive(
+                self.har_dir / PARTS_DIR_NAME / f'{self._id}.har',
+                self._shared_entries,
+            )
+            self._shared_entries = []
+        shutil.rmtree(self._tmp_dir, ignore_errors=True)
+
+    def _archive_path(self, test_name: str = None) -> Path:
+        """Путь до архива теста или общего архива"""
+        if self.scope == 'shared' or test_name is None:
+            name = SHARED_ARCHIVE_NAME
+        else:
+            name = re.sub(r'[^\w.-]+', '_', test_name)
+        return self.har_dir / f'{name}.har'
+
+
+def read_entries(path: Path) -> list[dict]:
+    """Чтение записей из HAR-файла
+
+    :param path: путь до .har-файла
+    """
+    with open(path, encoding='utf-8') as har_file:
+        return json.load(har_file)['log']['entries']
+
+
+def write_archive(path: Path, entries: list[dict]):
+    """Запись HAR-файла с указанными записями
+
+    :param path: путь до .har-файла
+    :param entries: записи HAR
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    har = {
+        'log': {
+            'version': '1.2',
+            'creator': {'name': 'python_playwright_framework'},
+            'entries': entries,
+        }
+    }
+    with open(path, 'w', encoding='utf-8') as har_file:
+        json.dump(har, har_file)
+
+
+def merge_shared_archive(har_dir: str | Path) -> Path | None:
+    """Объединение частей общего архива, записанных менеджерами всех
+    воркеров и движков, в один архив. Записи упорядочиваются по времени
+    запроса. Вызывается один раз в конце сессии основным процессом
+
+    :param har_dir: папка с архивами
+    """
+    parts_dir = Path(har_dir) / PARTS_DIR_NAME
+    parts = sorted(parts_dir.glob('*.har'))
+    if not parts:
+        return None
+
+    entries = [entry for part in parts for entry in read_entries(part)]
+    entries.sort(key=lambda entry: entry.get('startedDateTime', ''))
+    path = Path(har_dir) / f'{SHARED_ARCHIVE_NAME}.har'
+    write_archive(path, entries)
+    shutil.rmtree(parts_dir, ignore_errors=True)
+    return path
+
+
+def clear_recordings(har_dir: str | Path):
+    """Удаление временных файлов и частей архива прошлой записи
+
+    :param har_dir: папка с архивами
+    """
+    for name in (TMP_DIR_NAME, PARTS_DIR_NAME):
+        shutil.rmtree(Path(har_dir) / name, ignore_errors=True)
+
+
+@lru_cache(maxsize=ARCHIVE_CACHE_SIZE)
+def _load_archive(path: Path, mtime: float) -> HarArchive:
+    """Загрузка архива с кэшем последних архивов (с учетом изменения
+    файла). В области `test` у каждого теста свой архив, поэтому кэш
+    ограничен и в памяти не остаются архивы всех тестов"""
+    return HarArchive.load(path)
+
+
+def _decode_content(content: dict) -> bytes:
+    """Получение тела ответа из записи HAR"""
+    text = content.get('text', '')
+    if content.get('encoding') == 'base64':
+        return base64.b64decode(text)
+    return text.encode('utf-8')
@@ -0,0 +1,260 @@
+from src.ui.browser.artifacts import ArtifactWriter, configure_artifact_writer
+from src.ui.browser.asset_cache import get_shared_asset_cache
+from src.ui.browser.blocking import ResourceBlocker
+from src.ui.browser.config import (
+    DEFAULT_CONFIG_PATH,
+    BrowserConfig,
+    load_browser_config,
+)
+from src.ui.browser.daemon import BrowserDaemon
+from src.ui.browser.har import HarManager
+from src.ui.browser.page_slots import PageSlots, resolve_page_limit
+from src.ui.browser.remote import RemoteBrowserPool
+from src.ui.browser.tracing import TraceRecorder
+from src.ui.helper.stats import process_tree_rss_bytes
+
+# Пиковый RSS замеряется при закрытии каждой N-й страницы
+RSS_SAMPLE_EVERY_PAGES = 10
+
+
+class LauncherBase:
+    """Общая логика sync и async launcher'ов: параметры запуска браузера
+    и создания context'а из конфигурации"""
+
+    def __init__(
+        self,
+        local_browser_config_path: str = None,
+        har_mode: str = None,
+        config: BrowserConfig = None,
+    ):
+        """
+        :param local_browser_config_path: путь до конфигурационного файла
+        :param har_mode: режим HAR, переопределяющий значение из конфигурации
+        :param config: уже загруженная конфигурация, если передана,
+                       файл не читается
+        """
+        self.config = config or load_browser_config(
+            local_browser_config_path or DEFAULT_CONFIG_PATH
+        )
+        self.reuse_browser = self.config.reuse_browser
+        self.har = self._create_har_manager(har_mode)
+        self.artifacts = self._create_artifact_writer()
+        self.tracing = self._create_trace_recorder()
+        self.asset_cache = self._create_asset_cache()
+        self.blocker = self._create_resource_blocker()
+        self.page_slots = self._create_page_slots()
+        self.daemon = self._create_browser_daemon()
+        self._held_slots = {}
+        self.browser = None
+        self.remote = None
+        self.browser_launches = 0
+        self.tests_run = 0
+        self.peak_rss_bytes = 0
+        self._pages_closed = 0
+
+    def _get_browser_type(self, playwright):
+        """Получение типа браузера и параметров его запуска
+
+        :param playwright: запущенный объект playwright (sync или async)
+        """
+        browser_type_name = self.config.browser_type
+        launch_options = self.config.launch_options()
+
+        if browser_type_name == 'chromium':
+            browser_type = playwright.chromium
+        elif browser_type_name == 'firefox':
+            browser_type = playwright.firefox
+        elif browser_type_name == 'webkit':
+            browser_type = playwright.webkit
+        else:
+            raise ValueError(f'Неизвестный тип браузера {browser_type_name}')
+
+        return browser_type, launch_options
+
+    def _create_browser_daemon(self) -> BrowserDaemon | None:
+        """Создание клиента демона браузера, если он включен
+        в конфигурации (daemon.enabled)"""
+        if not self.config.daemon.enabled:
+            return None
+
+        if self.config.browser_type != 'chromium':
+            raise ValueError('Демон браузера поддерживает только chromium')
+        return BrowserDaemon(
+            idle_timeout_sec=self.config.daemon.idle_timeout_sec
+        )
+
+    def _create_remote_pool(
+        self, browser_type, launch_options: dict
+    ) -> RemoteBrowserPool | None:
+        """Создание пула удаленных браузеров, если в конфигурации
+        указаны их адреса (remote.endpoints)
+
+        :param browser_type: тип браузера playwright
+        :param launch_options: параметры запуска браузера
+        """
+        if not self.config.remote.endpoints:
+            return None
+
+        return RemoteBrowserPool(
+            browser_type,
+            list(self.config.remote.endpoints),
+            launch_options=launch_options,
+            retry_after_sec=self.config.remote.retry_after_sec,
+        )
+
+    def _create_har_manager(self, har_mode: str = None) -> HarManager:
+        """Создание менеджера записи/воспроизведения HAR
+
+        :param har_mode: режим HAR, переопределяющий значение из конфигурации
+        """
+        return HarManager(
+            mode=har_mode or self.config.har.mode,
+            har_dir=self.config.har.dir,
+            scope=self.config.har.scope,
+        )
+
+    def _create_trace_recorder(self) -> TraceRecorder | None:
+        """Создание трассировки упавших тестов, если она включена
+        в конфигурации (tracing.enabled)"""
+        tracing_config = self.config.tracing
+        if not tracing_config.enabled:
+            return None
+
+        return TraceRecorder(
+            trace_dir=tracing_config.dir,
+            max_total_bytes=int(tracing_config.max_total_mb * 1024 * 1024),
+            screenshots=tracing_config.screenshots,
+            snapshots=tracing_config.snapshots,
+            sources=tracing_config.sources,
+            artifacts=self.artifacts,
+        )
+
+    def _create_artifact_writer(self) -> ArtifactWriter | None:
+        """Получение общего фонового обработчика артефактов, если он
+        включен в конфигурации (artifacts.enabled)"""
+        artifacts_config = self.config.artifacts
+        if not artifacts_config.enabled:
+            return None
+
+        return configure_artifact_writer(
+            image_format=artifacts_config.image_format,
+            quality=artifacts_config.quality,
+            max_queue_bytes=int(artifacts_config.max_queue_mb * 1024 * 1024),
+        )
+
+    def _create_asset_cache(self):
+        """Получение общего кэша статики, если он включен в конфигурации"""
+        cache_config = self.config.asset_cache
+        if not cache_config.enabled:
+            return None
+
+        return get_shared_asset_cache(
+            max_bytes=int(cache_config.max_size_mb * 1024 * 1024),
+            content_types=cache_config.content_types,
+        )
+
+    def _create_resource_blocker(self) -> ResourceBlocker:
+        """Создание блокировщика ресурсов с профилями из конфигурации"""
+        return ResourceBlocker(
+            profiles=self.config.blocking.profiles,
+            default_profile=self.config.blocking.profile,
+        )
+
+    def _create_page_slots(self) -> PageSlots | None:
+        """Создание общего для машины лимита открытых страниц,
+        если он задан в конфигурации (maxLivePages)"""
+        limit = resolve_page_limit(self.config.max_live_pages)
+        return PageSlots(limit) if limit else None
+
+    def _hold_slot(self, page, slot):
+        """Привязка занятого слота к странице"""
+        if slot is not None:
+            self._held_slots[page] = slot
+
+    def _release_slot(self, page):
+        """Освобождение слота страницы, если он был занят"""
+        slot = self._held_slots.pop(page, None)
+        if slot is not None:
+            self.page_slots.release(slot)
+
+    def _sample_rss(self, force: bool = False):
+        """Обновление пикового RSS процесса вместе с браузером
+
+        Обход /proc занимает миллисекунды, поэтому RSS замеряется
+        при закрытии первой и каждой RSS_SAMPLE_EVERY_PAGES-й страницы
+
+        :param force: замерить независимо от счетчика страниц
+        """
+        if not force:
+            self._pages_closed += 1
+            if self._pages_closed % RSS_SAMPLE_EVERY_PAGES != 1:
+                return
+        rss_bytes = process_tree_rss_bytes()
+        if rss_bytes:
+            self.peak_rss_bytes = max(self.peak_rss_bytes, rss_bytes)
+
+    def _needs_launch(self) -> bool:
+        """Нужен ли (пере)запуск локального браузера: он еще не запущен,
+        был закрыт или упал"""
+        if self.remote:
+            return False
+        return self.browser is None or not self.browser.is_connected()
+
+    def _detach_browsers(self) -> list:
+        """Отключение от удаленных браузеров и сброс ссылки на браузер.
+        Возвращает браузеры, которые нужно закрыть"""
+        browsers = [self.browser]
+        if self.remote:
+            browsers = self.remote.connected_browsers()
+            self.remote.disconnect()
+        self.browser = None
+        return [
+            browser
+            for browser in browsers
+            if browser and browser.is_connected()
+        ]
+
+    def _get_context_params(self, **kwargs) -> tuple[dict, dict]:
+        """Получение параметров нового context'а
+
+        Возвращает все параметры и отдельно параметры записи HAR
+
+        :param kwargs: дополнительные параметры для конфигурации браузера
+        """
+        context_params = {
+            'ignore_https_errors': True,
+            **self.config.context_options(),
+        }
+        har_params = self.har.context_params()
+        return {**context_params, **har_params, **kwargs}, har_params
+
+    def stats(self) -> dict:
+        """Статистика воркера, кэша статики и блокировки ресурсов"""
+        self._sample_rss(force=True)
+        stats = {
+            'Воркер': {
+                'tests': self.tests_run,
+                'browser_restarts': max(self.browser_launches - 1, 0),
+                'peak_rss_mb': self.peak_rss_bytes / 1024 / 1024,
+            }
+        }
+        if self.page_slots:
+            stats['Лимит страниц на машину'] = self.page_slots.stats
+        if self.remote:
+            stats['Удаленные браузеры'] = self.remote.stats
+        if self.artifacts:
+            # Счетчики артефактов полные только после обработки очереди
+            self.artifacts.flush()
+            stats['Артефакты'] = self.artifacts.stats
+        if self.tracing:
+            stats['Трассировка'] = self.tracing.stats
+        if self.asset_cache:
+            stats['Кэш статики'] = self.asset_cache.stats
+        for profile, blocked in self.blocker.stats.items():
+            stats[f'Блокировка ресурсов ({profile})'] = blocked
+        return stats
+
+
+def is_connected(context) -> bool:
+    """Проверка того, что браузер context'а еще доступен"""
+    return bool(context.browser and context.browser.is_connected())
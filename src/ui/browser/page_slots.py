@@ -0,0 +1,133 @@
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Каталог lock-файлов, общий для всех процессов на машине
+DEFAULT_SLOTS_DIR = Path(tempfile.gettempdir()) / 'playwright_page_slots'
+SLOT_POLL_INTERVAL_SEC = 0.05
+DEFAULT_SLOT_TIMEOUT_SEC = 300
+
+
+class PageSlots:
+    """Межпроцессный семафор, ограничивающий число одновременно открытых
+    тестами страниц на машине
+
+    Каждый слот - lock-файл в общем каталоге. Процесс занимает слот,
+    захватывая блокировку файла, поэтому лимит действует для всех
+    воркеров xdist и параллельных запусков, а слоты упавших процессов
+    освобождаются операционной системой.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        slots_dir: Path = DEFAULT_SLOTS_DIR,
+        timeout_sec: float = DEFAULT_SLOT_TIMEOUT_SEC,
+    ):
+        """
+        :param limit: максимальное количество страниц на машине
+        :param slots_dir: каталог lock-файлов
+        :param timeout_sec: максимальное время ожидания свободного слота
+        """
+        self.limit = limit
+        self.slots_dir = Path(slots_dir)
+        self.timeout_sec = timeout_sec
+        self.slots_dir.mkdir(parents=True, exist_ok=True)
+        self.wait_sec = 0.0
+
+    def acquire(self):
+        """Ожидание и захват свободного слота. Возвращает открытый
+        lock-файл, который нужно передать в release"""
+        started = time.monotonic()
+        while True:
+            slot = self.try_acquire()
+            if slot is not None:
+                self.wait_sec += time.monotonic() - started
+                return slot
+            self._check_timeout(started)
+            time.sleep(SLOT_POLL_INTERVAL_SEC)
+
+    async def acquire_async(self):
+        """Захват свободного слота без блокировки event loop"""
+        started = time.monotonic()
+        while True:
+            slot = self.try_acquire()
+            if slot is not None:
+                self.wait_sec += time.monotonic() - started
+                return slot
+            self._check_timeout(started)
+            await asyncio.sleep(SLOT_POLL_INTERVAL_SEC)
+
+    @staticmethod
+    def release(slot):
+        """Освобождение слота
+
+        :param slot: lock-файл, полученный из acquire
+        """
+        try:
+            unlock(slot)
+        finally:
+            slot.close()
+
+    def try_acquire(self):
+        """Попытка захватить любой свободный слот без ожидания.
+        Возвращает None, если свободных слотов нет"""
+        for index in range(self.limit):
+            slot = open(self.slots_dir / f'slot-{index}.lock', 'a+')
+            if try_lock(slot):
+                return slot
+            slot.close()
+        return None
+
+    def _check_timeout(self, started: float):
+        if time.monotonic() - started > self.timeout_sec:
+            raise RuntimeError(
+                f'Нет свободного слота для страницы за {self.timeout_sec} с '
+                f'(лимит {self.limit} страниц на машину)'
+            )
+
+    @property
+    def stats(self) -> dict:
+        """Статистика ожидания слотов"""
+        return {'limit': self.limit, 'wait_sec': self.wait_sec}
+
+
+def resolve_page_limit(value) -> int:
+    """Получение лимита страниц из конфигурации
+
+    :param value: число, 0 (без лимита) или 'auto' (по числу ядер CPU)
+    """
+    if value == 'auto':
+        return os.cpu_count() or 1
+    return int(value or 0)
+
+
+def try_lock(lock_file) -> bool:
+    """Попытка захватить блокировку открытого файла без ожидания.
+    Блокировка снимается и при завершении процесса"""
+    try:
+        if fcntl:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        return False
+    return True
+
+
+def unlock(lock_file):
+    """Снятие блокировки, захваченной через try_lock"""
+    if fcntl:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    else:
+        lock_file.seek(0)
+        msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,165 @@
+import json
+import time
+
+from playwright.sync_api import Error as PlaywrightError
+
+DEFAULT_RETRY_AFTER_SEC = 30
+
+
+class RemoteEndpoint:
+    """Удаленный браузер: ws-адрес `playwright run-server` или
+    http-адрес CDP (chrome --remote-debugging-port)"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.browser = None
+        self.down_until = 0.0
+        self.contexts_created = 0
+        self.failures = 0
+
+    @property
+    def is_cdp(self) -> bool:
+        return self.url.startswith(('http://', 'https://'))
+
+    @property
+    def is_connected(self) -> bool:
+        return self.browser is not None and self.browser.is_connected()
+
+    @property
+    def load(self) -> int:
+        """Количество открытых context'ов на endpoint'е"""
+        return len(self.browser.contexts) if self.is_connected else 0
+
+
+class RemoteBrowserPool:
+    """Распределение context'ов по нескольким удаленным браузерам
+
+    Новый context создается на наименее загруженном доступном
+    endpoint'е. Endpoint, к которому не удалось подключиться или
+    который отключился, пропускается retry_after_sec секунд, после чего
+    к нему снова пробуют подключиться.
+    """
+
+    def __init__(
+        self,
+        browser_type,
+        endpoints: list[str],
+        launch_options: dict = None,
+        retry_after_sec: float = DEFAULT_RETRY_AFTER_SEC,
+    ):
+        """
+        :param browser_type: тип браузера playwright (sync или async)
+        :param endpoints: адреса удаленных браузеров
+        :param launch_options: параметры запуска браузера для run-server
+        :param retry_after_sec: пауза перед повторным подключением
+        """
+        if not endpoints:
+            raise ValueError('Не указаны адреса удаленных браузеров')
+        self.browser_type = browser_type
+        self.endpoints = [RemoteEndpoint(url) for url in endpoints]
+        self.launch_options = launch_options or {}
+        self.retry_after_sec = retry_after_sec
+
+    def new_context(self, **context_params):
+        """Создание context'а на наименее загруженном endpoint'е
+        с переходом на следующий при ошибке
+
+        :param context_params: параметры context'а
+        """
+        errors = []
+        for endpoint in self._candidates():
+            try:
+                if not endpoint.is_connected:
+                    endpoint.browser = self._connect(endpoint)
+                context = endpoint.browser.new_context(**context_params)
+            except PlaywrightError as error:
+                # Ошибка не связана с доступностью endpoint'а
+                if endpoint.is_connected:
+                    raise
+                self._mark_down(endpoint, error, errors)
+                continue
+            endpoint.contexts_created += 1
+            return context
+        raise self._unavailable_error(errors)
+
+    async def new_context_async(self, **context_params):
+        """Создание context'а для async API
+
+        :param context_params: параметры context'а
+        """
+        errors = []
+        for endpoint in self._candidates():
+            try:
+                if not endpoint.is_connected:
+                    endpoint.browser = await self._connect(endpoint)
+                context = await endpoint.browser.new_context(**context_params)
+            except PlaywrightError as error:
+                if endpoint.is_connected:
+                    raise
+                self._mark_down(endpoint, error, errors)
+                continue
+            endpoint.contexts_created += 1
+            return context
+        raise self._unavailable_error(errors)
+
+    def _connect(self, endpoint: RemoteEndpoint):
+        """Подключение к endpoint'у. Для async API возвращает корутину"""
+        if endpoint.is_cdp:
+            return self.browser_type.connect_over_cdp(endpoint.url)
+        return self.browser_type.connect(
+            endpoint.url,
+            headers={
+                'x-playwright-launch-options': json.dumps(self.launch_options)
+            },
+        )
+
+    def _candidates(self) -> list[RemoteEndpoint]:
+        """Доступные endpoint'ы по возрастанию нагрузки. Если все
+        недоступны, пробуются все - вдруг какой-то уже поднялся"""
+        now = time.monotonic()
+        available = [
+            endpoint
+            for endpoint in self.endpoints
+            if endpoint.down_until <= now
+        ]
+        return sorted(available or self.endpoints, key=lambda e: e.load)
+
+    def _mark_down(self, endpoint: RemoteEndpoint, error, errors: list):
+        endpoint.failures += 1
+        endpoint.down_until = time.monotonic() + self.retry_after_sec
+        endpoint.browser = None
+        errors.append(f'{endpoint.url}: {error}')
+
+    @staticmethod
+    def _unavailable_error(errors: list) -> RuntimeError:
+        return RuntimeError(
+            'Нет доступных удаленных браузеров:\n' + '\n'.join(errors)
+        )
+
+    @property
+    def is_connected(self) -> bool:
+        return any(endpoint.is_connected for endpoint in self.endpoints)
+
+    def connected_browsers(self) -> list:
+        """Браузеры, к которым есть подключение"""
+        return [
+            endpoint.browser
+            for endpoint in self.endpoints
+            if endpoint.is_connected
+        ]
+
+    def disconnect(self):
+        """Забыть подключения, закрытие выполняет launcher"""
+        for endpoint in self.endpoints:
+            endpoint.browser = None
+
+    @property
+    def stats(self) -> dict:
+        """Количество созданных context'ов и ошибок по endpoint'ам"""
+        return {
+            endpoint.url: (
+                f'{endpoint.contexts_created} contexts, '
+                f'{endpoint.failures} failures'
+            )
+            for endpoint in self.endpoints
+        }
@@ -0,0 +1,148 @@
+import os
+import re
+import shutil
+from pathlib import Path
+
+import allure
+
+
+class TraceRecorder:
+    """Трассировка playwright с сохранением только для упавших тестов
+
+    Запись включается один раз при создании context'а, а каждый тест
+    пишется отдельным chunk'ом. Chunk прошедшего теста отбрасывается
+    без записи на диск, chunk упавшего или перезапущенного теста
+    сохраняется в zip и прикладывается к отчету Allure. Когда суммарный
+    размер трасс в папке (общей для воркеров xdist) достигает лимита,
+    новые трассы не сохраняются.
+    """
+
+    def __init__(
+        self,
+        trace_dir: str,
+        max_total_bytes: int,
+        screenshots: bool = True,
+        snapshots: bool = True,
+        sources: bool = False,
+        artifacts=None,
+    ):
+        """
+        :param trace_dir: папка для трасс
+        :param max_total_bytes: лимит суммарного размера трасс в папке
+        :param screenshots: скриншоты во время действий
+        :param snapshots: снимки DOM для каждого действия
+        :param sources: исходный код тестов в трассе
+        :param artifacts: фоновый обработчик артефактов ArtifactWriter,
+                          без него трасса прикладывается в потоке теста
+        """
+        self.trace_dir = Path(trace_dir)
+        self.max_total_bytes = max_total_bytes
+        self.options = {
+            'screenshots': screenshots,
+            'snapshots': snapshots,
+            'sources': sources,
+        }
+        self.artifacts = artifacts
+        self.kept = 0
+        self.discarded = 0
+        self.over_limit = 0
+
+    def start(self, context):
+        """Включение трассировки для нового context'а"""
+        context.tracing.start(**self.options)
+
+    async def start_async(self, context):
+        """Включение трассировки для нового context'а async API"""
+        await context.tracing.start(**self.options)
+
+    def start_chunk(self, context, test_name: str = None):
+        """Начало chunk'а теста
+
+        :param context: context теста
+        :param test_name: имя теста
+        """
+        context.tracing.start_chunk(title=test_name)
+
+    async def start_chunk_async(self, context, test_name: str = None):
+        """Начало chunk'а теста в async API"""
+        await context.tracing.start_chunk(title=test_name)
+
+    def stop_chunk(self, context, test_name: str = None, keep: bool = False):
+        """Завершение chunk'а теста: сохранение или отбрасывание
+
+        :param context: context теста
+        :param test_name: имя теста
+        :param keep: сохранить трассу (тест упал или перезапускается)
+        """
+        path = self._trace_path(test_name) if keep else None
+        context.tracing.stop_chunk(path=path)
+        self._collect(path, keep)
+
+    async def stop_chunk_async(
+        self, context, test_name: str = None, keep: bool = False
+    ):
+        """Завершение chunk'а теста в async API"""
+        path = self._trace_path(test_name) if keep else None
+        await context.tracing.stop_chunk(path=path)
+        self._collect(path, keep)
+
+    def _trace_path(self, test_name: str = None) -> Path | None:
+        """Свободный путь для трассы теста или None, если лимит исчерпан"""
+        if self._total_bytes() >= self.max_total_bytes:
+            self.over_limit += 1
+            return None
+
+        self.trace_dir.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r'[^\w.-]+', '_', test_name or 'trace')
+        path = self.trace_dir / f'{name}.zip'
+        attempt = 1
+        while path.exists():
+            attempt += 1
+            path = self.trace_dir / f'{name}-{attempt}.zip'
+        return path
+
+    def _collect(self, path: Path | None, keep: bool):
+        """Прикрепление сохраненной трассы к отчету"""
+        if not keep:
+            self.discarded += 1
+            return
+        if path is None or not path.exists():
+            return
+
+        self.kept += 1
+        if self.artifacts:
+            self.artifacts.save_file(
+                str(path), 'Playwright trace', allure.attachment_type.ZIP
+            )
+        else:
+            allure.attach.file(
+                str(path), name='Playwright trace', extension='zip'
+            )
+
+    def _total_bytes(self) -> int:
+        """Суммарный размер сохраненных трасс"""
+        if not self.trace_dir.is_dir():
+            return 0
+        return sum(
+            entry.stat().st_size
+            for entry in os.scandir(self.trace_dir)
+            if entry.name.endswith('.zip')
+        )
+
+    @property
+    def stats(self) -> dict:
+        """Статистика сохраненных и отброшенных трасс"""
+        return {
+            'kept': self.kept,
+            'discarded': self.discarded,
+            'over_limit': self.over_limit,
+            'size_mb': self._total_bytes() / 1024 / 1024,
+        }
+
+
+def clear_traces(trace_dir: str):
+    """Удаление трасс предыдущего запуска
+
+    :param trace_dir: папка для трасс
+    """
+    shutil.rmtree(trace_dir, ignore_errors=True)
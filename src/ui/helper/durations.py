@@ -0,0 +1,148 @@
+import argparse
+import heapq
+import json
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+DEFAULT_DURATIONS_FILE = '.test_durations.json'
+# Оценка длительности теста, если истории еще нет совсем
+DEFAULT_ESTIMATE_SEC = 5.0
+# Вес нового замера в экспоненциальном сглаживании
+NEW_SAMPLE_WEIGHT = 0.3
+# Через сколько запусков без замеров тест удаляется из истории
+MAX_RUNS_WITHOUT_SAMPLE = 20
+
+
+class DurationHistory:
+    """История длительностей тестов в json-файле
+
+    Для каждого теста хранится сглаженная длительность: новый замер
+    учитывается с весом NEW_SAMPLE_WEIGHT, поэтому старые замеры
+    постепенно теряют влияние. Тесты, которые давно не запускались,
+    удаляются из истории.
+    """
+
+    def __init__(self, path: str | Path = DEFAULT_DURATIONS_FILE):
+        """
+        :param path: путь до файла истории
+        """
+        self.path = Path(path)
+        self.run = 0
+        self.tests = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        self.run = data.get('run', 0)
+        self.tests = data.get('tests', {})
+
+    def estimate(self, nodeid: str) -> float:
+        """Ожидаемая длительность теста. Для теста без истории -
+        медиана известных длительностей
+
+        :param nodeid: идентификатор теста pytest
+        """
+        if nodeid in self.tests:
+            return self.tests[nodeid]['duration']
+        return self.default_estimate
+
+    @property
+    def default_estimate(self) -> float:
+        """Оценка длительности теста без истории"""
+        if not self.tests:
+            return DEFAULT_ESTIMATE_SEC
+        return statistics.median(
+            test['duration'] for test in self.tests.values()
+        )
+
+    def update(self, samples: dict[str, float]):
+        """Добавление замеров нового запуска
+
+        :param samples: длительности тестов в секундах по nodeid
+        """
+        self.run += 1
+        for nodeid, duration in samples.items():
+            previous = self.tests.get(nodeid)
+            if previous is not None:
+                duration = (
+                    NEW_SAMPLE_WEIGHT * duration
+                    + (1 - NEW_SAMPLE_WEIGHT) * previous['duration']
+                )
+            self.tests[nodeid] = {'duration': duration, 'last_run': self.run}
+
+        self.tests = {
+            nodeid: test
+            for nodeid, test in self.tests.items()
+            if self.run - test['last_run'] < MAX_RUNS_WITHOUT_SAMPLE
+        }
+
+    def save(self):
+        """Сохранение истории в файл"""
+        self.path.write_text(
+            json.dumps(
+                {'run': self.run, 'tests': self.tests},
+                indent=2,
+                sort_keys=True,
+            )
+        )
+
+
+class DurationRecorder:
+    """Плагин pytest, записывающий длительности тестов в историю
+    после каждого запуска"""
+
+    def __init__(self, history: DurationHistory):
+        self.history = history
+        self.samples = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report):
+        # setup, call и teardown, включая перезапуски упавших тестов
+        self.samples[report.nodeid] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        if self.samples:
+            self.history.update(self.samples)
+            self.history.save()
+
+
+def lpt_assign(nodeids: list[str], estimate, bins: int) -> list[list[str]]:
+    """Распределение тестов по bins группам методом LPT: тесты
+    по убыванию длительности отдаются наименее загруженной группе
+
+    :param nodeids: идентификаторы тестов
+    :param estimate: функция, возвращающая ожидаемую длительность теста
+    :param bins: количество групп (воркеров или шардов)
+    """
+    groups = [[] for _ in range(bins)]
+    loads = [(0.0, index) for index in range(bins)]
+    # Сортировка по nodeid делает распределение детерминированным
+    ordered = sorted(nodeids, key=lambda nodeid: (-estimate(nodeid), nodeid))
+    for nodeid in ordered:
+        load, index = heapq.heappop(loads)
+        groups[index].append(nodeid)
+        heapq.heappush(loads, (load + estimate(nodeid), index))
+    return groups
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Разбор значения опции --shard вида i/N (шарды нумеруются с 1)
+
+    :param value: строка вида '2/4'
+    """
+    try:
+        index, total = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f'Шард должен быть задан в виде i/N, получено {value}'
+        )
+    if not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(
+            f'Номер шарда должен быть от 1 до {total}, получено {index}'
+        )
+    return index, total
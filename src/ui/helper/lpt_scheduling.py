@@ -0,0 +1,49 @@
+from xdist.scheduler import LoadScheduling
+
+from src.ui.helper.durations import DurationHistory, lpt_assign
+
+
+class LptScheduling(LoadScheduling):
+    """Планировщик xdist, заранее распределяющий тесты по воркерам
+    методом LPT по истории длительностей
+
+    Самые долгие тесты попадают на разные воркеры, поэтому общее время
+    прогона определяется суммарной нагрузкой, а не неудачным соседством
+    долгих тестов.
+    """
+
+    def __init__(self, config, log=None, history: DurationHistory = None):
+        super().__init__(config, log)
+        self.history = history or DurationHistory()
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        # Первоначальное распределение уже было, например воркер упал
+        if self.collection is not None:
+            super().schedule()
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log('**Different tests collected, aborting run**')
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+
+        positions = {
+            nodeid: index for index, nodeid in enumerate(self.collection)
+        }
+        groups = lpt_assign(
+            self.collection, self.history.estimate, len(self.nodes)
+        )
+        for node, nodeids in zip(self.nodes, groups):
+            # Внутри воркера сохраняется исходный порядок тестов
+            indexes = sorted(positions[nodeid] for nodeid in nodeids)
+            if indexes:
+                self.node2pending[node].extend(indexes)
+                node.send_runtest_some(indexes)
+
+        for node in self.nodes:
+            node.shutdown()
@@ -0,0 +1,291 @@
+import csv
+import json
+import statistics
+from pathlib import Path
+
+import allure
+import pytest
+
+PAGE_METRICS_OUTPUT_KEY = 'page_metrics'
+# Время на доставку буферизованных записей LCP и layout-shift
+VITALS_WAIT_MSEC = 100
+
+PAGE_METRICS = (
+    'ttfb_ms',
+    'dom_content_loaded_ms',
+    'load_ms',
+    'fcp_ms',
+    'lcp_ms',
+    'cls',
+    'duration_ms',
+    'resources',
+    'resources_ms',
+    'transfer_bytes',
+)
+RECORD_FIELDS = ('test', 'name', 'url', *PAGE_METRICS)
+
+# since = 0 - загрузка страницы целиком (Navigation Timing, FCP, LCP),
+# иначе - переход внутри SPA: ресурсы и сдвиги макета после since
+PAGE_METRICS_SCRIPT = '''async ([since, waitMsec]) => {
+    const vitals = {lcp: null, cls: 0};
+    const observers = [];
+    const observe = (type, callback) => {
+        if (!PerformanceObserver.supportedEntryTypes.includes(type)) {
+            return false;
+        }
+        const observer = new PerformanceObserver(
+            (list) => list.getEntries().forEach(callback)
+        );
+        observer.observe({type, buffered: true});
+        observers.push(observer);
+        return true;
+    };
+    const hasLcp = observe('largest-contentful-paint', (entry) => {
+        vitals.lcp = entry.startTime;
+    });
+    const hasCls = observe('layout-shift', (entry) => {
+        if (!entry.hadRecentInput && entry.startTime >= since) {
+            vitals.cls += entry.value;
+        }
+    });
+    await new Promise((resolve) => setTimeout(resolve, waitMsec));
+    observers.forEach((observer) => observer.disconnect());
+
+    const resources = performance.getEntriesByType('resource')
+        .filter((entry) => entry.startTime >= since);
+    const metrics = {
+        ttfb_ms: null,
+        dom_content_loaded_ms: null,
+        load_ms: null,
+        fcp_ms: null,
+        lcp_ms: null,
+        cls: hasCls ? vitals.cls : null,
+        duration_ms: performance.now() - since,
+        resources: resources.length,
+        resources_ms: Math.max(
+            0, ...resources.map((entry) => entry.responseEnd - since)
+        ),
+        transfer_bytes: resources.reduce(
+            (total, entry) => total + entry.transferSize, 0
+        ),
+    };
+    if (since > 0) {
+        return metrics;
+    }
+
+    const [navigation] = performance.getEntriesByType('navigation');
+    if (navigation) {
+        metrics.ttfb_ms = navigation.responseStart;
+        metrics.dom_content_loaded_ms = navigation.domContentLoadedEventEnd;
+        metrics.load_ms = navigation.loadEventEnd;
+        metrics.duration_ms = navigation.duration;
+        metrics.transfer_bytes += navigation.transferSize;
+    }
+    const [fcp] = performance.getEntriesByName('first-contentful-paint');
+    metrics.fcp_ms = fcp ? fcp.startTime : null;
+    metrics.lcp_ms = hasLcp ? vitals.lcp : null;
+    return metrics;
+}'''
+
+_page_metrics = None
+
+
+class PageMetrics:
+    """Метрики загрузки страниц за сессию
+
+    Для каждой загрузки страницы и перехода внутри SPA сохраняются
+    Navigation Timing, FCP, LCP, CLS, количество ресурсов и объем
+    переданных данных. Время в миллисекундах от начала загрузки
+    страницы (для переходов внутри SPA - от начала перехода).
+    """
+
+    def __init__(self):
+        self.current_test = None
+        self.records = []
+
+    def record(self, name: str, url: str, metrics: dict) -> dict:
+        """Сохранение метрик одной загрузки и прикрепление их
+        к текущему шагу Allure
+
+        :param name: название загрузки (URL или раздел страницы)
+        :param url: адрес страницы
+        :param metrics: метрики из PAGE_METRICS_SCRIPT
+        """
+        record = {
+            'test': self.current_test,
+            'name': name,
+            'url': url,
+            **{metric: metrics.get(metric) for metric in PAGE_METRICS},
+        }
+        self.records.append(record)
+        allure.attach(
+            json.dumps(record, ensure_ascii=False, indent=2),
+            name=f'Метрики загрузки: {name}',
+            attachment_type=allure.attachment_type.JSON,
+        )
+        return record
+
+    def merge(self, records: list[dict]):
+        """Добавление метрик воркера xdist"""
+        self.records.extend(records)
+
+    def summary(self) -> dict:
+        """Медианы основных метрик по названиям загрузок"""
+        grouped = {}
+        for record in self.records:
+            grouped.setdefault(record['name'], []).append(record)
+
+        summary = {}
+        for name, records in grouped.items():
+            summary[name] = {'count': len(records)}
+            for metric in ('duration_ms', 'lcp_ms', 'cls', 'transfer_bytes'):
+                values = [
+                    record[metric]
+                    for record in records
+                    if record[metric] is not None
+                ]
+                summary[name][metric] = (
+                    statistics.median(values) if values else None
+                )
+        return summary
+
+    def write(self, path: str | Path):
+        """Сохранение метрик в JSON и CSV (рядом, с расширением .csv)
+
+        :param path: путь до JSON-файла
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(
+                {'pages': self.summary(), 'records': self.records},
+                ensure_ascii=False,
+                indent=2,
+            ),
+            encoding='utf-8',
+        )
+        with path.with_suffix('.csv').open(
+            'w', newline='', encoding='utf-8'
+        ) as csv_file:
+            writer = csv.DictWriter(csv_file, fieldnames=RECORD_FIELDS)
+            writer.writeheader()
+            writer.writerows(self.records)
+
+    def format_report(self) -> list[str]:
+        """Строки отчета для терминала"""
+        lines = [
+            f'{"загрузка":<40}{"count":>7}{"время, мс":>11}'
+            f'{"LCP, мс":>9}{"CLS":>7}{"КБ":>8}'
+        ]
+        for name, stats in self.summary().items():
+            lines.append(
+                f'{name[:39]:<40}{stats["count"]:>7}'
+                f'{_format(stats["duration_ms"], 11, ".0f")}'
+                f'{_format(stats["lcp_ms"], 9, ".0f")}'
+                f'{_format(stats["cls"], 7, ".3f")}'
+                f'{_format(_kilobytes(stats["transfer_bytes"]), 8, ".0f")}'
+            )
+        return lines
+
+
+def _format(value, width: int, spec: str) -> str:
+    """Значение метрики для таблицы, '-' если метрика не измерена"""
+    text = '-' if value is None else format(value, spec)
+    return f'{text:>{width}}'
+
+
+def _kilobytes(size: float | None) -> float | None:
+    return None if size is None else size / 1024
+
+
+def check_thresholds(metrics: dict, limits: dict) -> list[str]:
+    """Проверка метрик загрузки по порогам
+
+    Возвращает описания превышенных порогов. Метрика, которую браузер
+    не поддерживает (например, LCP в webkit), считается нарушением
+
+    :param metrics: метрики из PAGE_METRICS_SCRIPT
+    :param limits: максимальные значения метрик, например {'lcp_ms': 2500}
+    """
+    unknown = set(limits) - set(PAGE_METRICS)
+    if unknown:
+        raise ValueError(
+            f'Неизвестные метрики загрузки: {", ".join(sorted(unknown))}, '
+            f'доступные значения: {", ".join(PAGE_METRICS)}'
+        )
+
+    violations = []
+    for metric, limit in limits.items():
+        value = metrics.get(metric)
+        if value is None:
+            violations.append(f'{metric} не измерена')
+        elif value >= limit:
+            violations.append(f'{metric} = {value:.3f}, порог {limit}')
+    return violations
+
+
+def enable_page_metrics() -> PageMetrics:
+    """Включение сбора метрик загрузки в текущем процессе"""
+    global _page_metrics
+    _page_metrics = PageMetrics()
+    return _page_metrics
+
+
+def disable_page_metrics():
+    """Отключение сбора метрик загрузки"""
+    global _page_metrics
+    _page_metrics = None
+
+
+def get_page_metrics() -> PageMetrics | None:
+    """Сбор метрик загрузки текущего процесса, если он включен"""
+    return _page_metrics
+
+
+class PageMetricsPlugin:
+    """Плагин pytest: сбор метрик загрузки страниц в тестах и отчет
+    в конце сессии
+
+    На воркере xdist метрики передаются контроллеру, который собирает
+    их в общий отчет
+    """
+
+    def __init__(self, report_path: Path):
+        """
+        :param report_path: путь до JSON-отчета, CSV пишется рядом
+        """
+        self.report_path = report_path
+        self.page_metrics = enable_page_metrics()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self.page_metrics.current_test = item.nodeid
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        records = getattr(node, 'workeroutput', {}).get(
+            PAGE_METRICS_OUTPUT_KEY
+        )
+        if records:
+            self.page_metrics.merge(records)
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(session.config, 'workeroutput', None)
+        if workeroutput is not None:
+            workeroutput[PAGE_METRICS_OUTPUT_KEY] = self.page_metrics.records
+        elif self.page_metrics.records:
+            self.page_metrics.write(self.report_path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.page_metrics.records:
+            return
+        terminalreporter.write_sep('=', 'Метрики загрузки страниц')
+        for line in self.page_metrics.format_report():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(
+            f'Отчет: {self.report_path}, '
+            f'{self.report_path.with_suffix(".csv")}'
+        )
+
+    def pytest_unconfigure(self, config):
+        disable_page_metrics()
@@ -0,0 +1,21 @@
+import pytest
+
+from src.ui.browser.config import BrowserConfig
+
+# Конфигурация браузера, загруженная и проверенная при старте сессии
+browser_config_key = pytest.StashKey[BrowserConfig]()
+
+# Отчеты фаз setup/call/teardown теста, для действий по результату теста
+phase_report_key = pytest.StashKey[dict[str, pytest.TestReport]]()
+
+
+def should_keep_artifacts(item) -> bool:
+    """Тест упал или будет перезапущен pytest-rerunfailures
+
+    :param item: тест
+    """
+    reports = item.stash.get(phase_report_key, {}).values()
+    failed = any(
+        report.failed or report.outcome == 'rerun' for report in reports
+    )
+    return failed or getattr(item, 'execution_count', 1) > 1
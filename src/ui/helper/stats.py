@@ -0,0 +1,75 @@
+import os
+from pathlib import Path
+
+import pytest
+
+# Статистика launcher'а текущего процесса (воркера)
+launcher_stats_key = pytest.StashKey[dict]()
+# Статистика, собранная контроллером xdist со всех воркеров
+workers_stats_key = pytest.StashKey[dict]()
+# Ключ, под которым воркер xdist передает статистику контроллеру
+WORKER_OUTPUT_KEY = 'launcher_stats'
+
+PROC_DIR = Path('/proc')
+
+
+def add_launcher_stats(config, stats: dict):
+    """Добавление статистики launcher'а к статистике процесса. На воркере
+    xdist статистика передается контроллеру
+
+    :param config: конфигурация pytest
+    :param stats: разделы статистики {название: значения}
+    """
+    process_stats = config.stash.setdefault(launcher_stats_key, {})
+    process_stats.update(stats)
+    if hasattr(config, 'workeroutput'):
+        config.workeroutput[WORKER_OUTPUT_KEY] = process_stats
+
+
+def format_stats(stats: dict) -> str:
+    """Форматирование статистики в одну строку"""
+    values = []
+    for name, value in stats.items():
+        if isinstance(value, float):
+            value = f'{value:.2f}'
+        values.append(f'{name}: {value}')
+    return ', '.join(values)
+
+
+def process_tree_rss_bytes(root_pid: int = None) -> int | None:
+    """Суммарный RSS процесса и всех его потомков (драйвер playwright
+    и процессы браузера). Возвращает None, если /proc недоступен
+
+    :param root_pid: pid корневого процесса, по умолчанию - текущий
+    """
+    if not PROC_DIR.is_dir():
+        return None
+
+    children = {}
+    for stat_path in PROC_DIR.glob('[0-9]*/stat'):
+        try:
+            stat = stat_path.read_text()
+        except OSError:
+            continue
+        # Имя процесса в скобках может содержать пробелы
+        parent_pid = int(stat.rsplit(')', 1)[1].split()[1])
+        children.setdefault(parent_pid, []).append(int(stat_path.parent.name))
+
+    total = 0
+    pending = [root_pid or os.getpid()]
+    while pending:
+        pid = pending.pop()
+        total += _read_rss_bytes(pid)
+        pending.extend(children.get(pid, []))
+    return total
+
+
+def _read_rss_bytes(pid: int) -> int:
+    try:
+        status = (PROC_DIR / str(pid) / 'status').read_text()
+    except OSError:
+        return 0
+    for line in status.splitlines():
+        if line.startswith('VmRSS:'):
+            return int(line.split()[1]) * 1024
+    return 0
@@ -0,0 +1,232 @@
+import heapq
+import json
+import statistics
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from time import perf_counter
+
+import allure
+import pytest
+
+SLOWEST_STEPS_COUNT = 20
+STEP_TIMINGS_OUTPUT_KEY = 'step_timings'
+
+_timings = None
+
+
+class StepTimings:
+    """Время выполнения шагов allure.step за сессию
+
+    Для каждого шага запоминается его тип (метод Browser или элемента),
+    allure_name элемента, класс страницы и тест. Время вложенных шагов
+    входит во время внешнего шага.
+    """
+
+    def __init__(self, slowest_count: int = SLOWEST_STEPS_COUNT):
+        """
+        :param slowest_count: сколько самых долгих шагов хранить
+        """
+        self.slowest_count = slowest_count
+        self.current_test = None
+        self.durations = {}
+        self.slowest = []
+
+    def record(
+        self,
+        category: str,
+        title: str,
+        duration_sec: float,
+        element: str = None,
+        page_object: str = None,
+    ):
+        """Сохранение времени одного шага"""
+        self.durations.setdefault(category, []).append(duration_sec)
+        self.record_step(
+            {
+                'duration_sec': duration_sec,
+                'category': category,
+                'title': title,
+                'element': element,
+                'page_object': page_object,
+                'test': self.current_test,
+            }
+        )
+
+    def merge(self, data: dict):
+        """Добавление данных воркера xdist, полученных через to_dict()"""
+        for category, durations in data['durations'].items():
+            self.durations.setdefault(category, []).extend(durations)
+        for step in data['slowest']:
+            self.record_step(step)
+
+    def record_step(self, step: dict):
+        """Добавление шага в список самых долгих"""
+        # Куча по длительности: в ней остаются только самые долгие шаги
+        entry = (step['duration_sec'], id(step), step)
+        if len(self.slowest) < self.slowest_count:
+            heapq.heappush(self.slowest, entry)
+        elif step['duration_sec'] > self.slowest[0][0]:
+            heapq.heapreplace(self.slowest, entry)
+
+    def to_dict(self) -> dict:
+        """Данные для передачи контроллеру xdist"""
+        return {
+            'durations': self.durations,
+            'slowest': self.slowest_steps(),
+        }
+
+    def slowest_steps(self) -> list[dict]:
+        """Самые долгие шаги, начиная с самого долгого"""
+        return [step for _, _, step in sorted(self.slowest, reverse=True)]
+
+    def summary(self) -> dict:
+        """Статистика по типам шагов: количество, p50, p95 и максимум
+        в секундах, отсортированная по суммарному времени"""
+        summary = {
+            category: {
+                'count': len(durations),
+                'total_sec': sum(durations),
+                'p50_sec': statistics.median(durations),
+                'p95_sec': _percentile(durations, 95),
+                'max_sec': max(durations),
+            }
+            for category, durations in self.durations.items()
+        }
+        return dict(
+            sorted(
+                summary.items(),
+                key=lambda item: item[1]['total_sec'],
+                reverse=True,
+            )
+        )
+
+    def write_json(self, path: str | Path):
+        """Сохранение отчета в JSON
+
+        :param path: путь до файла отчета
+        """
+        report = {'steps': self.summary(), 'slowest': self.slowest_steps()}
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(
+            json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8'
+        )
+
+    def format_report(self) -> list[str]:
+        """Строки отчета для терминала"""
+        lines = [
+            f'{"шаг":<32}{"count":>8}{"p50, с":>10}{"p95, с":>10}'
+            f'{"max, с":>10}'
+        ]
+        for category, stats in self.summary().items():
+            lines.append(
+                f'{category:<32}{stats["count"]:>8}'
+                f'{stats["p50_sec"]:>10.3f}{stats["p95_sec"]:>10.3f}'
+                f'{stats["max_sec"]:>10.3f}'
+            )
+
+        lines.append('')
+        lines.append(f'Самые долгие шаги ({self.slowest_count}):')
+        for step in self.slowest_steps():
+            page_object = step['page_object']
+            lines.append(
+                f'{step["duration_sec"]:>8.3f} с  {step["title"]}'
+                + (f' [{page_object}]' if page_object else '')
+                + (f'  {step["test"]}' if step['test'] else '')
+            )
+        return lines
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Перцентиль по методу ближайшего ранга"""
+    ordered = sorted(values)
+    rank = max(int(round(percent / 100 * len(ordered))) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def enable_step_timings() -> StepTimings:
+    """Включение замера времени шагов в текущем процессе"""
+    global _timings
+    _timings = StepTimings()
+    return _timings
+
+
+def disable_step_timings():
+    """Отключение замера времени шагов"""
+    global _timings
+    _timings = None
+
+
+def get_step_timings() -> StepTimings | None:
+    """Замер времени шагов текущего процесса, если он включен"""
+    return _timings
+
+
+@contextmanager
+def timed_step(
+    timings: StepTimings,
+    title: str,
+    category: str,
+    element: str = None,
+    page_object: str = None,
+    reported: bool = True,
+):
+    """Шаг с замером времени
+
+    :param timings: куда сохраняется время шага
+    :param title: название шага
+    :param category: тип шага (имя метода)
+    :param element: allure_name элемента
+    :param page_object: класс страницы
+    :param reported: добавлять ли шаг в allure
+    """
+    started = perf_counter()
+    try:
+        with allure.step(title) if reported else nullcontext():
+            yield
+    finally:
+        timings.record(
+            category, title, perf_counter() - started, element, page_object
+        )
+
+
+class StepTimingsPlugin:
+    """Плагин pytest: замер времени шагов в тестах и отчет в конце сессии
+
+    На воркере xdist данные передаются контроллеру, который собирает
+    их в общий отчет
+    """
+
+    def __init__(self, report_path: Path):
+        """
+        :param report_path: путь до JSON-отчета
+        """
+        self.report_path = report_path
+        self.timings = enable_step_timings()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self.timings.current_test = item.nodeid
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        data = getattr(node, 'workeroutput', {}).get(STEP_TIMINGS_OUTPUT_KEY)
+        if data:
+            self.timings.merge(data)
+
+    def pytest_sessionfinish(self, session):
+        workeroutput = getattr(session.config, 'workeroutput', None)
+        if workeroutput is not None:
+            workeroutput[STEP_TIMINGS_OUTPUT_KEY] = self.timings.to_dict()
+        elif self.timings.durations:
+            self.timings.write_json(self.report_path)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.timings.durations:
+            return
+        terminalreporter.write_sep('=', 'Время шагов')
+        for line in self.timings.format_report():
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f'Отчет: {self.report_path}')
+
+    def pytest_unconfigure(self, config):
+        disable_step_timings()
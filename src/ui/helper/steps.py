@@ -0,0 +1,71 @@
+import os
+import sys
+from contextlib import nullcontext
+
+import allure
+
+from src.ui.helper.step_timings import get_step_timings, timed_step
+
+# full - все шаги, actions-only - без шагов чтения (получение текста,
+# URL, cookies и т.п.), off - шаги в allure не добавляются
+STEP_MODES = ('full', 'actions-only', 'off')
+STEP_MODE_ENV = 'ALLURE_STEPS'
+
+_NO_STEP = nullcontext()
+_mode = os.getenv(STEP_MODE_ENV) or 'full'
+
+
+def set_step_mode(mode: str):
+    """Выбор подробности шагов allure
+
+    :param mode: full, actions-only или off
+    """
+    global _mode
+    if mode not in STEP_MODES:
+        raise ValueError(
+            f'Неизвестный режим шагов {mode!r}, доступные значения: '
+            f'{", ".join(STEP_MODES)}'
+        )
+    _mode = mode
+
+
+def get_step_mode() -> str:
+    """Текущий режим шагов allure"""
+    return _mode
+
+
+def step(
+    title: str,
+    *args,
+    read: bool = False,
+    element: str = None,
+    page_object: str = None,
+    stacklevel: int = 1,
+):
+    """Шаг allure с учетом режима шагов. Название собирается через
+    title.format(*args) только для шагов, которые попадут в отчет
+    или замер времени
+
+    :param title: шаблон названия шага
+    :param args: значения для шаблона
+    :param read: шаг только читает состояние страницы,
+                 в режиме actions-only не добавляется
+    :param element: allure_name элемента
+    :param page_object: класс страницы, через которую получен элемент
+    :param stacklevel: на сколько кадров выше находится метод,
+                       по имени которого определяется тип шага
+    """
+    reported = _mode == 'full' or (_mode == 'actions-only' and not read)
+    timings = get_step_timings()
+    if timings is None and not reported:
+        return _NO_STEP
+
+    if args:
+        title = title.format(*args)
+    if timings is None:
+        return allure.step(title)
+
+    category = sys._getframe(stacklevel).f_code.co_name
+    return timed_step(
+        timings, title, category, element, page_object, reported
+    )
@@ -0,0 +1,2 @@
+# Максимальное время ожидания ответа сервера и обновления DOM
+DEFAULT_SYNC_TIMEOUT_MSEC = 10000
@@ -3,6 +3,27 @@ import os
 from dotenv import load_dotenv
 
 load_dotenv()
-BASE_URL = os.getenv('BASE_URL')
+DEFAULT_API_URL = 'https://api.demoblaze.com'
 CART_ENDPOINT = '/cart.html'
 PRODUCT_CARD_ENDPOINT = 'prod.html?idp_='
+ENTRIES_ENDPOINT = '/entries'
+BYCAT_ENDPOINT = '/bycat'
+VIEW_ENDPOINT = '/view'
+VIEWCART_ENDPOINT = '/viewcart'
+ADD_TO_CART_ENDPOINT = '/addtocart'
+DELETE_ITEM_ENDPOINT = '/deleteitem'
+DELETE_CART_ENDPOINT = '/deletecart'
+
+
+def get_base_url() -> str:
+    """Адрес тестового стенда
+
+    Читается из окружения при каждом вызове, чтобы локальный стенд,
+    запущенный в начале сессии, мог подменить BASE_URL
+    """
+    return os.getenv('BASE_URL')
+
+
+def get_api_url() -> str:
+    """Адрес API тестового стенда"""
+    return os.getenv('API_URL', DEFAULT_API_URL)
@@ -1,16 +1,182 @@
 from abc import ABC
+from functools import cached_property
 from typing import Literal
 
-import allure
-from playwright.sync_api import Page, expect, Locator, ElementHandle
+from playwright.sync_api import (
+    Page,
+    expect,
+    Locator,
+    ElementHandle,
+    Response,
+    TimeoutError as PlaywrightTimeoutError,
+)
+
+from src.ui.browser.browser import Browser
+from src.ui.helper.steps import step
+from src.ui.helper.timeouts import DEFAULT_SYNC_TIMEOUT_MSEC
+
+# Помечает текущие дочерние элементы контейнера как устаревшие
+MARK_CHILDREN_STALE_JS = '''
+    (container) => {
+        for (const child of container.children) child.__pwStale = true;
+    }
+'''
+
+# Контейнер перерисован: он не пустой и среди его дочерних элементов
+# нет устаревших
+CHILDREN_RERENDERED_JS = '''
+    (selector) => {
+        const container = document.querySelector(selector);
+        return !!container
+            && container.children.length > 0
+            && !Array.from(container.children).some(child => child.__pwStale);
+    }
+'''
+
+GET_ALL_ATTRIBUTES_JS = '''
+    (elements, name) => elements.map(element => element.getAttribute(name))
+'''
+
+GET_ALL_FIELDS_JS = '''
+    (elements, fields) => elements.map(element => {
+        const row = {};
+        for (const [name, [selector, attribute]] of Object.entries(fields)) {
+            const target = selector
+                ? element.querySelector(selector)
+                : element;
+            if (!target) {
+                row[name] = null;
+            } else if (attribute) {
+                row[name] = target.getAttribute(attribute);
+            } else {
+                row[name] = target.textContent.trim();
+            }
+        }
+        return row;
+    })
+'''
+
+
+# Стратегии поиска по value: метод страницы и имя его аргумента.
+# by_role дополнительно требует role
+VALUE_STRATEGIES = {
+    'by_role': ('get_by_role', 'name'),
+    'by_label': ('get_by_label', 'text'),
+    'by_title': ('get_by_title', 'text'),
+    'by_placeholder': ('get_by_placeholder', 'text'),
+    'by_alt_text': ('get_by_alt_text', 'text'),
+    'by_text': ('get_by_text', 'text'),
+    'by_test_id': ('get_by_test_id', 'test_id'),
+}
+
+
+def check_locator_args(
+    strategy: str = None, selector: str = None, role=None, value: str = None
+):
+    """Проверка аргументов стратегии поиска без создания локатора
+
+    :param strategy: стратегия поиска элемента
+    :param selector: селектор для стратегии locator
+    :param role: роль элемента для стратегии by_role
+    :param value: значение для остальных стратегий
+    """
+    if strategy is None or strategy == 'locator':
+        if not isinstance(selector, str):
+            raise ValueError('Не указан аргумент selector')
+        return
+
+    if strategy not in VALUE_STRATEGIES:
+        raise ValueError(
+            f'Указана неверная стратегия: {strategy}. Доступные значения: '
+            f'"locator, {", ".join(VALUE_STRATEGIES)}"'
+        )
+    if not isinstance(value, str):
+        raise ValueError('Не указан аргумент value')
+    if strategy == 'by_role' and not isinstance(role, str):
+        raise ValueError('Не указан аргумент role')
+
+
+def build_locator(
+    page,
+    strategy: str = None,
+    selector: str = None,
+    role=None,
+    value: str = None,
+    **kwargs,
+):
+    """Создание локатора по указанной стратегии поиска.
+    Используется элементами sync и async API
+
+    :param page: страница (sync или async)
+    :param strategy: стратегия поиска элемента
+    :param selector: селектор для стратегии locator
+    :param role: роль элемента для стратегии by_role
+    :param value: значение для остальных стратегий
+    """
+    check_locator_args(strategy, selector, role, value)
+    if strategy is None or strategy == 'locator':
+        return page.locator(selector, **kwargs)
+
+    if strategy == 'by_role':
+        return page.get_by_role(role=role, name=value)
+    method_name, argument = VALUE_STRATEGIES[strategy]
+    return getattr(page, method_name)(**{argument: value})
+
+
+WAIT_STATES = ('visible', 'hidden', 'attached', 'detached')
+
+
+def wait_state_status(state: str) -> str:
+    """Проверка ожидаемого состояния элемента, возвращает его название
+    для шага allure
+
+    :param state: состояние для wait_for и wait_for_selector
+    """
+    if state not in WAIT_STATES:
+        raise ValueError(
+            f'State must be one of {", ".join(WAIT_STATES)}, '
+            f'but got "{state}"'
+        )
+    return 'видимый' if state in ('visible', 'attached') else 'невидимый'
 
 
-class Base(ABC):
-    """Базовый класс для взаимодействия с элементами"""
+def normalize_fields(fields: dict[str, str | tuple[str, str]]) -> dict:
+    """Приведение полей get_all_fields к виду для GET_ALL_FIELDS_JS:
+    {название: [селектор, атрибут или None]}
+
+    :param fields: поля в формате get_all_fields
+    """
+    return {
+        name: list(field) if isinstance(field, tuple) else [field, None]
+        for name, field in fields.items()
+    }
+
+
+def rerender_timeout_error(
+    selector: str, url_part: str, timeout_msec: float
+) -> AssertionError:
+    """Ошибка: контейнер не перерисовался после ответа сервера"""
+    return AssertionError(
+        f'Содержимое "{selector}" не обновилось '
+        f'за {timeout_msec} мс после ответа "{url_part}"'
+    )
+
+
+class LazyElement:
+    """Элемент с отложенным созданием локатора
+
+    Может объявляться на уровне класса страницы без page:
+    `cart_button = Button(strategy='locator', selector='#cartur')`.
+    При первом обращении через экземпляр страницы создается элемент
+    для ее page и сохраняется в экземпляре, повторные обращения
+    его не пересоздают. Класс создаваемого элемента можно заменить
+    словарем element_types страницы. Локатор строится при первом
+    использовании
+    """
 
     def __init__(
         self,
-        page: Page,
+        page: Page = None,
         strategy: str = None,
         selector: str = None,
         role=None,
@@ -18,55 +184,77 @@ class Base(ABC):
         allure_name: str = None,
         **kwargs,
     ):
+        check_locator_args(strategy, selector, role, value)
         self.page = page
         self.strategy = strategy
         self.selector = selector
         self.role = role
         self.value = value
         self.allure_name = allure_name
+        self.page_object = None
+        self._kwargs = kwargs
+        self._name = None
 
-        if strategy is None or strategy == 'locator':
-            if isinstance(selector, str):
-                self._element = self.page.locator(self.selector, **kwargs)
-                return
-            else:
-                raise ValueError('Не указан аргумент selector')
-
-        if strategy in [
-            'by_role',
-            'by_label',
-            'by_title',
-            'by_placeholder',
-            'by_text' 'by_alt_text',
-            'by_test_id',
-        ]:
-            if not isinstance(value, str):
-                raise ValueError('Не указан аргумент value')
-
-        if strategy == 'by_role':
-            if not isinstance(role, str):
-                raise ValueError('Не указан аргумент role')
-            self._element = self.page.get_by_role(
-                role=self.role, name=self.value
-            )
-        elif strategy == 'by_label':
-            self._element = self.page.get_by_label(text=self.value)
-        elif strategy == 'by_title':
-            self._element = self.page.get_by_title(text=self.value)
-        elif strategy == 'by_placeholder':
-            self._element = self.page.get_by_placeholder(text=self.value)
-        elif strategy == 'by_alt_text':
-            self._element = self.page.get_by_alt_text(text=self.value)
-        elif strategy == 'by_text':
-            self._element = self.page.get_by_text(text=self.value)
-        elif strategy == 'by_test_id':
-            self._element = self.page.get_by_test_id(test_id=self.value)
-        else:
-            raise ValueError(
-                f'Указана неверная стратегия: {strategy}. Доступные значения: '
-                f'"locator, by_role, by_label, by_title, by_placeholder, '
-                f'by_alt_text, by_test_id"'
+    def __set_name__(self, owner, name: str):
+        self._name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        # Страница может заменить класс элемента: async-страницы
+        # используют объявления sync-страниц с элементами async API
+        element_class = getattr(instance, 'element_types', {}).get(
+            type(self), type(self)
+        )
+        element = element_class(
+            instance.page,
+            self.strategy,
+            self.selector,
+            self.role,
+            self.value,
+            self.allure_name,
+            **self._kwargs,
+        )
+        element.page_object = type(instance).__name__
+        instance.__dict__[self._name] = element
+        return element
+
+    @cached_property
+    def _element(self):
+        if self.page is None:
+            raise RuntimeError(
+                f'Элемент "{self.allure_name}" объявлен в классе страницы, '
+                f'обращение к нему возможно только через ее экземпляр'
             )
+        return build_locator(
+            self.page,
+            self.strategy,
+            self.selector,
+            self.role,
+            self.value,
+            **self._kwargs,
+        )
+
+    def _step(self, title: str, *args, read: bool = False):
+        """Шаг allure с элементом и страницей для замера времени шагов
+
+        :param title: шаблон названия шага
+        :param args: значения для шаблона
+        :param read: шаг только читает состояние элемента
+        """
+        return step(
+            title,
+            *args,
+            read=read,
+            element=self.allure_name,
+            page_object=self.page_object,
+            stacklevel=2,
+        )
+
+
+class Base(LazyElement, ABC):
+    """Базовый класс для взаимодействия с элементами"""
 
     def get_element(self) -> Locator:
         """Получение локатора элемента"""
@@ -78,28 +266,159 @@ class Base(ABC):
         :param attribute_name: локатор с атрибутом (напр. 'p#name')
         """
 
-        with allure.step(
-            f'Получение значение атрибута "{attribute_name}" у элемента '
-            f'"{self.allure_name}"'
+        with self._step(
+            'Получение значение атрибута "{}" у элемента "{}"',
+            attribute_name,
+            self.allure_name,
+            read=True,
         ):
             return self._element.get_attribute(attribute_name)
 
     def get_text(self) -> str:
         """Получение текста элемента"""
 
-        with allure.step(f'Получение текста "{self.allure_name}"'):
+        with self._step('Получение текста "{}"', self.allure_name, read=True):
             return self._element.text_content()
 
+    def get_all_texts(self) -> list[str]:
+        """Получение текстов всех найденных элементов за одно обращение"""
+
+        with self._step(
+            'Получение текстов всех "{}"', self.allure_name, read=True
+        ):
+            return self._element.all_text_contents()
+
+    def get_all_attributes(self, attribute_name: str) -> list[str | None]:
+        """Получение значения атрибута у всех найденных элементов
+        за одно обращение
+
+        :param attribute_name: название атрибута (напр. 'href')
+        """
+
+        with self._step(
+            'Получение значений атрибута "{}" у всех "{}"',
+            attribute_name,
+            self.allure_name,
+            read=True,
+        ):
+            return self._element.evaluate_all(
+                GET_ALL_ATTRIBUTES_JS, attribute_name
+            )
+
+    def get_all_fields(
+        self, fields: dict[str, str | tuple[str, str]]
+    ) -> list[dict[str, str | None]]:
+        """Получение значений вложенных полей всех найденных элементов
+        за одно обращение
+
+        :param fields: поля для каждого элемента в виде {название: селектор}
+                       для текста (без пробелов по краям) или
+                       {название: (селектор, атрибут)} для атрибута.
+                       Пустой селектор означает сам элемент.
+                       Если поле не найдено, его значение - None
+        """
+
+        with self._step(
+            'Получение полей {} у всех "{}"',
+            ', '.join(fields),
+            self.allure_name,
+            read=True,
+        ):
+            return self._element.evaluate_all(
+                GET_ALL_FIELDS_JS, normalize_fields(fields)
+            )
+
     def click(self) -> None:
         """Клик по элементу"""
 
-        with allure.step(f'Клик по элементу "{self.allure_name}"'):
+        with self._step('Клик по элементу "{}"', self.allure_name):
             self._element.click()
 
+    def click_and_wait_for_response(
+        self,
+        url_part: str,
+        rerender_selector: str = None,
+        timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC,
+    ) -> Response:
+        """Клик по элементу с ожиданием ответа сервера и, если указано,
+        перерисовки контейнера в DOM. Ответ ожидается через
+        Browser.wait_for_responses
+
+        :param url_part: часть URL ожидаемого ответа (напр. '/bycat')
+        :param rerender_selector: селектор контейнера, содержимое которого
+                                  должно обновиться (напр. '#tbodyid')
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with self._step(
+            'Клик по элементу "{}" и ожидание ответа "{}"',
+            self.allure_name,
+            url_part,
+        ):
+            if rerender_selector:
+                self.page.locator(rerender_selector).evaluate(
+                    MARK_CHILDREN_STALE_JS
+                )
+
+            with Browser(self.page).wait_for_responses(
+                url_part, timeout_msec=timeout_msec
+            ) as (response_info,):
+                self._element.click(timeout=timeout_msec)
+
+            if rerender_selector:
+                try:
+                    self.page.wait_for_function(
+                        CHILDREN_RERENDERED_JS,
+                        arg=rerender_selector,
+                        timeout=timeout_msec,
+                    )
+                except PlaywrightTimeoutError:
+                    raise rerender_timeout_error(
+                        rerender_selector, url_part, timeout_msec
+                    ) from None
+
+            return response_info.value
+
+    def wait_for_children(
+        self, timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC
+    ):
+        """Ожидание того, что в контейнере появятся дочерние элементы
+
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with self._step('Ожидание заполнения "{}"', self.allure_name):
+            self.page.wait_for_function(
+                CHILDREN_RERENDERED_JS,
+                arg=self.selector,
+                timeout=timeout_msec,
+            )
+
+    def wait_for_count(
+        self,
+        expected_count: int,
+        timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC,
+    ):
+        """Ожидание того, что количество найденных элементов станет равным
+        ожидаемому
+
+        :param expected_count: ожидаемое количество элементов
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
+
+        with self._step(
+            'Ожидание количества элементов "{}": {}',
+            self.allure_name,
+            expected_count,
+        ):
+            expect(self._element).to_have_count(
+                expected_count, timeout=timeout_msec
+            )
+
     def double_click(self) -> None:
         """Двойной клик по элементу"""
 
-        with allure.step(f'Клик по элементу "{self.allure_name}"'):
+        with self._step('Клик по элементу "{}"', self.allure_name):
             self.page.dblclick(self.selector)
 
     def choose_dropdown_option(self, option: str) -> None:
@@ -108,24 +427,24 @@ class Base(ABC):
         :param option: значение, которое нужно выбрать
         """
 
-        with allure.step(
-            f'Выбор значения "{self.value}" у элемента "{self.allure_name}"'
+        with self._step(
+            'Выбор значения "{}" у элемента "{}"', self.value, self.allure_name
         ):
             self.page.select_option(self.selector, option)
 
     def is_enabled(self) -> bool:
         """Проверка того, что элемент активирован"""
 
-        with allure.step(
-            f'Проверка того, что элемент "{self.allure_name}" активирован'
+        with self._step(
+            'Проверка того, что элемент "{}" активирован', self.allure_name
         ):
             return self._element.is_enabled()
 
     def is_disabled(self) -> bool:
         """Проверка того, что элемент неактивен"""
 
-        with allure.step(
-            f'Проверка того, что элемент "{self.allure_name}" неактивен'
+        with self._step(
+            'Проверка того, что элемент "{}" неактивен', self.allure_name
         ):
             return self._element.is_disabled()
 
@@ -137,8 +456,8 @@ class Base(ABC):
 
         element_status = 'активирован' if enabled else 'неактивный'
 
-        with allure.step(
-            f'Проверка того, что {self.allure_name} {element_status}'
+        with self._step(
+            'Проверка того, что {} {}', self.allure_name, element_status
         ):
             if enabled:
                 expect(self._element).to_be_enabled()
@@ -151,8 +470,8 @@ class Base(ABC):
         :param timeout_msec: максимальное время ожидания в миллисекундах
         """
 
-        with allure.step(
-            f'Проверка того, что элемент "{self.allure_name}" видимый'
+        with self._step(
+            'Проверка того, что элемент "{}" видимый', self.allure_name
         ):
             return self._element.is_visible(timeout=timeout_msec)
 
@@ -163,8 +482,8 @@ class Base(ABC):
 
         element_status = 'видимый' if visible else 'невидимый'
 
-        with allure.step(
-            f'Проверка того, что {self.allure_name} {element_status}'
+        with self._step(
+            'Проверка того, что {} {}', self.allure_name, element_status
         ):
             if visible:
                 expect(self._element).to_be_visible()
@@ -186,7 +505,7 @@ class Base(ABC):
                                             напр. {'x':10, 'y':70}
         """
 
-        with allure.step(f'Перетаскивание элемента "{self.allure_name}"'):
+        with self._step('Перетаскивание элемента "{}"', self.allure_name):
             self._element.drag_to(
                 target,
                 source_position=start_position,
@@ -200,9 +519,10 @@ class Base(ABC):
         :param text: текст для проверки
         """
 
-        with allure.step(
-            f'Проверка того, что элемент "{self.allure_name}" '
-            f'содержит текст: "{text}"'
+        with self._step(
+            'Проверка того, что элемент "{}" содержит текст: "{}"',
+            self.allure_name,
+            text,
         ):
             expect(self._element).to_have_text(text)
 
@@ -212,9 +532,10 @@ class Base(ABC):
         :param text: текст для проверки
         """
 
-        with allure.step(
-            f'Проверка того, что у элемента "{self.allure_name}" '
-            f'отсутствует текст: "{text}"'
+        with self._step(
+            'Проверка того, что у элемента "{}" отсутствует текст: "{}"',
+            self.allure_name,
+            text,
         ):
             expect(self._element).not_to_have_text(text)
 
@@ -224,38 +545,39 @@ class Base(ABC):
         :param text: текст для проверки.
         """
 
-        with allure.step(
-            f'Проверка того, что элемент "{self.allure_name}" '
-            f'содержит текст: "{text}"'
+        with self._step(
+            'Проверка того, что элемент "{}" содержит текст: "{}"',
+            self.allure_name,
+            text,
         ):
             expect(self._element).to_contain_text(text)
 
     def is_editable(self):
         """Проверка того, что элемент является редактируемым"""
 
-        with allure.step(
-            f'Проверка, что элемент "{self.allure_name}" можно редактировать'
+        with self._step(
+            'Проверка, что элемент "{}" можно редактировать', self.allure_name
         ):
             expect(self._element).to_be_editable()
 
     def is_empty(self):
         """Проверка того, что элемент ничего не содержит"""
 
-        with allure.step(
-            f'Проверка того, что элемент "{self.allure_name}" пустой'
+        with self._step(
+            'Проверка того, что элемент "{}" пустой', self.allure_name
         ):
             expect(self._element).to_be_empty()
 
     def hover(self):
         """Установка фиксации (hover) на элементе"""
 
-        with allure.step(f'Поставим hover на элементе "{self.allure_name}"'):
+        with self._step('Поставим hover на элементе "{}"', self.allure_name):
             self._element.hover()
 
     def focus(self):
         """Установка фокуса на элементе"""
 
-        with allure.step(f'Установка фокуса на элементе "{self.allure_name}"'):
+        with self._step('Установка фокуса на элементе "{}"', self.allure_name):
             self._element.focus()
 
     def locator_has_values(self, value: str | list[str]):
@@ -264,9 +586,10 @@ class Base(ABC):
         :param value: проверяемые значения
         """
 
-        with allure.step(
-            f'Проверка того, что элемент "{self.allure_name}" '
-            f'содержит значени(е/я): {value}'
+        with self._step(
+            'Проверка того, что элемент "{}" содержит значени(е/я): {}',
+            self.allure_name,
+            value,
         ):
             element_locator = self._element.select_option(value)
             expect(element_locator).to_have_values(value)
@@ -287,18 +610,9 @@ class Base(ABC):
         -`detached` элемент исчез из DOM;
         """
 
-        valid_states = ['visible', 'hidden', 'attached', 'detached']
-        if state not in valid_states:
-            raise ValueError(
-                f'State must be one of {", ".join(valid_states)}, '
-                f'but got "{state}"'
-            )
-
-        element_status = (
-            'видимый' if state in ('visible', 'attached') else 'невидимый'
-        )
-        with allure.step(
-            f'Ожидание того, что {self.allure_name} станет {element_status}'
+        element_status = wait_state_status(state)
+        with self._step(
+            'Ожидание того, что {} станет {}', self.allure_name, element_status
         ):
             self._element.wait_for(state=state, timeout=timeout_msec)
 
@@ -329,18 +643,9 @@ class Base(ABC):
         -`detached` элемент исчез из DOM;
         """
 
-        valid_states = ['visible', 'hidden', 'attached', 'detached']
-        if state not in valid_states:
-            raise ValueError(
-                f'State must be one of {", ".join(valid_states)}, '
-                f'but got "{state}"'
-            )
-
-        element_status = (
-            'видимый' if state in ('visible', 'attached') else 'невидимый'
-        )
-        with allure.step(
-            f'Ожидание того, что {self.allure_name} станет {element_status}'
+        element_status = wait_state_status(state)
+        with self._step(
+            'Ожидание того, что {} станет {}', self.allure_name, element_status
         ):
             self.page.wait_for_selector(
                 selector=self.selector, state=state, timeout=timeout_msec
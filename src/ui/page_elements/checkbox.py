@@ -1,4 +1,3 @@
-import allure
 from playwright.sync_api import expect
 
 from src.ui.page_elements.base import Base
@@ -13,14 +12,14 @@ class CheckBox(Base):
         :param index: индекс чекбокса.
         """
 
-        with allure.step(f'Установка чекбокса "{self.allure_name}"'):
+        with self._step('Установка чекбокса "{}"', self.allure_name):
             elements = self._element
             elements.nth(index).check()
 
     def is_checked(self):
         """Проверка, что чек-бокс выбран"""
 
-        with allure.step(
-            f'Проверка, что чекбокс "{self.allure_name}" проставлен'
+        with self._step(
+            'Проверка, что чекбокс "{}" проставлен', self.allure_name
         ):
             expect(self._element).to_be_checked()
@@ -1,5 +1,3 @@
-import allure
-
 from src.ui.page_elements.base import Base
 
 
@@ -16,8 +14,8 @@ class Input(Base):
 
         display_text = text if not secure else "***"
 
-        with allure.step(
-            f'Ввод текста "{display_text}" в поле "{self.allure_name}"'
+        with self._step(
+            'Ввод текста "{}" в поле "{}"', display_text, self.allure_name
         ):
             if delay:
                 self._element.type(text, delay=delay)
@@ -27,13 +25,13 @@ class Input(Base):
     def clear(self):
         """Очистка поля ввода"""
 
-        with allure.step(f'Очистка поля "{self.allure_name}"'):
+        with self._step('Очистка поля "{}"', self.allure_name):
             self._element.clear()
 
     def press_enter(self):
         """Нажатие Enter в поле"""
 
-        with allure.step(f'Нажатие Enter в поле "{self.allure_name}"'):
+        with self._step('Нажатие Enter в поле "{}"', self.allure_name):
             self._element.press("Enter")
 
     def get_input_value(self, timeout_msec: float = None) -> str:
@@ -42,8 +40,8 @@ class Input(Base):
         :param timeout_msec: время ожидания в миллисекундах
         """
 
-        with allure.step(
-            f'Получение значения поля ввода "{self.allure_name}"'
+        with self._step(
+            'Получение значения поля ввода "{}"', self.allure_name, read=True
         ):
             return self._element.input_value(timeout=timeout_msec)
 
@@ -57,9 +55,11 @@ class Input(Base):
         :param text: текст для ввода.
         """
 
-        with allure.step(
-            f'Ввод текста: {text} в поле {shadow_input_locator} '
-            f'теневого элемента {shadow_locator}'
+        with self._step(
+            'Ввод текста: {} в поле {} теневого элемента {}',
+            text,
+            shadow_input_locator,
+            shadow_locator,
         ):
             shadow_root = self._element.evaluate_handle(
                 f'document.querySelector("{shadow_locator}").shadowRoot'
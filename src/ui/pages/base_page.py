@@ -1,65 +1,117 @@
-from playwright.sync_api import Page
 from src.ui.browser.browser import Browser
-from src.ui.helper.urls import BASE_URL, CART_ENDPOINT, PRODUCT_CARD_ENDPOINT
+from src.ui.helper.page_metrics import check_thresholds
+from src.ui.helper.urls import (
+    BYCAT_ENDPOINT,
+    CART_ENDPOINT,
+    ENTRIES_ENDPOINT,
+    PRODUCT_CARD_ENDPOINT,
+    VIEWCART_ENDPOINT,
+    get_base_url,
+)
 from src.ui.page_elements.button import Button
 from src.ui.page_elements.element import Element
 from src.ui.page_elements.text import Text
 
+PRODUCTS_SELECTOR = '#tbodyid'
 
-class BasePage:
-    """Логика для тестов на главной странице"""
 
-    def __init__(self, page: Page, url=BASE_URL):
+class BasePageMixin:
+    """Элементы и логика без обращений к браузеру, общие для страниц
+    sync и async API
+
+    Элементы объявляются классами sync API, async-страницы заменяют их
+    через element_types. Страница задает browser_class и, если нужно,
+    endpoint - путь страницы относительно базового URL
+    """
+
+    browser_class = None
+    endpoint = ''
+
+    categories_header = Text(
+        strategy='locator',
+        selector='#cat',
+        allure_name='Заголовок Категории',
+    )
+
+    phones_button = Button(
+        strategy='by_text', value='Phones', allure_name='Phones'
+    )
+
+    laptops_button = Button(
+        strategy='by_text', value='Laptops', allure_name='Laptops'
+    )
+
+    monitors_button = Button(
+        strategy='by_text', value='Monitors', allure_name='Monitors'
+    )
+
+    products = Element(
+        strategy='locator',
+        selector=PRODUCTS_SELECTOR,
+        allure_name='Карточки товаров',
+    )
+
+    cards = Element(
+        strategy='locator',
+        selector='.card',
+        allure_name='Карточка товара',
+    )
+
+    cards_titles = Element(
+        strategy='locator',
+        selector='.card-title a',
+        allure_name='Заголовок карточки',
+    )
+
+    cart_button = Button(
+        strategy='locator', selector='#cartur', allure_name='Корзина'
+    )
+
+    def __init__(self, page, url: str = None):
         self.page = page
+        if url is None:
+            url = get_base_url()
+            if self.endpoint:
+                url += self.endpoint
         self.url = url
-        self.browser = Browser(page)
+        self.browser = self.browser_class(page)
 
-        self.categories_header = Text(
-            page,
-            strategy='locator',
-            selector='#cat',
-            allure_name='Заголовок Категории',
+    @staticmethod
+    def _assert_cards_with_similar_title(cards_texts: list[str], title: str):
+        cards_with_title_count = sum(
+            title in card_text for card_text in cards_texts
         )
 
-        self.phones_button = Button(
-            page, strategy='by_text', value='Phones', allure_name='Phones'
-        )
-        self.laptops_button = Button(
-            page, strategy='by_text', value='Laptops', allure_name='Laptops'
-        )
-        self.monitors_button = Button(
-            page, strategy='by_text', value='Monitors', allure_name='Monitors'
-        )
+        assert (
+            cards_with_title_count >= 2
+        ), f'Отображаются не все карточки с названием {title}'
 
-        self.products = Element(
-            page,
-            strategy='locator',
-            selector='#tbodyid',
-            allure_name='Карточки товаров',
+    def _assert_url_ends_with(self, endpoint: str):
+        page_url = self.page.url
+        assert page_url.endswith(
+            endpoint
+        ), f'{page_url} should end with {endpoint}'
+
+    @staticmethod
+    def _assert_page_load_metrics(metrics: dict, limits: dict):
+        violations = check_thresholds(metrics, limits)
+        assert not violations, (
+            f'Загрузка страницы медленнее порогов: {"; ".join(violations)}'
         )
 
-        self.cards = Element(
-            page,
-            strategy='locator',
-            selector='.card',
-            allure_name='Карточка товара',
-        )
 
-        self.cards_titles = Element(
-            page,
-            strategy='locator',
-            selector='.card-title a',
-            allure_name='Заголовок карточки',
-        )
+class BasePage(BasePageMixin):
+    """Логика для тестов на главной странице"""
 
-        self.cart_button = Button(
-            page, strategy='locator', selector='#cartur', allure_name='Корзина'
-        )
+    browser_class = Browser
 
     def open(self):
-        """Открытие страницы по URL"""
+        """Открытие страницы с ожиданием загрузки и отрисовки карточек
+        товаров"""
 
-        self.browser.go_to_url(url=self.url)
+        with self.browser.wait_for_responses(ENTRIES_ENDPOINT):
+            self.browser.go_to_url(url=self.url)
+        self.products.wait_for_children()
 
     def assert_categories_presence(self):
         """Проверка наличия заголовка CATEGORIES"""
@@ -76,8 +128,10 @@ class BasePage:
     def navigate_to_phones_section(self):
         """Переход в раздел Телефоны"""
 
-        self.phones_button.click()
-        self.page.wait_for_timeout(1500)
+        with self.browser.measure_page_load('Раздел Phones'):
+            self.phones_button.click_and_wait_for_response(
+                BYCAT_ENDPOINT, rerender_selector=PRODUCTS_SELECTOR
+            )
 
     def assert_laptops_button_is_displayed_and_enabled(self):
         """Проверка кликабельности кнопки Laptops"""
@@ -88,8 +142,10 @@ class BasePage:
     def navigate_to_laptops_section(self):
         """Переход в раздел Ноутбуки"""
 
-        self.laptops_button.click()
-        self.page.wait_for_timeout(1500)
+        with self.browser.measure_page_load('Раздел Laptops'):
+            self.laptops_button.click_and_wait_for_response(
+                BYCAT_ENDPOINT, rerender_selector=PRODUCTS_SELECTOR
+            )
 
     def assert_monitors_button_is_displayed_and_enabled(self):
         """Проверка кликабельности кнопки Monitors"""
@@ -100,35 +156,35 @@ class BasePage:
     def navigate_to_monitors_section(self):
         """Переход в раздел Мониторы"""
 
-        self.monitors_button.click()
-        self.page.wait_for_timeout(1500)
+        with self.browser.measure_page_load('Раздел Monitors'):
+            self.monitors_button.click_and_wait_for_response(
+                BYCAT_ENDPOINT, rerender_selector=PRODUCTS_SELECTOR
+            )
+
+    def assert_page_load_metrics(self, **limits: float):
+        """Проверка метрик загрузки открытой страницы по порогам,
+        например lcp_ms=2500
+
+        :param limits: максимальные значения метрик из PAGE_METRICS
+        """
+
+        self._assert_page_load_metrics(
+            self.browser.get_page_load_metrics(), limits
+        )
 
     def assert_number_of_cards(self, number_of_cards: int):
         """Проверка количества карточек на странице"""
 
-        all_cards = self.cards.get_element()
-        cards_count = all_cards.count()
-        assert (
-            cards_count == number_of_cards
-        ), f'Number of cards should be {number_of_cards} but got {cards_count}'
+        self.cards.wait_for_count(number_of_cards)
 
     def assert_display_of_cards_with_similar_title(self, title: str):
         """Проверка отображения карточек с указанным названием"""
 
         self.products.wait_for()
 
-        all_cards = self.cards.get_element()
-        cards_count = all_cards.count()
-
-        cards_with_title_count = 0
-        for i in range(cards_count):
-            card_text = all_cards.nth(i).text_content()
-            if title in card_text:
-                cards_with_title_count += 1
-
-        assert (
-            cards_with_title_count >= 2
-        ), f'Отображаются не все карточки с названием {title}'
+        self._assert_cards_with_similar_title(
+            self.cards.get_all_texts(), title
+        )
 
     def navigate_to_certain_product_card_page(self, card_number: int):
         """Переход на страницу карточки товара по её номеру"""
@@ -142,17 +198,11 @@ class BasePage:
         with self.page.expect_navigation():
             product_title.click()
 
-        page_url = self.page.url
-        assert page_url.endswith(
-            f'{PRODUCT_CARD_ENDPOINT}{card_number}'
-        ), f'{page_url} should end with {PRODUCT_CARD_ENDPOINT}{card_number}'
+        self._assert_url_ends_with(f'{PRODUCT_CARD_ENDPOINT}{card_number}')
 
     def navigate_to_cart(self):
         """Переход в корзину"""
 
-        self.cart_button.click()
-        page_url = self.page.url
-
-        assert page_url.endswith(
-            CART_ENDPOINT
-        ), f'{page_url} should end with {CART_ENDPOINT}'
+        with self.browser.wait_for_responses(VIEWCART_ENDPOINT):
+            self.cart_button.click()
+        self._assert_url_ends_with(CART_ENDPOINT)
@@ -1,52 +1,84 @@
-from playwright.sync_api import Page
-from src.ui.helper.urls import BASE_URL, CART_ENDPOINT
+from src.ui.helper.steps import step
+from src.ui.helper.timeouts import DEFAULT_SYNC_TIMEOUT_MSEC
+from src.ui.helper.urls import (
+    CART_ENDPOINT,
+    DELETE_ITEM_ENDPOINT,
+    VIEWCART_ENDPOINT,
+)
 from src.ui.page_elements.button import Button
 from src.ui.page_elements.element import Element
 from src.ui.page_elements.text import Text
-from src.ui.pages.base_page import BasePage
-
-
-class CartPage(BasePage):
+from src.ui.pages.base_page import BasePage, BasePageMixin
+from src.ui.pages.cart_snapshot import CART_SNAPSHOT_JS, CartSnapshot
+
+PRODUCT_ROWS_SELECTOR = '#tbodyid tr'
+TOTAL_PRICE_SELECTOR = '#totalp'
+CART_SNAPSHOT_ARGS = {
+    'rowsSelector': PRODUCT_ROWS_SELECTOR,
+    'totalSelector': TOTAL_PRICE_SELECTOR,
+}
+
+
+class CartPageMixin(BasePageMixin):
+    """Элементы корзины, общие для страниц sync и async API"""
+
+    endpoint = CART_ENDPOINT
+
+    place_order_button = Button(
+        strategy='by_role',
+        role='button',
+        value='Place Order',
+        allure_name='Кнопка Place Order',
+    )
+
+    products_table = Element(
+        strategy='locator',
+        selector='.table-responsive',
+        allure_name='Таблица товаров в корзине',
+    )
+
+    product_rows = Element(
+        strategy='locator',
+        selector=PRODUCT_ROWS_SELECTOR,
+        allure_name='Строки товаров',
+    )
+
+    total_price = Text(
+        strategy='locator',
+        selector=TOTAL_PRICE_SELECTOR,
+        allure_name='Общая цена',
+    )
+
+    # Кнопка удаления первого товара: при нескольких товарах
+    # поиск только по тексту находит несколько элементов
+    delete_button = Button(
+        strategy='locator',
+        selector=f'{PRODUCT_ROWS_SELECTOR} >> nth=0 >> text=Delete',
+        allure_name='Кнопка удаления товара',
+    )
+
+
+class CartPage(CartPageMixin, BasePage):
     """Логика для тестов корзины"""
 
-    def __init__(self, page: Page, url=BASE_URL + CART_ENDPOINT):
-        super().__init__(page, url)
-
-        self.place_order_button = Button(
-            page,
-            strategy='by_role',
-            role='button',
-            value='Place Order',
-            allure_name='Кнопка Place Order',
-        )
+    def open(self):
+        """Открытие корзины с ожиданием ответа сервера со списком товаров"""
 
-        self.products_table = Element(
-            page,
-            strategy='locator',
-            selector='.table-responsive',
-            allure_name='Таблица товаров в корзине',
-        )
+        with self.browser.wait_for_responses(VIEWCART_ENDPOINT):
+            self.browser.go_to_url(url=self.url)
 
-        self.product_rows = Element(
-            page,
-            strategy='locator',
-            selector='#tbodyid tr',
-            allure_name='Строки товаров',
-        )
+    def wait_for_cart_ready(
+        self,
+        expected_count: int,
+        timeout_msec: float = DEFAULT_SYNC_TIMEOUT_MSEC,
+    ):
+        """Ожидание отрисовки корзины с ожидаемым количеством товаров
 
-        self.total_price = Text(
-            page,
-            strategy='locator',
-            selector='#totalp',
-            allure_name='Общая цена',
-        )
+        :param expected_count: ожидаемое количество товаров
+        :param timeout_msec: максимальное время ожидания в миллисекундах
+        """
 
-        self.delete_button = Button(
-            page,
-            strategy='by_text',
-            value='Delete',
-            allure_name='Кнопка удаления товара',
-        )
+        self.product_rows.wait_for_count(expected_count, timeout_msec)
 
     def assert_place_order_button_is_displayed_and_enabled(self):
         """Проверка кликабельности кнопки Place Order"""
@@ -55,18 +87,22 @@ class CartPage(BasePage):
         self.place_order_button.assert_element_visibility()
         self.place_order_button.assert_element_state_of_activity()
 
+    def get_cart_snapshot(self) -> CartSnapshot:
+        """Получение всех строк корзины и итоговой суммы за одно обращение"""
+
+        with step('Получение содержимого корзины', read=True):
+            return CartSnapshot.from_dict(
+                self.page.evaluate(CART_SNAPSHOT_JS, CART_SNAPSHOT_ARGS)
+            )
+
     def is_product_in_cart(
         self, expected_name: str, expected_price: str
-    ) -> bool | None:
+    ) -> bool:
         """Проверка наличия товара с указанными названием и ценой"""
 
-        rows = self.product_rows.get_element()
-        count = rows.count()
-
-        for i in range(count):
-            row_text = rows.nth(i).text_content()
-            return expected_name in row_text and expected_price in row_text
-        return None
+        return self.get_cart_snapshot().has_product(
+            expected_name, expected_price
+        )
 
     def get_product_count(self) -> int:
         """Получение количества товаров в корзине"""
@@ -78,23 +114,9 @@ class CartPage(BasePage):
     ):
         """Проверка добавления товара в корзину"""
 
-        self.page.wait_for_timeout(1500)
-
-        assert self.is_product_in_cart(expected_name, expected_price), (
-            f'Товар {expected_name} с ценой {expected_price} '
-            f'не найден в корзине'
-        )
-
-        total_price = self.total_price.get_text()
-        assert total_price == expected_price, (
-            f'Общая сумма {total_price} не соответствует '
-            f'цене товара {expected_price}'
-        )
-
-        products_count = self.get_product_count()
-        assert products_count == expected_count, (
-            f'Количество товара {products_count} не соответствует '
-            f'ожидаемому {expected_count}'
+        self.wait_for_cart_ready(expected_count)
+        self.get_cart_snapshot().assert_product_added(
+            expected_name, expected_price, expected_count
         )
 
     def delete_product(self):
@@ -104,13 +126,14 @@ class CartPage(BasePage):
         self.delete_button.assert_element_visibility()
         self.delete_button.assert_element_state_of_activity()
 
-        self.delete_button.click()
-        self.product_rows.get_element().first.wait_for(state='detached')
+        products_count = self.get_product_count()
+        with self.browser.wait_for_responses(DELETE_ITEM_ENDPOINT):
+            self.delete_button.click()
+        self.wait_for_cart_ready(products_count - 1)
 
     def verify_cart_is_empty(self):
         """Проверка, что корзина пуста"""
-        rows = self.product_rows.get_element()
-        assert rows.count() == 0, 'Корзина не пуста — остались товары'
+        self.get_cart_snapshot().assert_empty()
 
     def verify_product_removed(self, product_name: str, product_price: str):
         """Проверка того, что товар удален из корзины
@@ -118,11 +141,9 @@ class CartPage(BasePage):
         :param product_price: цена товара
         """
 
-        assert not self.is_product_in_cart(
+        self.get_cart_snapshot().assert_product_removed(
             product_name, product_price
-        ), f'Товар {product_name} все еще находится в корзине после удаления'
-
-        self.verify_cart_is_empty()
+        )
 
     def click_place_order_button(self):
         """Нажатие на кнопку Place Order"""
@@ -0,0 +1,114 @@
+from dataclasses import dataclass, field
+
+# Считывает все строки корзины и итоговую сумму за одно обращение
+CART_SNAPSHOT_JS = '''
+    ({rowsSelector, totalSelector}) => {
+        const rows = Array.from(document.querySelectorAll(rowsSelector));
+        const total = document.querySelector(totalSelector);
+        return {
+            rows: rows.map(row => {
+                const cells = row.querySelectorAll('td');
+                const image = row.querySelector('img');
+                const deleteLink = row.querySelector('a[onclick]');
+                const deleteMatch = deleteLink && /deleteItem\\('([^']+)'\\)/
+                    .exec(deleteLink.getAttribute('onclick'));
+                return {
+                    title: cells[1] ? cells[1].textContent.trim() : '',
+                    price: cells[2] ? cells[2].textContent.trim() : '',
+                    image_src: image ? image.getAttribute('src') : null,
+                    delete_id: deleteMatch ? deleteMatch[1] : null,
+                };
+            }),
+            total: total ? total.textContent.trim() : '',
+        };
+    }
+'''
+
+
+@dataclass(frozen=True)
+class CartRow:
+    """Строка таблицы товаров в корзине"""
+
+    title: str
+    price: str
+    image_src: str | None
+    delete_id: str | None
+
+
+@dataclass(frozen=True)
+class CartSnapshot:
+    """Состояние корзины, считанное за одно обращение к странице"""
+
+    rows: tuple[CartRow, ...]
+    total: str
+    _rows_by_title: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        rows_by_title = {}
+        for row in self.rows:
+            rows_by_title.setdefault(row.title, []).append(row)
+        object.__setattr__(self, '_rows_by_title', rows_by_title)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'CartSnapshot':
+        """Создание снимка из результата CART_SNAPSHOT_JS"""
+        return cls(
+            rows=tuple(CartRow(**row) for row in data['rows']),
+            total=data['total'],
+        )
+
+    @property
+    def count(self) -> int:
+        """Количество товаров в корзине"""
+        return len(self.rows)
+
+    def find(self, title: str) -> list[CartRow]:
+        """Поиск строк с указанным названием товара
+
+        :param title: название товара
+        """
+        return self._rows_by_title.get(title, [])
+
+    def has_product(self, title: str, price: str) -> bool:
+        """Проверка наличия товара с указанными названием и ценой
+
+        :param title: название товара
+        :param price: цена товара
+        """
+        return any(row.price == price for row in self.find(title))
+
+    def assert_product_added(self, title: str, price: str, count: int):
+        """Проверка корзины после добавления товара
+
+        :param title: название товара
+        :param price: цена товара, она же ожидаемая общая сумма
+        :param count: ожидаемое количество товаров
+        """
+        assert self.has_product(title, price), (
+            f'Товар {title} с ценой {price} не найден в корзине'
+        )
+
+        assert self.total == price, (
+            f'Общая сумма {self.total} не соответствует цене товара {price}'
+        )
+
+        assert self.count == count, (
+            f'Количество товара {self.count} не соответствует '
+            f'ожидаемому {count}'
+        )
+
+    def assert_product_removed(self, title: str, price: str):
+        """Проверка корзины после удаления единственного товара
+
+        :param title: название товара
+        :param price: цена товара
+        """
+        assert not self.has_product(
+            title, price
+        ), f'Товар {title} все еще находится в корзине после удаления'
+
+        self.assert_empty()
+
+    def assert_empty(self):
+        """Проверка, что корзина пуста"""
+        assert self.count == 0, 'Корзина не пуста — остались товары'
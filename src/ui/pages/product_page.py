@@ -1,36 +1,38 @@
-from playwright.sync_api import Page
-
+from src.ui.helper.urls import ADD_TO_CART_ENDPOINT
 from src.ui.page_elements.button import Button
 from src.ui.page_elements.text import Text
-from src.ui.pages.base_page import BasePage
+from src.ui.pages.base_page import BasePage, BasePageMixin
 
 
-class ProductPage(BasePage):
-    """Логика для тестов карточки товара"""
+class ProductPageMixin(BasePageMixin):
+    """Элементы карточки товара, общие для страниц sync и async API"""
+
+    product_title = Text(
+        strategy='locator',
+        selector='h2.name',
+        allure_name='Название товара',
+    )
+
+    product_price = Text(
+        strategy='locator',
+        selector='h3.price-container',
+        allure_name='Цена товара',
+    )
+
+    add_to_cart_button = Button(
+        strategy='by_text',
+        value='Add to cart',
+        allure_name='Кнопка добавить в корзину',
+    )
 
-    def __init__(self, page: Page):
-        super().__init__(page)
-
-        self.product_title = Text(
-            page,
-            strategy='locator',
-            selector='h2.name',
-            allure_name='Название товара',
-        )
-
-        self.product_price = Text(
-            page,
-            strategy='locator',
-            selector='h3.price-container',
-            allure_name='Цена товара',
-        )
-
-        self.add_to_cart_button = Button(
-            page,
-            strategy='by_text',
-            value='Add to cart',
-            allure_name='Кнопка добавить в корзину',
-        )
+    @staticmethod
+    def _parse_price(full_price_text: str) -> str:
+        """Цена без валюты и подписи: '$360 *includes tax' -> '360'"""
+        return full_price_text.split('*')[0].strip().replace('$', '')
+
+
+class ProductPage(ProductPageMixin, BasePage):
+    """Логика для тестов карточки товара"""
 
     def wait_for_page_load(self):
         """Ожидание загрузки страницы товара"""
@@ -45,8 +47,7 @@ class ProductPage(BasePage):
         self.wait_for_page_load()
 
         product_name = self.product_title.get_text()
-        full_price_text = self.product_price.get_text()
-        product_price = full_price_text.split('*')[0].strip().replace('$', '')
+        product_price = self._parse_price(self.product_price.get_text())
 
         return product_name, product_price
 
@@ -55,12 +56,11 @@ class ProductPage(BasePage):
 
         product_name, product_price = self.get_product_info()
 
-        with self.page.expect_event('dialog') as dialog_info:
-            self.add_to_cart_button.click()
+        with self.browser.wait_for_responses(ADD_TO_CART_ENDPOINT):
+            with self.page.expect_event('dialog') as dialog_info:
+                self.add_to_cart_button.click()
 
         dialog = dialog_info.value
         dialog.accept()
 
-        self.page.wait_for_timeout(500)
-
         return product_name, product_price
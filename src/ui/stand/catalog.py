@@ -0,0 +1,38 @@
+# Каталог товаров локального стенда, повторяющий demoblaze.com:
+# 7 телефонов, 6 ноутбуков и 2 монитора
+PRODUCTS = (
+    {'id': 1, 'title': 'Samsung galaxy s6', 'price': 360, 'cat': 'phone'},
+    {'id': 2, 'title': 'Nokia lumia 1520', 'price': 820, 'cat': 'phone'},
+    {'id': 3, 'title': 'Nexus 6', 'price': 650, 'cat': 'phone'},
+    {'id': 4, 'title': 'Samsung galaxy s7', 'price': 800, 'cat': 'phone'},
+    {'id': 5, 'title': 'Iphone 6 32gb', 'price': 790, 'cat': 'phone'},
+    {'id': 6, 'title': 'Sony xperia z5', 'price': 320, 'cat': 'phone'},
+    {'id': 7, 'title': 'HTC One M9', 'price': 700, 'cat': 'phone'},
+    {'id': 8, 'title': 'Sony vaio i5', 'price': 790, 'cat': 'notebook'},
+    {'id': 9, 'title': 'Sony vaio i7', 'price': 790, 'cat': 'notebook'},
+    {'id': 10, 'title': 'Apple monitor 24', 'price': 400, 'cat': 'monitor'},
+    {'id': 11, 'title': 'MacBook air', 'price': 700, 'cat': 'notebook'},
+    {'id': 12, 'title': 'Dell i7 8gb', 'price': 700, 'cat': 'notebook'},
+    {
+        'id': 13,
+        'title': '2017 Dell 15.6 Inch',
+        'price': 700,
+        'cat': 'notebook',
+    },
+    {'id': 14, 'title': 'ASUS Full HD', 'price': 230, 'cat': 'monitor'},
+    {'id': 15, 'title': 'MacBook Pro', 'price': 1100, 'cat': 'notebook'},
+)
+
+# Количество товаров на первой странице каталога
+ENTRIES_PAGE_SIZE = 9
+
+
+def get_product(product_id) -> dict | None:
+    """Поиск товара по идентификатору
+
+    :param product_id: идентификатор товара (число или строка)
+    """
+    for product in PRODUCTS:
+        if str(product['id']) == str(product_id):
+            return {**product, 'desc': f'{product["title"]} description'}
+    return None
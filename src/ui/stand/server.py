@@ -0,0 +1,193 @@
+import json
+import threading
+import time
+import uuid
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.ui.helper.urls import (
+    ADD_TO_CART_ENDPOINT,
+    BYCAT_ENDPOINT,
+    DELETE_CART_ENDPOINT,
+    DELETE_ITEM_ENDPOINT,
+    ENTRIES_ENDPOINT,
+    VIEW_ENDPOINT,
+    VIEWCART_ENDPOINT,
+)
+from src.ui.stand.catalog import ENTRIES_PAGE_SIZE, PRODUCTS, get_product
+
+STATIC_DIR = Path(__file__).parent / 'static'
+
+STATIC_FILES = {
+    '/': ('index.html', 'text/html; charset=utf-8'),
+    '/index.html': ('index.html', 'text/html; charset=utf-8'),
+    '/prod.html': ('prod.html', 'text/html; charset=utf-8'),
+    '/cart.html': ('cart.html', 'text/html; charset=utf-8'),
+    '/app.js': ('app.js', 'text/javascript; charset=utf-8'),
+}
+
+IMAGE_PLACEHOLDER = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+    '<rect width="100" height="100" fill="#ddd"/></svg>'
+)
+
+
+class DemoblazeStand:
+    """Локальный стенд, повторяющий demoblaze.com
+
+    Отдает главную страницу, карточки товаров и корзину с теми же
+    id элементов, что и оригинальный сайт, а также методы API
+    (entries, bycat, view, addtocart, viewcart, deleteitem, deletecart)
+    на том же адресе. Корзины хранятся в памяти процесса.
+    """
+
+    def __init__(self, latency_msec: int = 0, host: str = '127.0.0.1'):
+        """
+        :param latency_msec: искусственная задержка ответов API
+        :param host: адрес, на котором запускается сервер
+        """
+        self.latency_msec = latency_msec
+        self.host = host
+        self.carts = {}
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+        self._api = {
+            ENTRIES_ENDPOINT: self._entries,
+            BYCAT_ENDPOINT: self._bycat,
+            VIEW_ENDPOINT: self._view,
+            ADD_TO_CART_ENDPOINT: self._add_to_cart,
+            VIEWCART_ENDPOINT: self._view_cart,
+            DELETE_ITEM_ENDPOINT: self._delete_item,
+            DELETE_CART_ENDPOINT: self._delete_cart,
+        }
+
+    @property
+    def url(self) -> str:
+        """Адрес запущенного стенда"""
+        if self._server is None:
+            raise RuntimeError('Локальный стенд не запущен')
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> str:
+        """Запуск сервера на свободном порту в фоновом потоке.
+        Возвращает адрес стенда"""
+        self._server = ThreadingHTTPServer((self.host, 0), _StandHandler)
+        self._server.daemon_threads = True
+        self._server.stand = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+        self._thread.start()
+        return self.url
+
+    def stop(self):
+        """Остановка сервера"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def handle_api(self, endpoint: str, payload: dict) -> tuple[int, object]:
+        """Выполнение метода API. Возвращает статус и тело ответа
+
+        :param endpoint: адрес метода (напр. '/viewcart')
+        :param payload: тело запроса
+        """
+        handler = self._api.get(endpoint)
+        if handler is None:
+            return 404, {'errorMessage': f'Unknown endpoint {endpoint}'}
+
+        if self.latency_msec:
+            time.sleep(self.latency_msec / 1000)
+        return 200, handler(payload)
+
+    def is_api(self, endpoint: str) -> bool:
+        """Проверка того, что адрес относится к API"""
+        return endpoint in self._api
+
+    def _entries(self, payload: dict) -> dict:
+        return {'Items': list(PRODUCTS[:ENTRIES_PAGE_SIZE])}
+
+    def _bycat(self, payload: dict) -> dict:
+        category = payload.get('cat')
+        return {
+            'Items': [
+                product for product in PRODUCTS if product['cat'] == category
+            ]
+        }
+
+    def _view(self, payload: dict) -> dict:
+        return get_product(payload.get('id')) or {}
+
+    def _add_to_cart(self, payload: dict) -> dict:
+        item = {
+            'id': payload.get('id') or str(uuid.uuid4()),
+            'cookie': payload.get('cookie'),
+            'prod_id': int(payload.get('prod_id')),
+        }
+        with self._lock:
+            self.carts.setdefault(item['cookie'], []).append(item)
+        return {}
+
+    def _view_cart(self, payload: dict) -> dict:
+        with self._lock:
+            items = list(self.carts.get(payload.get('cookie'), []))
+        return {'Items': items}
+
+    def _delete_item(self, payload: dict) -> str:
+        with self._lock:
+            for items in self.carts.values():
+                items[:] = [
+                    item for item in items if item['id'] != payload.get('id')
+                ]
+        return 'Item deleted.'
+
+    def _delete_cart(self, payload: dict) -> str:
+        with self._lock:
+            self.carts.pop(payload.get('cookie'), None)
+        return f'Item deleted on {date.today()}.'
+
+
+class _StandHandler(BaseHTTPRequestHandler):
+    """Обработчик запросов локального стенда"""
+
+    def do_GET(self):
+        path = self.path.split('?')[0]
+        if self.server.stand.is_api(path):
+            self._send_api(path, {})
+        elif path in STATIC_FILES:
+            file_name, content_type = STATIC_FILES[path]
+            body = (STATIC_DIR / file_name).read_bytes()
+            self._send(200, body, content_type)
+        elif path.startswith('/imgs/'):
+            self._send(200, IMAGE_PLACEHOLDER.encode(), 'image/svg+xml')
+        else:
+            self._send(404, b'Not found', 'text/plain')
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        raw_body = self.rfile.read(length) if length else b''
+        try:
+            payload = json.loads(raw_body or b'{}')
+        except json.JSONDecodeError:
+            self._send(400, b'Invalid JSON', 'text/plain')
+            return
+        self._send_api(self.path.split('?')[0], payload)
+
+    def _send_api(self, path: str, payload: dict):
+        status, body = self.server.stand.handle_api(path, payload)
+        self._send(status, json.dumps(body).encode(), 'application/json')
+
+    def _send(self, status: int, body: bytes, content_type: str):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """Отключение логирования каждого запроса в stderr"""
@@ -0,0 +1,143 @@
+// Логика страниц локального стенда, повторяющая demoblaze.com
+
+function getCookie(name) {
+    const prefix = name + '=';
+    for (const part of document.cookie.split(';')) {
+        const cookie = part.trim();
+        if (cookie.startsWith(prefix)) return cookie.substring(prefix.length);
+    }
+    return '';
+}
+
+function guid() {
+    return crypto.randomUUID();
+}
+
+function ensureUser() {
+    if (!getCookie('user')) document.cookie = 'user=' + guid() + '; path=/';
+}
+
+function cartOwner() {
+    const token = getCookie('tokenp_');
+    return token ? {cookie: token, flag: true}
+                 : {cookie: getCookie('user'), flag: false};
+}
+
+function api(endpoint, payload) {
+    return fetch(endpoint, {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(payload || {}),
+    }).then(response => response.json());
+}
+
+function renderCards(items) {
+    document.getElementById('tbodyid').innerHTML = items.map(item => `
+        <div class="col-lg-4 col-md-6 mb-4">
+            <div class="card h-100">
+                <a href="prod.html?idp_=${item.id}">
+                    <img class="card-img-top img-fluid"
+                         src="imgs/${item.id}.svg" alt="">
+                </a>
+                <div class="card-block">
+                    <h4 class="card-title">
+                        <a href="prod.html?idp_=${item.id}"
+                           class="hrefch">${item.title}</a>
+                    </h4>
+                    <h5>$${item.price}</h5>
+                </div>
+            </div>
+        </div>`).join('');
+}
+
+function loadEntries() {
+    fetch('/entries')
+        .then(response => response.json())
+        .then(data => renderCards(data.Items));
+}
+
+function byCat(category) {
+    api('/bycat', {cat: category}).then(data => renderCards(data.Items));
+}
+
+function loadProduct() {
+    const id = new URLSearchParams(location.search).get('idp_');
+    api('/view', {id: id}).then(product => {
+        document.getElementById('tbodyid').innerHTML = `
+            <h2 class="name">${product.title}</h2>
+            <h3 class="price-container">$${product.price}
+                <small>*includes tax</small></h3>
+            <div id="more-information"><p>${product.desc}</p></div>
+            <a href="#" onclick="addToCart(${product.id}); return false;"
+               class="btn btn-success btn-lg">Add to cart</a>`;
+    });
+}
+
+function addToCart(productId) {
+    const owner = cartOwner();
+    api('/addtocart', {
+        id: guid(),
+        cookie: owner.cookie,
+        prod_id: productId,
+        flag: owner.flag,
+    }).then(() => alert('Product added'));
+}
+
+function showCart() {
+    api('/viewcart', cartOwner())
+        .then(data => Promise.all(data.Items.map(
+            item => api('/view', {id: item.prod_id})
+                .then(product => ({item, product}))
+        )))
+        .then(rows => {
+            let total = 0;
+            document.getElementById('tbodyid').innerHTML = rows.map(
+                ({item, product}) => {
+                    total += product.price;
+                    return `
+                        <tr class="success">
+                            <td><img width="100" height="100"
+                                     src="imgs/${product.id}.svg"></td>
+                            <td>${product.title}</td>
+                            <td>${product.price}</td>
+                            <td><a href="#"
+                                   onclick="deleteItem('${item.id}'); return false;"
+                                   >Delete</a></td>
+                        </tr>`;
+                }).join('');
+            document.getElementById('totalp').textContent =
+                rows.length ? String(total) : '';
+        });
+}
+
+function deleteItem(itemId) {
+    api('/deleteitem', {id: itemId}).then(showCart);
+}
+
+function showOrderModal(visible) {
+    document.getElementById('orderModal').style.display =
+        visible ? 'block' : 'none';
+}
+
+function purchaseOrder() {
+    const name = document.getElementById('name').value;
+    const card = document.getElementById('card').value;
+    if (!name || !card) {
+        alert('Please fill out Name and Creditcard.');
+        return;
+    }
+
+    const today = new Date();
+    const amount = document.getElementById('totalp').textContent || '0';
+    document.getElementById('purchaseAlert').innerHTML = `
+        <div class="sweet-alert">
+            <h2>Thank you for your purchase!</h2>
+            <p class="lead text-muted">Id: ${Date.now() % 10000000}<br>
+                Amount: ${amount} USD<br>Card Number: ${card}<br>
+                Name: ${name}<br>Date: ${today.getDate()}/${
+                today.getMonth() + 1}/${today.getFullYear()}</p>
+            <button class="confirm" onclick="location.href='index.html'"
+                    >OK</button>
+        </div>`;
+    api('/deletecart', {cookie: cartOwner().cookie});
+}
@@ -0,0 +1,43 @@
+import pytest_asyncio
+
+from src.ui.aio.browser.browser_launcher import BrowserLauncher
+from src.ui.aio.pages.base_page import BasePage
+from src.ui.helper.stash_keys import (
+    browser_config_key,
+    should_keep_artifacts,
+)
+from src.ui.helper.stats import add_launcher_stats
+
+
+@pytest_asyncio.fixture(scope='session', loop_scope='session')
+async def async_browser_launcher(request):
+    driver = await BrowserLauncher.start(
+        har_mode=request.config.getoption('har_mode'),
+        config=request.config.stash[browser_config_key],
+    )
+    yield driver
+    add_launcher_stats(
+        request.config,
+        {
+            f'{title} (async)': section
+            for title, section in driver.stats().items()
+        },
+    )
+    await driver.close()
+
+
+@pytest_asyncio.fixture(loop_scope='session')
+async def async_browser(request, async_browser_launcher):
+    test_name = request.node.nodeid
+    new_page = await async_browser_launcher.create_page(test_name=test_name)
+    yield new_page
+    await async_browser_launcher.close_page(
+        new_page,
+        test_name=test_name,
+        keep_trace=should_keep_artifacts(request.node),
+    )
+
+
+@pytest_asyncio.fixture(loop_scope='session')
+async def async_base_page(async_browser):
+    return BasePage(async_browser)
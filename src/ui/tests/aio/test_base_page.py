@@ -0,0 +1,48 @@
+import asyncio
+
+import allure
+import pytest
+
+from src.ui.aio.pages.base_page import BasePage
+
+CATEGORIES_CARDS_AMOUNT = {
+    'navigate_to_phones_section': 7,
+    'navigate_to_laptops_section': 6,
+    'navigate_to_monitors_section': 2,
+}
+
+
+@allure.story('Главная страница (async)')
+@pytest.mark.asyncio(loop_scope='session')
+class TestBasePageAsync:
+
+    @allure.title('Проверка количества товаров на главной странице')
+    async def test_products_amount(self, async_base_page):
+        await async_base_page.open()
+        await async_base_page.assert_categories_presence()
+
+        await async_base_page.navigate_to_phones_section()
+        await async_base_page.assert_number_of_cards(7)
+
+    @allure.title('Одновременная проверка товаров во всех категориях')
+    async def test_products_amount_concurrently(
+        self, request, async_browser_launcher
+    ):
+        async def check_category(navigate: str, number_of_cards: int):
+            test_name = f'{request.node.nodeid}[{navigate}]'
+            page = await async_browser_launcher.create_page(test_name)
+            try:
+                base_page = BasePage(page)
+                await base_page.open()
+                await getattr(base_page, navigate)()
+                await base_page.assert_number_of_cards(number_of_cards)
+            finally:
+                await async_browser_launcher.close_page(page, test_name)
+
+        categories = CATEGORIES_CARDS_AMOUNT.items()
+        await asyncio.gather(
+            *(
+                check_category(navigate, number_of_cards)
+                for navigate, number_of_cards in categories
+            )
+        )
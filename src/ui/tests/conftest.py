@@ -1,22 +1,113 @@
-from pathlib import Path
-
+import allure
 import pytest
 
-from src.ui.browser.browser_launcher import BrowserLauncher
+from src.ui.api.cart_api import CartApi
+from src.ui.browser.engine_matrix import EngineLaunchers
+from src.ui.helper.stash_keys import (
+    browser_config_key,
+    should_keep_artifacts,
+)
+from src.ui.helper.stats import add_launcher_stats
 from src.ui.pages.base_page import BasePage
 from src.ui.pages.cart_page import CartPage
 from src.ui.pages.order_page import OrderPage
 from src.ui.pages.product_page import ProductPage
+from src.ui.stand.server import DemoblazeStand
+
+
+@pytest.fixture(scope='session', autouse=True)
+def local_stand(request):
+    if not request.config.getoption('local_stand'):
+        yield None
+        return
+
+    stand = DemoblazeStand(
+        latency_msec=request.config.getoption('stand_latency_ms')
+    )
+    stand_url = stand.start()
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv('BASE_URL', stand_url)
+        monkeypatch.setenv('API_URL', stand_url)
+        yield stand
+    stand.stop()
+
+
+def pytest_generate_tests(metafunc):
+    # В матричном режиме каждый тест с браузером запускается на каждом
+    # движке; тесты разных движков идут вперемешку
+    engines = metafunc.config.stash[browser_config_key].engines
+    if not engines or 'browser' not in metafunc.fixturenames:
+        return
+
+    skipped = _skipped_engines(metafunc.definition)
+    metafunc.parametrize(
+        'engine',
+        [
+            pytest.param(
+                engine,
+                marks=pytest.mark.skip(reason=skipped[engine]),
+            )
+            if engine in skipped
+            else engine
+            for engine in engines
+        ],
+        indirect=True,
+    )
+
+
+def _skipped_engines(node) -> dict:
+    """Движки, исключенные маркером skip_engine, и причины пропуска"""
+    skipped = {}
+    for marker in node.iter_markers('skip_engine'):
+        reason = marker.kwargs.get('reason') or 'Тест не поддерживает движок'
+        for engine in marker.args:
+            skipped[engine] = f'{reason}: {engine}'
+    return skipped
 
-CONFIG_PATH = Path(__file__).parent.parent / 'config_browser.yaml'
+
+@pytest.fixture(scope='session')
+def browser_launchers(request):
+    launchers = EngineLaunchers(
+        request.config.stash[browser_config_key],
+        har_mode=request.config.getoption('har_mode'),
+    )
+    yield launchers
+    add_launcher_stats(request.config, launchers.stats())
+    launchers.close()
+
+
+@pytest.fixture(scope='session')
+def browser_launcher(browser_launchers):
+    return browser_launchers.get()
 
 
 @pytest.fixture()
-def browser():
-    driver = BrowserLauncher(str(CONFIG_PATH))
-    new_page = driver.create_page()
+def engine(request):
+    config = request.config.stash[browser_config_key]
+    engine = getattr(request, 'param', config.browser_type)
+    skipped = _skipped_engines(request.node)
+    if engine in skipped:
+        pytest.skip(skipped[engine])
+    return engine
+
+
+@pytest.fixture()
+def browser(request, browser_launchers, engine):
+    allure.dynamic.tag(engine)
+    allure.dynamic.label('engine', engine)
+    launcher = browser_launchers.get(engine)
+    test_name = request.node.nodeid
+    blocking_marker = request.node.get_closest_marker('blocking_profile')
+    new_page = launcher.create_page(
+        test_name=test_name,
+        blocking_profile=blocking_marker.args[0] if blocking_marker else None,
+    )
     yield new_page
-    driver.close()
+    launcher.close_page(
+        new_page,
+        test_name=test_name,
+        keep_trace=should_keep_artifacts(request.node),
+    )
 
 
 @pytest.fixture
@@ -37,3 +128,10 @@ def product_page(browser):
 @pytest.fixture
 def order_page(browser):
     return OrderPage(browser)
+
+
+@pytest.fixture
+def cart_api(browser):
+    api = CartApi(browser)
+    yield api
+    api.clear()
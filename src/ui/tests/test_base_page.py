@@ -1,4 +1,5 @@
 import allure
+import pytest
 
 
 @allure.story('Главная страница')
@@ -33,3 +34,10 @@ class TestBasePage:
     def test_navigation_to_cart(self, base_page):
         base_page.open()
         base_page.navigate_to_cart()
+
+    @allure.title('Проверка скорости загрузки Главной страницы')
+    @pytest.mark.perf
+    @pytest.mark.skip_engine('webkit', reason='webkit не поддерживает LCP')
+    def test_home_page_load_metrics(self, base_page):
+        base_page.open()
+        base_page.assert_page_load_metrics(lcp_ms=2500)
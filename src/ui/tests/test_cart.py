@@ -21,3 +21,13 @@ class TestCartPage:
         cart_page.verify_product_added(product_name, product_price, 1)
         cart_page.delete_product()
         cart_page.verify_product_removed(product_name, product_price)
+
+    @allure.title('Проверка удаления товаров, добавленных через API')
+    def test_remove_seeded_items(self, cart_api, cart_page):
+        cart_api.add_products(1, 3)
+        cart_page.open()
+        cart_page.wait_for_cart_ready(2)
+
+        cart_page.delete_product()
+        cart_page.delete_product()
+        cart_page.verify_cart_is_empty()
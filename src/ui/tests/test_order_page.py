@@ -5,12 +5,10 @@ import allure
 class TestOrderPage:
 
     @allure.title('Проверка оформления товара')
-    def test_place_order(self, base_page, product_page, cart_page, order_page):
-        base_page.open()
-        base_page.navigate_to_certain_product_card_page(3)
-
-        product_page.add_product_to_cart()
-        product_page.navigate_to_cart()
+    def test_place_order(self, cart_api, cart_page, order_page):
+        cart_api.add_products(3)
+        cart_page.open()
+        cart_page.wait_for_cart_ready(1)
 
         cart_page.click_place_order_button()
 
@@ -0,0 +1,58 @@
+import allure_commons
+import pytest
+
+from src.ui.browser.artifacts import ArtifactWriter
+
+
+@pytest.fixture
+def writer():
+    writer = ArtifactWriter()
+    yield writer
+    writer.close()
+
+
+def run_in_test(monkeypatch, nodeid: str):
+    monkeypatch.setenv('PYTEST_CURRENT_TEST', f'{nodeid} (call)')
+
+
+class TestArtifactWriter:
+
+    def test_same_screenshot_is_attached_once_per_test(
+        self, writer, monkeypatch
+    ):
+        run_in_test(monkeypatch, 'test_a')
+
+        writer.save_image(b'screenshot', 'Скриншот')
+        writer.save_image(b'screenshot', 'Скриншот')
+
+        assert writer.duplicates == 1
+
+    def test_attached_keys_are_cleared_for_next_test(
+        self, writer, monkeypatch
+    ):
+        run_in_test(monkeypatch, 'test_a')
+        writer.save_image(b'first', 'Скриншот')
+        writer.save_image(b'second', 'Скриншот')
+
+        run_in_test(monkeypatch, 'test_b')
+        writer.save_image(b'first', 'Скриншот')
+
+        assert writer.duplicates == 0
+        assert len(writer._attached) == 1
+
+    def test_path_is_written(self, writer, tmp_path):
+        path = tmp_path / 'screens' / 'page.png'
+
+        writer.save_image(b'screenshot', 'Скриншот', path=str(path))
+        writer.flush()
+
+        assert path.read_bytes() == b'screenshot'
+
+    def test_close_unregisters_allure_plugin(self):
+        writer = ArtifactWriter()
+        plugin = writer._reservations
+        assert allure_commons.plugin_manager.is_registered(plugin)
+
+        writer.close()
+
+        assert not allure_commons.plugin_manager.is_registered(plugin)
@@ -0,0 +1,100 @@
+import pytest
+import yaml
+
+from src.ui.browser.config import get_overrides, load_browser_config
+
+BASE_CONFIG = {
+    'browserType': 'chromium',
+    'launch': {'headless': False, 'args': ['--lang=en-US']},
+    'launchProfiles': {'ci': {'headless': True, 'args': ['--no-first-run']}},
+    'context': {'no_viewport': True},
+}
+
+
+@pytest.fixture
+def write_config(tmp_path):
+    def write(**sections):
+        path = tmp_path / f'config_{len(list(tmp_path.iterdir()))}.yaml'
+        path.write_text(yaml.safe_dump({**BASE_CONFIG, **sections}))
+        return path
+
+    return write
+
+
+class TestConfigValidation:
+
+    @pytest.mark.parametrize(
+        'sections, message',
+        [
+            ({'browserType': 'opera'}, 'browserType'),
+            ({'unknownKey': 1}, 'unknownKey: неизвестный ключ'),
+            ({'maxLivePages': -1}, 'maxLivePages'),
+            ({'reuseBrowser': 'yes'}, 'reuseBrowser: ожидается bool'),
+            ({'har': {'mode': 'replay-all'}}, 'har.mode'),
+            ({'tracing': {'maxTotalMb': True}}, 'tracing.maxTotalMb'),
+            ({'engines': ['chromium', 'edge']}, 'engines'),
+            ({'launchProfile': 'missing'}, 'launchProfile'),
+            ({'artifacts': {'imageFormat': 'gif'}}, 'artifacts.imageFormat'),
+        ],
+    )
+    def test_invalid_values(self, write_config, sections, message):
+        with pytest.raises(ValueError, match=message):
+            load_browser_config(write_config(**sections))
+
+    @pytest.mark.parametrize(
+        'overrides, message',
+        [
+            ({'headless': 'maybe'}, 'headless'),
+            ({'slow_mo': '-5'}, 'slow_mo'),
+            ({'viewport': '1280'}, 'viewport'),
+            ({'browser_type': 'opera'}, 'browser_type'),
+            ({'launch_profile': 'missing'}, 'launch_profile'),
+        ],
+    )
+    def test_invalid_overrides(self, write_config, overrides, message):
+        with pytest.raises(ValueError, match=message):
+            load_browser_config(write_config(), **overrides)
+
+    def test_config_is_immutable(self, write_config):
+        config = load_browser_config(write_config())
+        with pytest.raises(TypeError):
+            config.launch['headless'] = True
+        config.launch_options()['headless'] = True
+        assert config.launch['headless'] is False
+
+
+class TestOverridePrecedence:
+
+    def test_cli_option_wins_over_env(self):
+        overrides = get_overrides(
+            {'headless': 'false', 'browser_type': None},
+            environ={'BROWSER_HEADLESS': 'true', 'BROWSER_TYPE': 'firefox'},
+        )
+        assert overrides == {'headless': 'false', 'browser_type': 'firefox'}
+
+    def test_empty_env_is_ignored(self):
+        assert get_overrides({}, environ={'BROWSER_HEADLESS': ''}) == {}
+
+    def test_override_wins_over_yaml(self, write_config):
+        config = load_browser_config(
+            write_config(),
+            headless='true',
+            browser_type='firefox',
+            viewport='1280x720',
+        )
+        assert config.browser_type == 'firefox'
+        assert config.launch['headless'] is True
+        assert config.context_options() == {
+            'viewport': {'width': 1280, 'height': 720}
+        }
+
+    def test_override_wins_over_launch_profile(self, write_config):
+        config = load_browser_config(
+            write_config(launchProfile='ci'), headless='false'
+        )
+        assert config.launch['headless'] is False
+        assert config.launch['args'] == ('--lang=en-US', '--no-first-run')
+
+    def test_none_keeps_yaml_value(self, write_config):
+        config = load_browser_config(write_config(), headless=None)
+        assert config.launch['headless'] is False
@@ -0,0 +1,121 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.ui.aio.browser.context_pool import ContextPool
+from src.ui.browser.page_slots import PageSlots
+
+
+class FakePage:
+
+    def __init__(self):
+        self.closed = False
+        self.context = SimpleNamespace(browser=None, close=self.close)
+
+    async def close(self):
+        self.closed = True
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+
+class SlotPages:
+    """Создание страниц с занятием слота, как в async BrowserLauncher"""
+
+    def __init__(self, slots: PageSlots):
+        self.slots = slots
+        self.held = {}
+
+    async def create(self, wait: bool = True):
+        await asyncio.sleep(0)
+        if wait:
+            slot = await self.slots.acquire_async()
+        else:
+            slot = self.slots.try_acquire()
+        if slot is None:
+            return None
+        page = FakePage()
+        self.held[page] = slot
+        return page
+
+    def release(self, page):
+        slot = self.held.pop(page, None)
+        if slot is not None:
+            self.slots.release(slot)
+
+
+def make_pool(tmp_path, limit: int, size: int):
+    pages = SlotPages(PageSlots(limit, slots_dir=tmp_path, timeout_sec=1))
+    return ContextPool(pages.create, size, pages.release), pages
+
+
+async def settle():
+    """Передача управления фоновому пополнению пула"""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+class TestContextPool:
+
+    async def test_pool_is_filled_in_background(self, tmp_path):
+        pool, pages = make_pool(tmp_path, limit=3, size=2)
+
+        pool.start()
+        assert pages.held == {}
+        await settle()
+
+        assert len(pages.held) == 2
+        assert await pool.acquire() in pages.held
+        await settle()
+        assert len(pages.held) == 3
+        assert pool.stats['hits'] == 1
+        await pool.close()
+
+    async def test_miss_waits_for_background_page(self, tmp_path):
+        pool, pages = make_pool(tmp_path, limit=3, size=1)
+        pool.start()
+
+        first, second = await asyncio.gather(pool.acquire(), pool.acquire())
+
+        assert first is not second
+        assert pool.stats['misses'] >= 1
+        await pool.close()
+
+    async def test_refill_waits_for_free_slot(self, tmp_path):
+        pool, pages = make_pool(tmp_path, limit=1, size=1)
+        pool.start()
+        page = await pool.acquire()
+        await settle()
+        assert list(pages.held) == [page]
+
+        pages.release(page)
+        pool.wake()
+        await settle()
+
+        assert len(pages.held) == 1
+        assert page not in pages.held
+        await pool.close()
+
+    async def test_close_releases_slots(self, tmp_path):
+        pool, pages = make_pool(tmp_path, limit=2, size=2)
+        pool.start()
+        await settle()
+
+        await pool.close()
+
+        assert pages.held == {}
+        assert pages.slots.try_acquire() is not None
+
+    async def test_dead_pages_release_slots(self, tmp_path):
+        pool, pages = make_pool(tmp_path, limit=1, size=1)
+        pool.start()
+        await settle()
+        next(iter(pages.held)).closed = True
+
+        page = await pool.acquire()
+
+        assert pool.stats['misses'] == 1
+        assert list(pages.held) == [page]
+        await pool.close()
@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+import time
+
+from src.ui.browser import daemon
+from src.ui.browser.daemon import DEFAULT_STATE_DIR, BrowserDaemon
+
+
+class FakeDaemon(BrowserDaemon):
+    """Демон, который вместо запуска браузера пишет файл состояния"""
+
+    spawned = []
+
+    def _spawn(self, launch_options: dict):
+        time.sleep(0.2)
+        self.spawned.append(launch_options)
+        self.state_file.write_text(
+            json.dumps(
+                {
+                    'pid': os.getpid(),
+                    'endpoint': f'http://127.0.0.1/{len(self.spawned)}',
+                    'fingerprint': daemon._fingerprint(launch_options),
+                }
+            )
+        )
+
+
+def make_daemon(monkeypatch) -> type[FakeDaemon]:
+    monkeypatch.setattr(FakeDaemon, 'spawned', [])
+    monkeypatch.setattr(
+        daemon, '_is_alive', lambda state: state['pid'] == os.getpid()
+    )
+    return FakeDaemon
+
+
+class TestBrowserDaemon:
+
+    def test_state_dir_is_per_user_and_project(self):
+        assert DEFAULT_STATE_DIR.parent.name.startswith('playwright_daemon-')
+        assert DEFAULT_STATE_DIR.parent.name != 'playwright_daemon-'
+
+    def test_parallel_workers_spawn_one_daemon(self, tmp_path, monkeypatch):
+        daemon_class = make_daemon(monkeypatch)
+        endpoints = []
+
+        def connect():
+            client = daemon_class(state_dir=tmp_path)
+            endpoints.append(client.ensure_running({'headless': True}))
+
+        workers = [threading.Thread(target=connect) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert len(daemon_class.spawned) == 1
+        assert set(endpoints) == {'http://127.0.0.1/1'}
+
+    def test_other_options_do_not_stop_daemon(self, tmp_path, monkeypatch):
+        daemon_class = make_daemon(monkeypatch)
+        killed = []
+        monkeypatch.setattr(os, 'kill', lambda *args: killed.append(args))
+        client = daemon_class(state_dir=tmp_path)
+
+        first = client.ensure_running({'headless': True})
+        second = client.ensure_running({'headless': False})
+
+        assert first != second
+        assert killed == []
+        assert len(list(tmp_path.glob('*.json'))) == 2
+        assert client.ensure_running({'headless': True}) == first
+
+    def test_stop_removes_all_states(self, tmp_path, monkeypatch):
+        daemon_class = make_daemon(monkeypatch)
+        killed = []
+        monkeypatch.setattr(os, 'kill', lambda *args: killed.append(args))
+        client = daemon_class(state_dir=tmp_path)
+        client.ensure_running({'headless': True})
+        client.ensure_running({'headless': False})
+
+        client.stop()
+
+        assert len(killed) == 2
+        assert list(tmp_path.glob('*.json')) == []
@@ -0,0 +1,181 @@
+import argparse
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from src.ui.helper.durations import (
+    DEFAULT_ESTIMATE_SEC,
+    MAX_RUNS_WITHOUT_SAMPLE,
+    DurationHistory,
+    lpt_assign,
+    parse_shard,
+)
+from src.ui.helper.lpt_scheduling import LptScheduling
+
+DURATIONS = {'a': 8.0, 'b': 7.0, 'c': 6.0, 'd': 5.0, 'e': 4.0, 'f': 3.0}
+
+
+def make_history(tmp_path, durations: dict) -> DurationHistory:
+    history = DurationHistory(tmp_path / 'durations.json')
+    history.update(durations)
+    return history
+
+
+def group_loads(groups: list[list[str]], durations: dict) -> list[float]:
+    return [sum(durations[nodeid] for nodeid in group) for group in groups]
+
+
+class TestLptAssign:
+
+    def test_longest_tests_go_to_different_groups(self):
+        groups = lpt_assign(list(DURATIONS), DURATIONS.get, 3)
+
+        assert [group[0] for group in groups] == ['a', 'b', 'c']
+
+    def test_groups_are_balanced(self):
+        groups = lpt_assign(list(DURATIONS), DURATIONS.get, 2)
+
+        loads = group_loads(groups, DURATIONS)
+        assert sorted(loads) == [16.0, 17.0]
+
+    def test_assignment_does_not_depend_on_input_order(self):
+        durations = {'x': 1.0, 'y': 1.0, 'z': 1.0, 'w': 1.0}
+
+        groups = lpt_assign(['z', 'y', 'x', 'w'], durations.get, 2)
+
+        assert groups == lpt_assign(sorted(durations), durations.get, 2)
+
+    def test_every_test_is_assigned_once(self):
+        groups = lpt_assign(list(DURATIONS), DURATIONS.get, 4)
+
+        assigned = [nodeid for group in groups for nodeid in group]
+        assert sorted(assigned) == sorted(DURATIONS)
+
+    def test_more_groups_than_tests(self):
+        groups = lpt_assign(['a'], DURATIONS.get, 3)
+
+        assert groups == [['a'], [], []]
+
+    def test_shards_cover_all_tests_with_balanced_load(self, tmp_path):
+        history = make_history(tmp_path, DURATIONS)
+        nodeids = [*DURATIONS, 'new_test']
+
+        shards = lpt_assign(nodeids, history.estimate, 3)
+
+        loads = [
+            sum(history.estimate(nodeid) for nodeid in shard)
+            for shard in shards
+        ]
+        assert sorted(n for shard in shards for n in shard) == sorted(nodeids)
+        assert max(loads) - min(loads) <= max(DURATIONS.values())
+
+
+class TestDurationHistory:
+
+    def test_missing_file_uses_default_estimate(self, tmp_path):
+        history = DurationHistory(tmp_path / 'missing.json')
+
+        assert history.tests == {}
+        assert history.estimate('test') == DEFAULT_ESTIMATE_SEC
+
+    def test_broken_file_is_ignored(self, tmp_path):
+        path = tmp_path / 'durations.json'
+        path.write_text('{not json')
+
+        assert DurationHistory(path).estimate('test') == DEFAULT_ESTIMATE_SEC
+
+    def test_unknown_test_gets_median(self, tmp_path):
+        history = make_history(tmp_path, {'a': 1.0, 'b': 2.0, 'c': 9.0})
+
+        assert history.estimate('new_test') == 2.0
+
+    def test_update_smooths_duration(self, tmp_path):
+        history = make_history(tmp_path, {'a': 10.0})
+
+        history.update({'a': 20.0})
+
+        assert history.estimate('a') == pytest.approx(13.0)
+
+    def test_stale_tests_are_removed(self, tmp_path):
+        history = make_history(tmp_path, {'old': 1.0})
+
+        for _ in range(MAX_RUNS_WITHOUT_SAMPLE):
+            history.update({'new': 1.0})
+
+        assert 'old' not in history.tests
+        assert 'new' in history.tests
+
+    def test_save_and_load(self, tmp_path):
+        history = make_history(tmp_path, {'a': 1.5})
+        history.save()
+
+        loaded = DurationHistory(history.path)
+
+        assert loaded.run == 1
+        assert loaded.estimate('a') == 1.5
+        assert json.loads(history.path.read_text())['run'] == 1
+
+
+class TestParseShard:
+
+    def test_valid(self):
+        assert parse_shard('2/4') == (2, 4)
+
+    @pytest.mark.parametrize('value', ['2', 'a/b', '0/3', '4/3'])
+    def test_invalid(self, value):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_shard(value)
+
+
+class FakeNode:
+
+    def __init__(self, gateway_id: str):
+        self.gateway = SimpleNamespace(id=gateway_id)
+        self.sent = []
+        self.is_shut_down = False
+
+    def send_runtest_some(self, indexes):
+        self.sent.extend(indexes)
+
+    def shutdown(self):
+        self.is_shut_down = True
+
+
+class FakeConfig:
+
+    def __init__(self, workers: int):
+        self.workers = workers
+
+    def getvalue(self, name):
+        return [f'{self.workers}*popen']
+
+    def getoption(self, name):
+        return None
+
+
+class TestLptScheduling:
+
+    def make_scheduler(self, tmp_path, workers: int):
+        history = make_history(tmp_path, DURATIONS)
+        scheduler = LptScheduling(FakeConfig(workers), history=history)
+        nodes = [FakeNode(f'gw{index}') for index in range(workers)]
+        for node in nodes:
+            scheduler.add_node(node)
+            scheduler.add_node_collection(node, list(DURATIONS))
+        return scheduler, nodes
+
+    def test_nodes_get_lpt_groups_in_collection_order(self, tmp_path):
+        scheduler, nodes = self.make_scheduler(tmp_path, 2)
+
+        scheduler.schedule()
+
+        collection = list(DURATIONS)
+        groups = [[collection[i] for i in node.sent] for node in nodes]
+        assert sorted(group_loads(groups, DURATIONS)) == [16.0, 17.0]
+        for node in nodes:
+            assert node.sent == sorted(node.sent)
+            assert node.is_shut_down
+        assert sorted(i for node in nodes for i in node.sent) == list(
+            range(len(collection))
+        )
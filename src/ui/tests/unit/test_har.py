@@ -0,0 +1,127 @@
+import base64
+from pathlib import Path
+from types import SimpleNamespace
+
+from src.ui.browser.har import (
+    HarArchive,
+    HarManager,
+    HarReplayer,
+    merge_shared_archive,
+    read_entries,
+    write_archive,
+)
+
+
+def make_entry(url, body='ok', method='GET', post_data=None, started=''):
+    request = {'method': method, 'url': url}
+    if post_data is not None:
+        request['postData'] = {'text': post_data}
+    return {
+        'startedDateTime': started,
+        'request': request,
+        'response': {
+            'status': 200,
+            'headers': [
+                {'name': 'Content-Type', 'value': 'text/plain'},
+                {'name': 'Content-Encoding', 'value': 'gzip'},
+            ],
+            'content': {'text': body},
+        },
+    }
+
+
+def make_request(url, method='GET', post_data=None):
+    return SimpleNamespace(method=method, url=url, post_data=post_data)
+
+
+class TestHarArchive:
+
+    def test_find_by_method_and_url(self):
+        archive = HarArchive(
+            [
+                make_entry('https://a/1'),
+                make_entry('https://a/1', 'post', 'POST'),
+            ]
+        )
+        key, entries = archive.find('POST', 'https://a/1')
+        assert key == ('POST', 'https://a/1', None)
+        assert entries[0]['response']['content']['text'] == 'post'
+        assert archive.find('GET', 'https://a/2') is None
+
+    def test_find_by_post_data(self):
+        archive = HarArchive(
+            [
+                make_entry('https://a/bycat', 'phones', 'POST', '{"cat":1}'),
+                make_entry('https://a/bycat', 'laptops', 'POST', '{"cat":2}'),
+            ]
+        )
+        _, entries = archive.find('POST', 'https://a/bycat', '{"cat":2}')
+        assert entries[0]['response']['content']['text'] == 'laptops'
+
+    def test_unknown_post_data_falls_back_to_first_group(self):
+        archive = HarArchive(
+            [make_entry('https://a/bycat', 'phones', 'POST', '{"cat":1}')]
+        )
+        _, entries = archive.find('POST', 'https://a/bycat', '{"cat":9}')
+        assert entries[0]['response']['content']['text'] == 'phones'
+
+
+class TestHarReplayer:
+
+    def test_responses_in_recorded_order_then_last_repeats(self):
+        replayer = HarReplayer(
+            HarArchive(
+                [make_entry('https://a/1', 'first'), make_entry('https://a/1')]
+            )
+        )
+        bodies = [
+            replayer._next_response(make_request('https://a/1'))['body']
+            for _ in range(3)
+        ]
+        assert bodies == [b'first', b'ok', b'ok']
+
+    def test_skips_encoding_headers_and_decodes_base64(self):
+        entry = make_entry('https://a/img')
+        entry['response']['content'] = {
+            'text': base64.b64encode(b'\x89PNG').decode(),
+            'encoding': 'base64',
+        }
+        replayer = HarReplayer(HarArchive([entry]))
+        response = replayer._next_response(make_request('https://a/img'))
+        assert response['headers'] == {'Content-Type': 'text/plain'}
+        assert response['body'] == b'\x89PNG'
+
+    def test_unknown_request(self):
+        replayer = HarReplayer(HarArchive([]))
+        assert replayer._next_response(make_request('https://a/1')) is None
+
+
+class TestSharedArchive:
+
+    def test_managers_do_not_remove_each_other_recordings(self, tmp_path):
+        first = HarManager('record', tmp_path)
+        second = HarManager('record', tmp_path)
+        first_path = first.context_params()['record_har_path']
+        second_path = second.context_params()['record_har_path']
+        for path, url in ((first_path, 'https://a/1'), (second_path, 'b')):
+            write_archive(Path(path), [make_entry(url)])
+        first._recordings['context'] = Path(first_path)
+        first.collect('context')
+        first.close()
+
+        assert (Path(second_path)).exists()
+
+    def test_parts_of_all_managers_are_merged(self, tmp_path):
+        for url, started in (('https://a/2', '2'), ('https://a/1', '1')):
+            manager = HarManager('record', tmp_path)
+            path = manager.context_params()['record_har_path']
+            write_archive(Path(path), [make_entry(url, started=started)])
+            manager._recordings['context'] = Path(path)
+            manager.collect('context')
+            manager.close()
+
+        archive_path = merge_shared_archive(tmp_path)
+        entries = read_entries(archive_path)
+        urls = [entry['request']['url'] for entry in entries]
+        assert urls == ['https://a/1', 'https://a/2']
+        assert merge_shared_archive(tmp_path) is None
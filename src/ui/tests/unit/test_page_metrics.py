@@ -0,0 +1,79 @@
+import json
+
+import pytest
+
+from src.ui.helper.page_metrics import PageMetrics, check_thresholds
+
+METRICS = {'lcp_ms': 1800.0, 'cls': 0.05, 'fcp_ms': None}
+
+
+class TestCheckThresholds:
+
+    def test_metrics_below_limits(self):
+        assert check_thresholds(METRICS, {'lcp_ms': 2500, 'cls': 0.1}) == []
+
+    def test_metric_at_limit_is_violation(self):
+        violations = check_thresholds(METRICS, {'lcp_ms': 1800})
+
+        assert violations == ['lcp_ms = 1800.000, порог 1800']
+
+    def test_missing_metric_is_violation(self):
+        assert check_thresholds(METRICS, {'fcp_ms': 1000}) == [
+            'fcp_ms не измерена'
+        ]
+        assert check_thresholds({}, {'ttfb_ms': 800}) == [
+            'ttfb_ms не измерена'
+        ]
+
+    def test_all_violations_are_reported(self):
+        violations = check_thresholds(METRICS, {'lcp_ms': 1000, 'cls': 0.01})
+
+        assert len(violations) == 2
+
+    def test_unknown_metric(self):
+        with pytest.raises(ValueError, match='lcp'):
+            check_thresholds(METRICS, {'lcp': 2500})
+
+
+class TestPageMetrics:
+
+    def test_summary_uses_medians_and_skips_missing(self):
+        page_metrics = PageMetrics()
+        for lcp_ms in (100.0, 300.0, None):
+            page_metrics.records.append(
+                {
+                    'name': 'home',
+                    'duration_ms': 10.0,
+                    'lcp_ms': lcp_ms,
+                    'cls': None,
+                    'transfer_bytes': 1024,
+                }
+            )
+
+        summary = page_metrics.summary()['home']
+
+        assert summary['count'] == 3
+        assert summary['lcp_ms'] == 200.0
+        assert summary['cls'] is None
+
+    def test_write_json_and_csv(self, tmp_path):
+        page_metrics = PageMetrics()
+        page_metrics.merge(
+            [
+                {
+                    'test': 'test_home',
+                    'name': 'home',
+                    'url': '/',
+                    'duration_ms': 2.0,
+                    'lcp_ms': 1.0,
+                    'cls': 0.0,
+                    'transfer_bytes': 3,
+                }
+            ]
+        )
+        path = tmp_path / 'metrics.json'
+
+        page_metrics.write(path)
+
+        assert json.loads(path.read_text())['pages']['home']['count'] == 1
+        assert path.with_suffix('.csv').read_text().startswith('test,name')
@@ -0,0 +1,99 @@
+import inspect
+from types import SimpleNamespace
+
+import pytest
+
+from src.ui.aio.browser.browser import Browser as AsyncBrowser
+from src.ui.aio.page_elements.button import Button as AsyncButton
+from src.ui.aio.pages.cart_page import CartPage as AsyncCartPage
+from src.ui.aio.pages.order_page import OrderPage as AsyncOrderPage
+from src.ui.page_elements.button import Button
+from src.ui.pages.cart_page import CartPage
+from src.ui.pages.cart_snapshot import CartRow, CartSnapshot
+from src.ui.pages.order_page import OrderPage
+from src.ui.pages.product_page import ProductPage
+
+BASE_URL = 'http://localhost:8000'
+
+
+@pytest.fixture(autouse=True)
+def base_url(monkeypatch):
+    monkeypatch.setenv('BASE_URL', BASE_URL)
+
+
+def make_page(url=BASE_URL):
+    return SimpleNamespace(url=url)
+
+
+def make_cart(*rows, total=''):
+    return CartSnapshot(
+        rows=tuple(CartRow(title, price, None, None) for title, price in rows),
+        total=total,
+    )
+
+
+class TestSharedDeclarations:
+
+    def test_sync_page_keeps_declared_elements(self):
+        page = CartPage(make_page())
+
+        assert type(page.delete_button) is Button
+        assert page.url == BASE_URL + '/cart.html'
+
+    def test_async_page_gets_async_elements(self):
+        page = AsyncCartPage(make_page())
+
+        assert type(page.delete_button) is AsyncButton
+        assert isinstance(page.browser, AsyncBrowser)
+        assert page.url == BASE_URL + '/cart.html'
+        assert page.delete_button.selector == (
+            CartPage.delete_button.selector
+        )
+
+    def test_async_form_fields_are_coroutines(self):
+        page = AsyncOrderPage(make_page())
+
+        for field in page._generate_order_form():
+            assert inspect.iscoroutinefunction(field.fill)
+
+    def test_explicit_url(self):
+        assert CartPage(make_page(), url='http://stand').url == 'http://stand'
+
+
+class TestPageHelpers:
+
+    def test_parse_price(self):
+        assert ProductPage._parse_price('$360 *includes tax') == '360'
+
+    def test_customer_name(self):
+        info = 'Id: 1\nAmount: 360 USD\nName: Ann Lee\nDate: 1/1/2026'
+
+        OrderPage._assert_customer_name(info, 'Ann Lee')
+        with pytest.raises(AssertionError):
+            OrderPage._assert_customer_name(info, 'Bob')
+
+    def test_url_ends_with(self):
+        page = CartPage(make_page(BASE_URL + '/cart.html'))
+
+        page._assert_url_ends_with('/cart.html')
+        with pytest.raises(AssertionError):
+            page._assert_url_ends_with('/index.html')
+
+
+class TestCartSnapshotAssertions:
+
+    def test_product_added(self):
+        cart = make_cart(('Nokia', '820'), total='820')
+
+        cart.assert_product_added('Nokia', '820', 1)
+        with pytest.raises(AssertionError, match='не найден'):
+            cart.assert_product_added('Nokia', '360', 1)
+        with pytest.raises(AssertionError, match='Количество'):
+            cart.assert_product_added('Nokia', '820', 2)
+
+    def test_product_removed(self):
+        make_cart().assert_product_removed('Nokia', '820')
+        with pytest.raises(AssertionError, match='все еще'):
+            make_cart(('Nokia', '820')).assert_product_removed('Nokia', '820')
+        with pytest.raises(AssertionError, match='не пуста'):
+            make_cart(('Sony', '790')).assert_product_removed('Nokia', '820')
@@ -0,0 +1,100 @@
+from contextlib import nullcontext
+
+import allure
+import pytest
+
+from src.ui.helper import steps
+from src.ui.helper.step_timings import (
+    disable_step_timings,
+    enable_step_timings,
+)
+from src.ui.helper.steps import get_step_mode, set_step_mode, step
+
+
+class Unformattable:
+
+    def __format__(self, spec):
+        raise AssertionError('Название шага не должно собираться')
+
+
+@pytest.fixture
+def reported(monkeypatch):
+    """Названия шагов, добавленных в allure"""
+    titles = []
+
+    def fake_step(title):
+        titles.append(title)
+        return nullcontext()
+
+    monkeypatch.setattr(allure, 'step', fake_step)
+    return titles
+
+
+@pytest.fixture(autouse=True)
+def restore_mode():
+    mode = get_step_mode()
+    yield
+    set_step_mode(mode)
+    disable_step_timings()
+
+
+def run_steps():
+    with step('Клик по "{}"', 'Корзина'):
+        pass
+    with step('Получение текста "{}"', 'Цена', read=True):
+        pass
+
+
+class TestStepModes:
+
+    def test_full_reports_all_steps(self, reported):
+        set_step_mode('full')
+
+        run_steps()
+
+        assert reported == ['Клик по "Корзина"', 'Получение текста "Цена"']
+
+    def test_actions_only_skips_read_steps(self, reported):
+        set_step_mode('actions-only')
+
+        run_steps()
+
+        assert reported == ['Клик по "Корзина"']
+        assert step('{}', Unformattable(), read=True) is steps._NO_STEP
+
+    def test_off_skips_all_steps(self, reported):
+        set_step_mode('off')
+
+        run_steps()
+
+        assert reported == []
+        assert step('{}', Unformattable()) is steps._NO_STEP
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match='Неизвестный режим шагов'):
+            set_step_mode('verbose')
+
+
+class TestStepModesWithTimings:
+
+    @pytest.mark.parametrize(
+        'mode, expected_reported',
+        [
+            ('full', ['Клик по "Корзина"', 'Получение текста "Цена"']),
+            ('actions-only', ['Клик по "Корзина"']),
+            ('off', []),
+        ],
+    )
+    def test_all_steps_are_timed(self, reported, mode, expected_reported):
+        set_step_mode(mode)
+        timings = enable_step_timings()
+
+        run_steps()
+
+        assert reported == expected_reported
+        assert timings.durations.keys() == {'run_steps'}
+        assert len(timings.durations['run_steps']) == 2
+        assert {item['title'] for item in timings.slowest_steps()} == {
+            'Клик по "Корзина"',
+            'Получение текста "Цена"',
+        }